@@ -104,7 +104,7 @@ class ArgumentResolver(Resolver):
 
 	def resolve_args(self, command, player, *args):
 
-		resolved_args = player.get_current_args()
+		resolved_args = list(player.get_current_args())
 		arg_input_offset = len(resolved_args)
 
 		# TODO: fix the flow control here
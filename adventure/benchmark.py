@@ -0,0 +1,210 @@
+from collections import namedtuple
+import json
+import math
+import os
+import tempfile
+import time
+import tracemalloc
+
+from adventure.data_parser import DataParser
+from adventure.file_reader import FileReader
+from adventure.location import Location
+from adventure.world_generator import WorldGenerator
+
+BenchmarkScenario = namedtuple("BenchmarkScenario", "location_id steps")
+Regression = namedtuple("Regression", "size metric baseline current change")
+
+# Times loading and play on generated worlds of several sizes, as flat metric mappings
+class Benchmark:
+
+	FORMAT_VERSION = 1
+	DEFAULT_SIZES = [(100, 1000), (1000, 10000), (10000, 100000)]
+	DEFAULT_SAMPLES = 200
+	DEFAULT_THRESHOLD = 0.1
+	DECODE_REPEATS = 3
+	PERCENTILES = (50, 90, 99)
+
+	DECODE_THROUGHPUT_METRIC = "decode.throughput"
+	PARSE_TIME_METRIC = "parse.seconds"
+	PARSE_PEAK_METRIC = "parse.peak"
+	COMMAND_METRIC_FORMAT = "command.{0}.p{1}"
+	HIGHER_IS_BETTER = {DECODE_THROUGHPUT_METRIC}
+
+	def __init__(self, sizes=DEFAULT_SIZES, samples=DEFAULT_SAMPLES, seed=WorldGenerator.DEFAULT_SEED):
+		self.sizes = sizes
+		self.samples = samples
+		self.seed = seed
+
+
+	def get_size_key(self, location_count, item_count):
+		return "{0}x{1}".format(location_count, item_count)
+
+
+	def run(self):
+		return {
+			"version" : Benchmark.FORMAT_VERSION,
+			"seed" : self.seed,
+			"samples" : self.samples,
+			"sizes" : {self.get_size_key(*size): self.run_size(*size) for size in self.sizes},
+		}
+
+
+	def run_size(self, location_count, item_count):
+		world = WorldGenerator(location_count, item_count, self.seed).generate()
+
+		with tempfile.TemporaryDirectory() as world_dir:
+			filename = os.path.join(world_dir, "game")
+			with open(filename, "wb") as world_file:
+				world_file.write(json.dumps(world).encode().translate(FileReader.FLIPPED_BYTES))
+
+			metrics = {Benchmark.DECODE_THROUGHPUT_METRIC: self.measure_decode(filename)}
+			template, parse_metrics = self.measure_parse(filename)
+
+		metrics.update(parse_metrics)
+		metrics.update(self.measure_commands(template, self.get_scenarios(world)))
+		return metrics
+
+
+	# Bytes decoded per second, from the best of a few reads
+	def measure_decode(self, filename):
+		elapsed = []
+		for _ in range(Benchmark.DECODE_REPEATS):
+			with open(filename, "rb") as input_file:
+				start = time.perf_counter()
+				FileReader(input_file)
+				elapsed.append(time.perf_counter() - start)
+		return os.path.getsize(filename) / min(elapsed)
+
+
+	# Memory is traced in a separate parse, as tracing slows parsing
+	def measure_parse(self, filename):
+		start = time.perf_counter()
+		template = DataParser().parse_template(filename)
+		parse_time = time.perf_counter() - start
+
+		started_tracing = not tracemalloc.is_tracing()
+		if started_tracing:
+			tracemalloc.start()
+		try:
+			tracemalloc.reset_peak()
+			memory_start, _ = tracemalloc.get_traced_memory()
+			DataParser().parse(filename)
+			_, memory_peak = tracemalloc.get_traced_memory()
+		finally:
+			if started_tracing:
+				tracemalloc.stop()
+
+		return template, {
+			Benchmark.PARSE_TIME_METRIC: parse_time,
+			Benchmark.PARSE_PEAK_METRIC: memory_peak - memory_start,
+		}
+
+
+	def measure_commands(self, template, scenarios):
+		elapsed_by_name = {}
+
+		for scenario in scenarios:
+			game = template.spawn()
+			self.move_player(game, scenario.location_id)
+			for _ in range(self.samples):
+				for name, line in scenario.steps:
+					elapsed_by_name.setdefault(name, []).append(self.time_command(game, line))
+
+		metrics = {}
+		for name, elapsed in elapsed_by_name.items():
+			for percentile in Benchmark.PERCENTILES:
+				metrics[Benchmark.COMMAND_METRIC_FORMAT.format(name, percentile)] = self.get_percentile(elapsed, percentile)
+		return metrics
+
+
+	def move_player(self, game, location_id):
+		with game.activate():
+			game.player.location = game.data.get_location(location_id)
+
+
+	def time_command(self, game, line):
+		tokens = line.split()
+		with game.activate():
+			start = time.perf_counter()
+			game.token_processor.process_tokens(game.player, tokens)
+			return time.perf_counter() - start
+
+
+	# Nearest-rank percentile
+	def get_percentile(self, values, percentile):
+		ordered = sorted(values)
+		return ordered[max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)]
+
+
+	# Scenarios are taken from lit locations in the generated world
+	def get_scenarios(self, world):
+		lit_location_ids = {location["data_id"] for location in world["locations"]
+			if int(location["attributes"], 16) & Location.ATTRIBUTE_GIVES_LIGHT}
+		player_location_id = world["players"][0]["location_id"]
+		scenarios = [BenchmarkScenario(player_location_id, [("look", "look"), ("inventory", "inventory")])]
+
+		for location in world["locations"]:
+			destination_id = location["directions"].get("east")
+			if location["data_id"] in lit_location_ids and destination_id in lit_location_ids:
+				scenarios.append(BenchmarkScenario(location["data_id"], [("go", "east"), ("go", "west")]))
+				break
+
+		items_by_id = {item["data_id"]: item for item in world["items"]}
+		item_location_ids = {item["data_id"]: item["container_ids"][0] for item in world["items"]}
+		get_name = lambda item_id: items_by_id[item_id]["labels"]["shortnames"][0]
+
+		for item in world["items"]:
+			if item["attributes"] == "2" and item_location_ids[item["data_id"]] in lit_location_ids:
+				name = get_name(item["data_id"])
+				scenarios.append(BenchmarkScenario(item_location_ids[item["data_id"]],
+					[("take", "take " + name), ("drop", "drop " + name)]))
+				break
+
+		for item in world["items"]:
+			container_id = item_location_ids[item["data_id"]]
+			if container_id in items_by_id and items_by_id[container_id]["attributes"] == "3" \
+					and item_location_ids[container_id] in lit_location_ids:
+				name, container_name = get_name(item["data_id"]), get_name(container_id)
+				scenarios.append(BenchmarkScenario(item_location_ids[container_id],
+					[("empty", "empty " + container_name), ("insert", "insert {0} into {1}".format(name, container_name))]))
+				break
+
+		for event in world["events"]:
+			location_id = event["match"]["prerequisites"][0]["data_id"]
+			if location_id in lit_location_ids:
+				name = get_name(event["match"]["arguments"][0]["value"])
+				scenarios.append(BenchmarkScenario(location_id, [("rub", "rub " + name)]))
+				break
+
+		return scenarios
+
+
+	def compare(self, baseline, current, threshold=DEFAULT_THRESHOLD):
+		regressions = []
+
+		for size_key, current_metrics in current["sizes"].items():
+			baseline_metrics = baseline["sizes"].get(size_key, {})
+			for metric, value in current_metrics.items():
+				baseline_value = baseline_metrics.get(metric)
+				if not baseline_value:
+					continue
+				change = (value - baseline_value) / baseline_value
+				if metric in Benchmark.HIGHER_IS_BETTER:
+					change = -change
+				if change > threshold:
+					regressions.append(Regression(size=size_key, metric=metric, baseline=baseline_value, current=value, change=change))
+
+		return regressions
+
+
+	def write(self, results, filename):
+		with open(filename, "w") as output_file:
+			json.dump(results, output_file, indent=2, sort_keys=True)
+
+
+	def read(self, filename):
+		with open(filename) as input_file:
+			results = json.load(input_file)
+		if results.get("version") != Benchmark.FORMAT_VERSION:
+			raise ValueError("Unsupported benchmark format version: {0}".format(results.get("version")))
+		return results
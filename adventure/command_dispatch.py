@@ -0,0 +1,33 @@
+# Maps the first token of a line to its command and the offset of that command's first argument
+class CommandDispatch:
+
+	NO_ENTRY = (None, 0)
+
+	def __init__(self, commands_by_name, item_related_commands):
+		self.entries = {}
+
+		for name, command in commands_by_name.items():
+			self.entries[name] = (command, 0 if command.verb_is_first_arg() else 1)
+
+		for name, command in item_related_commands.items():
+			if not name in self.entries:
+				self.entries[name] = (command, 0)
+
+		for prefix, command in self.get_abbreviations(commands_by_name).items():
+			if not prefix in self.entries:
+				self.entries[prefix] = (command, 1)
+
+
+	def get_abbreviations(self, commands_by_name):
+		commands_by_prefix = {}
+		for name, command in commands_by_name.items():
+			if command.is_secret() or command.verb_is_first_arg():
+				continue
+			for length in range(1, len(name)):
+				commands_by_prefix.setdefault(name[:length], set()).add(command)
+
+		return {prefix: commands.pop() for prefix, commands in commands_by_prefix.items() if len(commands) == 1}
+
+
+	def get(self, token):
+		return self.entries.get(token, CommandDispatch.NO_ENTRY)
@@ -2,6 +2,11 @@ from adventure.item import Item
 
 class CommandRunner():
 
+	FREQUENT_TEMPLATE_KEYS = [
+		("confirm_look", "list_location"),
+		("describe_location", "list_location"),
+	]
+
 	def __init__(self, data):
 		self.data = data
 
@@ -25,8 +30,7 @@ class CommandRunner():
 
 
 	def format_response(self, template_keys, tokens):
-		templates = [self.data.get_response(template_key) for template_key in template_keys]
-		template = " ".join(templates)
+		template = self.data.get_response_template(tuple(template_keys))
 		contents = []
 
 		for token in tokens:
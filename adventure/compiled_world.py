@@ -0,0 +1,194 @@
+import json
+import mmap
+import struct
+
+from adventure.string_table import StringTable, StringTableBuilder
+from adventure.token_translator import TokenTranslator
+
+# Prose is kept in a mapped string table, and locations and items in fixed-layout records
+class CompiledWorld:
+
+	MAGIC = b"VDWA"
+	FORMAT_VERSION = 1
+	NO_STRING = 0xFFFFFFFF
+
+	HEADER = struct.Struct("<4sHHIIIIIIII")
+	LOCATION_RECORD = struct.Struct("<iIIIII")
+	ITEM_RECORD = struct.Struct("<iIiIIIII")
+	STRING_LIST_ENTRY = struct.Struct("<I")
+
+	TEXT_SECTIONS = ["hints", "explanations", "responses"]
+
+
+class WorldCompiler:
+
+	def compile(self, content_input):
+		strings = StringTableBuilder()
+		string_lists = []
+		structure = dict(content_input)
+
+		location_records, structure["locations"] = self.compile_locations(content_input["locations"], strings, string_lists)
+		item_records, structure["items"] = self.compile_items(content_input["items"], strings, string_lists)
+		for section in CompiledWorld.TEXT_SECTIONS:
+			structure[section] = self.compile_texts(content_input[section], strings)
+
+		string_table = strings.to_bytes()
+		string_list_table = b"".join(CompiledWorld.STRING_LIST_ENTRY.pack(index) for index in string_lists)
+		structure_content = json.dumps(structure, separators=(",", ":")).encode("utf-8")
+
+		offset = CompiledWorld.HEADER.size
+		sections = []
+		section_offsets = []
+		for section in [string_table, string_list_table, location_records, item_records, structure_content]:
+			section_offsets.append(offset)
+			sections.append(section)
+			offset += len(section)
+
+		header = CompiledWorld.HEADER.pack(
+			CompiledWorld.MAGIC,
+			CompiledWorld.FORMAT_VERSION,
+			0,
+			section_offsets[0],
+			section_offsets[1],
+			section_offsets[2],
+			len(location_records) // CompiledWorld.LOCATION_RECORD.size,
+			section_offsets[3],
+			len(item_records) // CompiledWorld.ITEM_RECORD.size,
+			section_offsets[4],
+			len(structure_content),
+		)
+
+		return header + b"".join(sections)
+
+
+	def write(self, content_input, filename):
+		with open(filename, "wb") as output_file:
+			output_file.write(self.compile(content_input))
+
+
+	def compile_locations(self, location_inputs, strings, string_lists):
+		records = []
+		structures = []
+
+		for location_input in location_inputs:
+			structure = dict(location_input)
+			label_input = structure.pop("labels")
+			extended_start, extended_count = self.compile_string_list(label_input.get("extended_descriptions", []),
+				strings, string_lists)
+			records.append(CompiledWorld.LOCATION_RECORD.pack(
+				structure.pop("data_id"),
+				int(structure.pop("attributes"), 16),
+				strings.add(label_input["longname"]),
+				strings.add(label_input["description"]),
+				extended_start,
+				extended_count,
+			))
+			structure["labels"] = {"shortname": label_input["shortname"]}
+			structures.append(structure)
+
+		return b"".join(records), structures
+
+
+	def compile_items(self, item_inputs, strings, string_lists):
+		records = []
+		structures = []
+
+		for item_input in item_inputs:
+			structure = dict(item_input)
+			label_input = structure.pop("labels")
+			extended_start, extended_count = self.compile_string_list(label_input.get("extended_descriptions", []),
+				strings, string_lists)
+			writing = CompiledWorld.NO_STRING
+			if "writing" in structure:
+				writing = strings.add(structure.pop("writing"))
+			records.append(CompiledWorld.ITEM_RECORD.pack(
+				structure.pop("data_id"),
+				int(structure.pop("attributes"), 16),
+				structure.pop("size"),
+				strings.add(label_input["longname"]),
+				strings.add(label_input["description"]),
+				writing,
+				extended_start,
+				extended_count,
+			))
+			structure["labels"] = {"shortnames": label_input["shortnames"]}
+			structures.append(structure)
+
+		return b"".join(records), structures
+
+
+	def compile_string_list(self, texts, strings, string_lists):
+		start = len(string_lists)
+		for text in texts:
+			string_lists.append(strings.add(text))
+		return start, len(texts)
+
+
+	def compile_texts(self, text_inputs, strings):
+		return {key : strings.add(TokenTranslator.translate_substitution_tokens(value)) for key, value in text_inputs.items()}
+
+
+class CompiledWorldReader:
+
+	def read(self, filename):
+		with open(filename, "rb") as input_file:
+			buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+		return self.read_buffer(buffer)
+
+
+	def read_buffer(self, buffer):
+		(magic, format_version, _, strings_offset, string_lists_offset, locations_offset, location_count, items_offset,
+			item_count, structure_offset, structure_length) = CompiledWorld.HEADER.unpack_from(buffer, 0)
+
+		if magic != CompiledWorld.MAGIC:
+			raise ValueError("Not a compiled world file.")
+		if format_version != CompiledWorld.FORMAT_VERSION:
+			raise ValueError("Unsupported compiled world version {0}.".format(format_version))
+
+		strings = StringTable(buffer, strings_offset)
+		content = json.loads(str(buffer[structure_offset:structure_offset + structure_length], "utf-8"))
+		string_lists = (buffer, string_lists_offset)
+
+		self.read_locations(content["locations"], buffer, locations_offset, location_count, strings, string_lists)
+		self.read_items(content["items"], buffer, items_offset, item_count, strings, string_lists)
+		for section in CompiledWorld.TEXT_SECTIONS:
+			content[section] = {key : strings.get_reference(index) for key, index in content[section].items()}
+
+		return content
+
+
+	def read_locations(self, location_inputs, buffer, offset, count, strings, string_lists):
+		for location_input, record in zip(location_inputs, self.read_records(CompiledWorld.LOCATION_RECORD, buffer, offset, count)):
+			data_id, attributes, longname, description, extended_start, extended_count = record
+			location_input["data_id"] = data_id
+			location_input["attributes"] = format(attributes, "x")
+			label_input = location_input["labels"]
+			label_input["longname"] = strings.get_reference(longname)
+			label_input["description"] = strings.get_reference(description)
+			label_input["extended_descriptions"] = self.read_string_list(string_lists, extended_start, extended_count, strings)
+
+
+	def read_items(self, item_inputs, buffer, offset, count, strings, string_lists):
+		for item_input, record in zip(item_inputs, self.read_records(CompiledWorld.ITEM_RECORD, buffer, offset, count)):
+			data_id, attributes, size, longname, description, writing, extended_start, extended_count = record
+			item_input["data_id"] = data_id
+			item_input["attributes"] = format(attributes, "x")
+			item_input["size"] = size
+			if writing != CompiledWorld.NO_STRING:
+				item_input["writing"] = strings.get_reference(writing)
+			label_input = item_input["labels"]
+			label_input["longname"] = strings.get_reference(longname)
+			label_input["description"] = strings.get_reference(description)
+			label_input["extended_descriptions"] = self.read_string_list(string_lists, extended_start, extended_count, strings)
+
+
+	def read_records(self, record_struct, buffer, offset, count):
+		for i in range(count):
+			yield record_struct.unpack_from(buffer, offset + i * record_struct.size)
+
+
+	def read_string_list(self, string_lists, start, count, strings):
+		buffer, offset = string_lists
+		entry_size = CompiledWorld.STRING_LIST_ENTRY.size
+		return [strings.get_reference(CompiledWorld.STRING_LIST_ENTRY.unpack_from(buffer, offset + (start + i) * entry_size)[0])
+			for i in range(count)]
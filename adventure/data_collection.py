@@ -1,13 +1,14 @@
 class DataCollection:
 
-	def __init__(self, commands, inventories, locations, elements_by_id, items, item_related_commands, hints, explanations,
-			responses, inputs, events):
+	def __init__(self, commands, inventories, locations, elements_by_id, items, item_related_commands, command_dispatch, hints,
+			explanations, responses, inputs, events):
 		self.commands = commands
 		self.inventories = inventories
 		self.locations = locations
 		self.elements_by_id = elements_by_id
 		self.items = items
 		self.item_related_commands = item_related_commands
+		self.command_dispatch = command_dispatch
 		self.hints = hints
 		self.explanations = explanations
 		self.responses = responses
@@ -31,6 +32,10 @@ class DataCollection:
 		return self.item_related_commands
 
 
+	def get_command_dispatch(self):
+		return self.command_dispatch
+
+
 	def get_element_by_id(self, data_id):
 		return self.elements_by_id.get(data_id)
 
@@ -59,6 +64,10 @@ class DataCollection:
 		return self.responses.get(response_key)
 
 
+	def get_response_template(self, response_keys):
+		return self.responses.get_template(response_keys)
+
+
 	def get_start_message(self):
 		return self.responses.get("describe_start")
 
@@ -67,8 +76,12 @@ class DataCollection:
 		return self.inputs.matches(internal_key, input_key)
 
 
-	def get_events(self, event_key):
-		return self.events.get(event_key)
+	def get_events(self, command_id, args):
+		return self.events.get(command_id, args)
+
+
+	def has_events(self, command_id):
+		return self.events.has_events(command_id)
 
 
 	def get_puzzle_count(self):
@@ -1,8 +1,16 @@
+from contextlib import nullcontext
+import gc
 import json
+import sys
+import threading
+import time
 
 from adventure.argument_resolver import ArgumentResolver
+from adventure.command_dispatch import CommandDispatch
 from adventure.command_handler import CommandHandler
 from adventure.command_parser import CommandParser
+from adventure.command_runner import CommandRunner
+from adventure.compiled_world import CompiledWorldReader
 from adventure.data_collection import DataCollection
 from adventure.event_parser import EventParser
 from adventure.event_resolver import EventResolver
@@ -13,25 +21,118 @@ from adventure.inventory_parser import InventoryParser
 from adventure.item_parser import ItemParser
 from adventure.life_resolver import LifeResolver
 from adventure.location_parser import LocationParser
+from adventure.parse_cache import ParseCache
+from adventure.parse_stages import ParseStage, StageRunner
 from adventure.player import Player
 from adventure.player_parser import PlayerParser
 from adventure.post_parse_validator import PostParseValidator
 from adventure.resolvers import Resolvers
 from adventure.text_parser import TextParser
+from adventure.validation import ValidationMode
+from adventure.validation_stamp import ValidationStamp
 from adventure.vision_resolver import VisionResolver
+from adventure.world_template import WorldTemplate
 
 class DataParser:
 
 	VALIDATION_MESSAGE_FILENAME = "validation.txt"
 
-	def parse(self, filename, text_input=False):
-		content = None
-		if text_input:
-			content = self.get_content_text(filename)
+	def __init__(self, report_stage_timings=False, profiler=None, validation_mode=ValidationMode.FULL):
+		self.report_stage_timings = report_stage_timings
+		self.profiler = profiler
+		self.validation_mode = validation_mode
+		self.validation = None
+		self.validation_thread = None
+
+
+	def parse(self, filename, text_input=False, cache_dir=None, compiled_input=False):
+		if self.profiler:
+			self.profiler.start()
+
+		# Almost everything a parse creates stays alive, so collecting during it only walks the growing world
+		gc_enabled = gc.isenabled()
+		gc.disable()
+		try:
+			validate = self.should_validate(filename)
+			if compiled_input:
+				return self.parse_file(self.get_compiled_content(filename), validate)
+			if cache_dir:
+				return self.parse_cached(filename, text_input, ParseCache(cache_dir), validate)
+			return self.parse_file(self.get_json_content(filename, text_input), validate)
+
+		finally:
+			if gc_enabled:
+				gc.enable()
+			if self.profiler:
+				self.profiler.stop()
+
+
+	def parse_template(self, filename, text_input=False, cache_dir=None, compiled_input=False):
+		game = self.parse(filename, text_input, cache_dir, compiled_input)
+		return WorldTemplate(game.data, game.player)
+
+
+	def validate(self, filename, text_input=False, compiled_input=False):
+		if compiled_input:
+			content = self.get_compiled_content(filename)
 		else:
-			content = self.get_content_binary(filename)
-		json_content = json.loads(content)
-		return self.parse_file(json_content)
+			content = self.get_json_content(filename, text_input)
+		_, _, validation = self.parse_content(content, self.init_resolvers())
+		return validation
+
+
+	def should_validate(self, filename):
+		if self.validation_mode != ValidationMode.PREVALIDATED:
+			return True
+		if ValidationStamp(filename).is_current():
+			return False
+		print("{0} is not marked as validated, validating in full.".format(filename), file=sys.stderr)
+		return True
+
+
+	def phase(self, name):
+		if self.profiler:
+			return self.profiler.phase(name)
+		return nullcontext()
+
+
+	def parse_cached(self, filename, text_input, cache, validate=True):
+		start_time = time.perf_counter()
+		with self.phase("cache load"):
+			key = cache.get_key(filename)
+			entry = cache.load(key)
+
+		if entry:
+			data, player, validation = entry
+			if validate:
+				self.report_validation(validation)
+				self.validation = validation
+			print("Loaded {0} from cache in {1:.3f}s.".format(filename, time.perf_counter() - start_time), file=sys.stderr)
+
+		else:
+			# Entries are always validated in full, so that later loads can report from them
+			data, player, validation = self.link(self.get_json_content(filename, text_input))
+			with self.phase("cache store"):
+				cache.store(key, (data, player, validation))
+			print("Parsed {0} in {1:.3f}s, cache written.".format(filename, time.perf_counter() - start_time), file=sys.stderr)
+
+		return self.build_game(data, player)
+
+
+	def get_json_content(self, filename, text_input):
+		content = None
+		with self.phase("decode"):
+			if text_input:
+				content = self.get_content_text(filename)
+			else:
+				content = self.get_content_binary(filename)
+		with self.phase("json.loads"):
+			return json.loads(content)
+
+
+	def get_compiled_content(self, filename):
+		with self.phase("read compiled"):
+			return CompiledWorldReader().read(filename)
 
 
 	def get_content_text(self, filename):
@@ -45,23 +146,60 @@ class DataParser:
 			return reader.get_content()
 
 
-	def parse_file(self, json_content):
+	def parse_file(self, json_content, validate=True):
+		validate_in_background = validate and self.validation_mode == ValidationMode.BACKGROUND
+		data, player, validation = self.link(json_content, validate and not validate_in_background)
+		game = self.build_game(data, player)
+		if validate_in_background:
+			self.start_background_validation(json_content)
+		return game
+
+
+	# Background validation parses its own copy, as the world being played may change
+	def start_background_validation(self, json_content):
+		self.validation_thread = threading.Thread(target=self.validate_content, args=(json_content,), name="validation")
+		self.validation_thread.start()
+
+
+	def wait_for_validation(self):
+		if self.validation_thread:
+			self.validation_thread.join()
+
+
+	def validate_content(self, json_content):
+		validator = DataParser()
+		_, _, validation = validator.parse_content(json_content, validator.init_resolvers())
+		validator.report_validation(validation)
+		self.validation = validation
+
+
+	def build_game(self, data, player):
+		with self.phase("build game"):
+			return Game(data, player)
+
+
+	def link(self, json_content, validate=True):
 		resolvers = self.init_resolvers()
 
-		data, player, validation = self.parse_content(json_content, resolvers)
+		data, player, validation = self.parse_content(json_content, resolvers, validate)
+		if validate:
+			with self.phase("report validation"):
+				self.report_validation(validation)
+			self.validation = validation
+
+		for name in ["argument_resolver", "command_handler", "vision_resolver", "event_resolver", "life_resolver"]:
+			with self.phase("init " + name):
+				getattr(resolvers, name).init_data(data)
+
+		return data, player, validation
+
+
+	def report_validation(self, validation):
 		if validation:
 			with open(DataParser.VALIDATION_MESSAGE_FILENAME, "w") as validation_file:
 				for validation_line in validation:
 					validation_file.write(validation_line.get_formatted_message() + "\n")
-			print("Validation errors found, see {0}.".format(DataParser.VALIDATION_MESSAGE_FILENAME))
-
-		resolvers.argument_resolver.init_data(data)
-		resolvers.command_handler.init_data(data)
-		resolvers.vision_resolver.init_data(data)
-		resolvers.event_resolver.init_data(data)
-		resolvers.life_resolver.init_data(data)
-
-		return Game(data, player)
+			print("Validation errors found, see {0}.".format(DataParser.VALIDATION_MESSAGE_FILENAME), file=sys.stderr)
 
 
 	def init_resolvers(self):
@@ -79,23 +217,19 @@ class DataParser:
 		)
 
 
-	def parse_content(self, content_input, resolvers):
-		commands, teleport_infos, command_validation = CommandParser().parse(content_input["commands"], resolvers)
-		inventories, inventory_validation = InventoryParser().parse(content_input["inventories"])
-		locations, location_validation = LocationParser().parse(content_input["locations"], teleport_infos)
-		elements_by_id = locations.locations.copy()
-		commands_by_id = commands.commands_by_id.copy()
-		items, related_commands, item_validation = ItemParser().parse(content_input["items"], elements_by_id, commands_by_id)
-		hints = TextParser().parse(content_input["hints"])
-		explanations = TextParser().parse(content_input["explanations"])
-		responses = TextParser().parse(content_input["responses"])
-		inputs = InputParser().parse(content_input["inputs"])
-		events = EventParser().parse(
-			content_input["events"],
-			commands.commands_by_id.copy(),
-			items.items_by_id.copy(),
-			locations.locations.copy(),
-		)
+	def parse_content(self, content_input, resolvers, validate=True):
+		runner = StageRunner()
+		stages = [self.get_profiled_stage(stage) for stage in self.get_parse_stages(content_input, resolvers)]
+		results = runner.run(stages)
+		if self.report_stage_timings:
+			print(runner.format_timings(), file=sys.stderr)
+
+		commands, _, command_validation = results["commands"]
+		inventories, inventory_validation = results["inventories"]
+		locations, location_validation = results["locations"]
+		elements_by_id, items, related_commands, item_validation = results["items"]
+		events, event_validation = results["events"]
+		responses, response_validation = results["responses"]
 
 		data = DataCollection(
 			commands=commands,
@@ -104,22 +238,94 @@ class DataParser:
 			elements_by_id=elements_by_id,
 			items=items,
 			item_related_commands=related_commands,
-			hints=hints,
-			explanations=explanations,
+			command_dispatch=results["dispatch"],
+			hints=results["hints"],
+			explanations=results["explanations"],
 			responses=responses,
-			inputs=inputs,
+			inputs=results["inputs"],
 			events=events,
 		)
 
-		player = PlayerParser().parse(
+		player = results["player"]
+
+		validation = None
+		if validate:
+			parse_validation = command_validation + location_validation + inventory_validation + item_validation + event_validation \
+				+ response_validation
+			with self.phase("validate"):
+				post_parse_validation = PostParseValidator().validate(data)
+			validation = parse_validation + post_parse_validation
+
+		return data, player, validation
+
+
+	def get_profiled_stage(self, stage):
+		def run_profiled(results):
+			with self.phase("parse " + stage.name):
+				return stage.function(results)
+		return ParseStage(stage.name, stage.dependencies, run_profiled)
+
+
+	def get_parse_stages(self, content_input, resolvers):
+		return [
+			ParseStage("commands", [], lambda results: CommandParser().parse(content_input["commands"], resolvers)),
+			ParseStage("inventories", [], lambda results: InventoryParser().parse(content_input["inventories"])),
+			ParseStage("locations", ["commands"], lambda results: self.parse_locations(content_input, results)),
+			ParseStage("items", ["commands", "locations"], lambda results: self.parse_items(content_input, results)),
+			ParseStage("dispatch", ["commands", "items"], lambda results: self.create_command_dispatch(results)),
+			ParseStage("hints", [], lambda results: TextParser().parse(content_input["hints"])),
+			ParseStage("explanations", [], lambda results: TextParser().parse(content_input["explanations"])),
+			ParseStage("responses", [], lambda results: self.parse_responses(content_input)),
+			ParseStage("inputs", [], lambda results: InputParser().parse(content_input["inputs"])),
+			ParseStage("events", ["commands", "locations", "items"], lambda results: self.parse_events(content_input, results)),
+			ParseStage("player", ["locations", "inventories"], lambda results: self.parse_player(content_input, results)),
+		]
+
+
+	def parse_responses(self, content_input):
+		responses = TextParser().parse(content_input["responses"])
+		validation = responses.precompile(CommandRunner.FREQUENT_TEMPLATE_KEYS)
+		return responses, validation
+
+
+	def parse_locations(self, content_input, results):
+		_, teleport_infos, _ = results["commands"]
+		return LocationParser().parse(content_input["locations"], teleport_infos)
+
+
+	def parse_items(self, content_input, results):
+		commands, _, _ = results["commands"]
+		locations, _ = results["locations"]
+		elements_by_id = locations.locations.copy()
+		commands_by_id = commands.commands_by_id.copy()
+		items, related_commands, item_validation = ItemParser().parse(content_input["items"], elements_by_id, commands_by_id)
+		return elements_by_id, items, related_commands, item_validation
+
+
+	def create_command_dispatch(self, results):
+		commands, _, _ = results["commands"]
+		_, _, related_commands, _ = results["items"]
+		return CommandDispatch(commands.commands_by_name, related_commands)
+
+
+	def parse_events(self, content_input, results):
+		commands, _, _ = results["commands"]
+		locations, _ = results["locations"]
+		_, items, _, _ = results["items"]
+		return EventParser().parse(
+			content_input["events"],
+			commands.commands_by_id.copy(),
+			items.items_by_id.copy(),
+			locations.locations.copy(),
+		)
+
+
+	def parse_player(self, content_input, results):
+		inventories, _ = results["inventories"]
+		locations, _ = results["locations"]
+		return PlayerParser().parse(
 			content_input["players"],
 			locations.locations.copy(),
 			inventories.get_default(),
 			inventories.get_all(),
 		)
-
-		parse_validation = command_validation + location_validation + inventory_validation + item_validation
-		post_parse_validation = PostParseValidator().validate(data)
-		validation = parse_validation + post_parse_validation
-
-		return data, player, validation
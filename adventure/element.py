@@ -1,3 +1,5 @@
+from adventure.world_instance import StateField, Stateful
+
 class Labels:
 
 	def __init__(self, shortname, longname, description, extended_descriptions=[]):
@@ -11,7 +13,11 @@ class Element:
 
 	def __init__(self, attributes):
 		self.raw_attributes = attributes
-		self.attributes = self.raw_attributes
+		self.init_attributes(attributes)
+
+
+	def init_attributes(self, attributes):
+		self.attributes = attributes
 
 
 	def has_attribute(self, attribute):
@@ -20,14 +26,21 @@ class Element:
 
 	def set_attribute(self, attribute):
 		self.attributes |= attribute
+		self.attributes_changed()
 
 
 	def unset_attribute(self, attribute):
 		self.attributes &= ~attribute
+		self.attributes_changed()
 
 
 	def toggle_attribute(self, attribute):
 		self.attributes ^= attribute
+		self.attributes_changed()
+
+
+	def attributes_changed(self):
+		pass
 
 
 class DataElement(Element):
@@ -37,7 +50,10 @@ class DataElement(Element):
 		self.data_id = data_id
 
 
-class NamedDataElement(DataElement):
+class NamedDataElement(DataElement, Stateful):
+
+	attributes = StateField()
+	extended_description_index = StateField()
 
 	def __init__(self, data_id, attributes, labels):
 		DataElement.__init__(self, data_id, attributes)
@@ -45,7 +61,29 @@ class NamedDataElement(DataElement):
 		self.longname = labels.longname
 		self.description = labels.description
 		self.extended_descriptions = labels.extended_descriptions
-		self.extended_description_index = 0
+		self.base_state.extended_description_index = 0
+		# Items whose switch state text depends on this element's attributes
+		self.switching_items = []
+
+
+	# Constructors set a new element's own state directly
+	def init_attributes(self, attributes):
+		self.base_state.attributes = attributes
+
+
+	def attributes_changed(self):
+		for switching_item in self.switching_items:
+			switching_item.description_changed()
+
+
+	def set_extended_description_index(self, extended_description_index):
+		self.extended_description_index = extended_description_index
+		self.description_changed()
+
+
+	# Called whenever anything that changes how an element is described may have changed
+	def description_changed(self):
+		pass
 
 
 	def get_description(self):
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import partial
 
 from adventure.element import DataElement
 
@@ -28,6 +29,32 @@ class EventMatch:
 		self.command = command
 		self.arguments = arguments
 		self.prerequisites = prerequisites
+		self.prerequisites_met = self.compile_prerequisites(prerequisites)
+
+
+	# Prerequisites are compiled into one picklable predicate on the player
+	def compile_prerequisites(self, prerequisites):
+		predicates = tuple(prerequisite.get_predicate() for prerequisite in prerequisites)
+		if not predicates:
+			return always_met
+		if len(predicates) == 1:
+			return predicates[0]
+		return partial(all_met, predicates)
+
+
+def always_met(player):
+	return True
+
+
+def constant_met(met, player):
+	return met
+
+
+def all_met(predicates, player):
+	for predicate in predicates:
+		if not predicate(player):
+			return False
+	return True
 
 
 class EventMatchArgument:
@@ -40,6 +67,8 @@ class EventMatchArgument:
 class EventMatchArgumentKind(Enum):
 	TEXT = 0
 	ITEM = 1
+	ANY = 2
+	ATTRIBUTE = 3
 
 
 class EventMatchPrerequisiteKind(Enum):
@@ -63,6 +92,18 @@ class ItemEventMatchPrerequisite(EventMatchPrerequisite):
 		self.container = container
 
 
+	def get_predicate(self):
+		if self.container.kind == ItemEventMatchPrerequisiteContainerKind.ANY:
+			return partial(constant_met, not self.invert)
+		if self.container.kind == ItemEventMatchPrerequisiteContainerKind.CURRENT_LOCATION:
+			return self.is_at_current_location
+		return partial(constant_met, self.invert)
+
+
+	def is_at_current_location(self, player):
+		return player.get_location().contains(self.item) != self.invert
+
+
 class ItemEventMatchPrerequisiteContainer:
 
 	def __init__(self, kind, container_id):
@@ -85,6 +126,14 @@ class LocationEventMatchPrerequisite:
 		self.location = location
 
 
+	def get_predicate(self):
+		return self.is_current_location
+
+
+	def is_current_location(self, player):
+		return (player.get_location() == self.location) != self.invert
+
+
 class EventEventMatchPrerequisite:
 
 	def __init__(self, kind, invert, event_id):
@@ -92,6 +141,14 @@ class EventEventMatchPrerequisite:
 		self.event_id = event_id
 
 
+	def get_predicate(self):
+		return self.is_completed
+
+
+	def is_completed(self, player):
+		return player.has_completed_event(self.event_id) != self.invert
+
+
 class EventOutcome:
 
 	def __init__(self, text_key, actions):
@@ -1,16 +1,112 @@
+from adventure.event import EventMatchArgumentKind
+from adventure.item import Item
+
+# Indexes events by command and argument ids, with patterns for wildcard and attribute arguments
 class EventCollection:
 
+	ANY_KEY = ("any",)
+	ATTRIBUTE_KEY = "attribute"
+
 	def __init__(self, events):
-		self.events = events
-		self.puzzle_count = self.count_puzzles()
+		self.events = {}
+		self.patterns = {}
+		for event in events:
+			self.add(event)
+		self.sort_patterns()
+		self.puzzle_count = self.count_puzzles(events)
+
+
+	def add(self, event):
+		match = event.match
+		# Events with unknown commands can never be matched
+		if match.command:
+			command_id = match.command.data_id
+			command_events = self.events.setdefault(command_id, {})
+			pattern = tuple(self.get_pattern_part(argument) for argument in match.arguments)
+			if any(pattern):
+				command_patterns = self.patterns.setdefault(command_id, [])
+				if not pattern in command_patterns:
+					command_patterns.append(pattern)
+			argument_key = self.get_key([self.get_match_argument_id(argument) for argument in match.arguments])
+			command_events.setdefault(argument_key, []).append(event)
+
+
+	def get_pattern_part(self, argument):
+		if argument.kind == EventMatchArgumentKind.ANY:
+			return EventCollection.ANY_KEY
+		if argument.kind == EventMatchArgumentKind.ATTRIBUTE:
+			return (EventCollection.ATTRIBUTE_KEY, argument.value)
+		return None
+
+
+	def get_match_argument_id(self, argument):
+		pattern_part = self.get_pattern_part(argument)
+		if pattern_part:
+			return pattern_part
+		return self.get_argument_id(argument.value)
+
+
+	def sort_patterns(self):
+		for command_patterns in self.patterns.values():
+			command_patterns.sort(key=lambda pattern: pattern.count(EventCollection.ANY_KEY))
+
+
+	def count_puzzles(self, events):
+		return sum(1 for event in events if event.is_puzzle())
+
+
+	def get_key(self, argument_ids):
+		if len(argument_ids) == 1:
+			return argument_ids[0]
+		return tuple(argument_ids)
+
+
+	def get_argument_key(self, args):
+		return self.get_key([self.get_argument_id(arg) for arg in args])
+
+
+	def get_argument_id(self, arg):
+		if isinstance(arg, Item):
+			return arg.get_original().data_id
+		return arg
+
+
+	def get_pattern_key(self, pattern, args):
+		if len(pattern) != len(args):
+			return None
+
+		argument_ids = []
+		for pattern_part, arg in zip(pattern, args):
+			if not pattern_part:
+				argument_ids.append(self.get_argument_id(arg))
+			elif not isinstance(arg, Item):
+				return None
+			elif pattern_part == EventCollection.ANY_KEY or arg.has_attribute(pattern_part[1]):
+				argument_ids.append(pattern_part)
+			else:
+				return None
+
+		return self.get_key(argument_ids)
+
+
+	def has_events(self, command_id):
+		return command_id in self.events
 
 
-	def count_puzzles(self):
-		result = 0
-		for multi_event in self.events.values():
-			result += sum(1 for event in multi_event if event.is_puzzle())
-		return result
+	def get(self, command_id, args):
+		command_events = self.events.get(command_id)
+		if not command_events:
+			return None
 
+		events = command_events.get(self.get_argument_key(args))
+		command_patterns = self.patterns.get(command_id)
+		if not command_patterns:
+			return events
 
-	def get(self, event_key):
-		return self.events.get(event_key)
+		# General matches are only reached if no exact match has its prerequisites met
+		candidates = list(events) if events else []
+		for pattern in command_patterns:
+			pattern_key = self.get_pattern_key(pattern, args)
+			if pattern_key is not None:
+				candidates.extend(command_events.get(pattern_key, []))
+		return candidates
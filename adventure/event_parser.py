@@ -6,42 +6,44 @@ from adventure.event import EventOutcome, EventOutcomeActionKind, PlayerEventOut
 from adventure.event import LocationEventOutcomeAction, LinkEventOutcomeAction, DescriptionEventOutcomeAction
 from adventure.event import ItemEventOutcomeActionDestination, ItemEventOutcomeActionDestinationKind
 from adventure.event_collection import EventCollection
+from adventure.validation import Message
 
 class EventParser:
 
 	def parse(self, event_inputs, commands_by_id, items_by_id, locations_by_id):
-		events = self.parse_events(event_inputs, commands_by_id, items_by_id, locations_by_id)
-		return EventCollection(events)
+		events, validation = self.parse_events(event_inputs, commands_by_id, items_by_id, locations_by_id)
+		return EventCollection(events), validation
 
 
 	def parse_events(self, event_inputs, commands_by_id, items_by_id, locations_by_id):
-		events = {}
+		events = []
+		validation = []
 
 		for event_input in event_inputs:
-			event, match = self.parse_event(event_input, commands_by_id, items_by_id, locations_by_id)
-			match_argument_values = [argument.value for argument in match.arguments]
-			match_key = (tuple([match.command] + match_argument_values))
+			event, _ = self.parse_event(event_input, commands_by_id, items_by_id, locations_by_id, validation)
+			if event:
+				events.append(event)
 
-			if not match_key in events:
-				events[match_key] = []
-			events[match_key].append(event)
+		return events, validation
 
-		return events
 
-
-	def parse_event(self, event_input, commands_by_id, items_by_id, locations_by_id):
+	def parse_event(self, event_input, commands_by_id, items_by_id, locations_by_id, validation):
 		event_id = event_input["data_id"]
 		attributes = int(event_input["attributes"], 16)
-		match = self.parse_event_match(event_input["match"], commands_by_id, items_by_id, locations_by_id)
+		match = self.parse_event_match(event_input["match"], commands_by_id, items_by_id, locations_by_id, validation, event_id)
+		if not match:
+			return None, None
 		outcome = self.parse_event_outcome(event_input["outcome"], items_by_id, locations_by_id)
 
 		event = Event(event_id, attributes, match, outcome)
 		return event, match
 
 
-	def parse_event_match(self, event_match_input, commands_by_id, items_by_id, locations_by_id):
+	def parse_event_match(self, event_match_input, commands_by_id, items_by_id, locations_by_id, validation, event_id):
 		command = self.get_event_match_command(event_match_input["command_id"], commands_by_id)
-		arguments  = self.parse_event_match_arguments(event_match_input["arguments"], items_by_id)
+		arguments  = self.parse_event_match_arguments(event_match_input["arguments"], items_by_id, validation, event_id)
+		if arguments is None:
+			return None
 		prerequisites = self.parse_event_match_prerequisites(event_match_input.get("prerequisites"), items_by_id, locations_by_id)
 		return EventMatch(command, arguments, prerequisites)
 
@@ -50,16 +52,22 @@ class EventParser:
 		return commands_by_id.get(command_id)
 
 
-	def parse_event_match_arguments(self, event_match_argument_inputs, items_by_id):
+	def parse_event_match_arguments(self, event_match_argument_inputs, items_by_id, validation, event_id):
 		event_match_arguments = []
 
 		for event_match_argument_input in event_match_argument_inputs:
 			arg_kind_key = event_match_argument_input["kind"].upper()
 			arg_kind = EventMatchArgumentKind[arg_kind_key]
 
-			arg_value = event_match_argument_input["value"]
+			arg_value = event_match_argument_input.get("value")
 			if arg_kind == EventMatchArgumentKind.ITEM:
 				arg_value = items_by_id.get(arg_value)
+			elif arg_kind == EventMatchArgumentKind.ATTRIBUTE:
+				try:
+					arg_value = int(arg_value, 16)
+				except (TypeError, ValueError):
+					validation.append(Message(Message.EVENT_INVALID_ATTRIBUTE_ARGUMENT, (event_id, arg_value)))
+					return None
 
 			argument = EventMatchArgument(kind=arg_kind, value=arg_value)
 			event_match_arguments.append(argument)
@@ -1,11 +1,17 @@
-from adventure.event import EventMatchPrerequisiteKind, ItemEventMatchPrerequisiteContainerKind
 from adventure.event import EventOutcomeActionKind, ItemEventOutcomeActionDestinationKind
-from adventure.item import Item
 from adventure.item_container import ItemContainer
 from adventure.resolver import Resolver
 
 class EventResolver(Resolver):
 
+	# Commands that no event matches never need to look for one
+	def init_data(self, data):
+		Resolver.init_data(self, data)
+		for command in data.get_commands().commands_by_id.values():
+			if not data.has_events(command.data_id):
+				command.resolver_functions = [function for function in command.resolver_functions if function != self.resolve_event]
+
+
 	def resolve_event(self, command, player, *args):
 		content_args = list(args)
 		next_args = list(args)
@@ -23,66 +29,16 @@ class EventResolver(Resolver):
 
 
 	def get_event(self, command, player, args):
-		event_key = self.create_event_key(command, args)
-		events = self.data.get_events(event_key)
+		events = self.data.get_events(command.data_id, args)
 
 		if events:
 			for event in events:
-				if self.event_matches(event.match, player):
+				if event.match.prerequisites_met(player):
 					return event
 
 		return None
 
 
-	def create_event_key(self, command, args):
-		event_args = self.create_event_args(args)
-		return tuple([command] + list(event_args))
-
-
-	def create_event_args(self, args):
-		event_args = []
-
-		for arg in args:
-			if isinstance(arg, Item):
-				event_args.append(arg.get_original())
-			else:
-				event_args.append(arg)
-
-		return event_args
-
-
-	def event_matches(self, match, player):
-		for prerequisite in match.prerequisites:
-
-			if not self.event_meets_prerequisites(prerequisite, player):
-				return False
-
-		return True
-
-
-	def event_meets_prerequisites(self, prerequisite, player):
-		condition_met = False
-
-		if prerequisite.kind == EventMatchPrerequisiteKind.ITEM:
-			item = prerequisite.item
-			container_requirements = prerequisite.container
-			container_kind = container_requirements.kind
-
-			if container_kind == ItemEventMatchPrerequisiteContainerKind.ANY:
-				condition_met = True
-
-			if container_kind == ItemEventMatchPrerequisiteContainerKind.CURRENT_LOCATION:
-				condition_met = player.get_location().contains(item)
-
-		elif prerequisite.kind == EventMatchPrerequisiteKind.LOCATION:
-			condition_met = prerequisite.location == player.get_location()
-
-		elif prerequisite.kind == EventMatchPrerequisiteKind.EVENT:
-			condition_met = player.has_completed_event(prerequisite.event_id)
-
-		return condition_met ^ prerequisite.invert
-
-
 	def handle_outcome_actions(self, player, actions):
 		for action in actions:
 			if action.kind == EventOutcomeActionKind.PLAYER:
@@ -145,13 +101,13 @@ class EventResolver(Resolver):
 		direction = action.direction
 
 		if destination:
-			source.directions[direction] = destination
+			source.link(direction, destination)
 		else:
-			source.directions.pop(direction, None)
+			source.unlink(direction)
 
 
 	def handle_description_outcome_action(self, player, action):
-		action.named_data_element.extended_description_index = action.extended_description_index
+		action.named_data_element.set_extended_description_index(action.extended_description_index)
 
 
 	def update_player_outcomes(self, player, event):
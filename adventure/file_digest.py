@@ -0,0 +1,12 @@
+import hashlib
+
+class FileDigest:
+
+	BLOCK_SIZE = 1 << 20
+
+	def get_hexdigest(filename):
+		digest = hashlib.sha256()
+		with open(filename, "rb") as input_file:
+			for block in iter(lambda: input_file.read(FileDigest.BLOCK_SIZE), b""):
+				digest.update(block)
+		return digest.hexdigest()
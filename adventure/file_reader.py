@@ -1,8 +1,15 @@
+import io
+import mmap
+import os
+
 class FileReader:
 
 	BITS_PER_BYTE = 8
+	FLIPPED_BYTES = bytes(int("{0:08b}".format(byte)[::-1], 2) for byte in range(1 << BITS_PER_BYTE))
+	CHUNK_SIZE = 1 << 20
 
-	def __init__(self, input_file):
+	def __init__(self, input_file, chunk_size=CHUNK_SIZE):
+		self.chunk_size = chunk_size
 		self.content = self.flip_bytes(input_file)
 
 
@@ -11,23 +18,22 @@ class FileReader:
 
 
 	def flip_bytes(self, input_file):
-
-		flipped_bytes = []
-
-		for input_line in input_file:
-			input_bytes = list(input_line)
-			for input_byte in input_bytes:
-				flipped_byte = self.reverse_bits(input_byte)
-				flipped_bytes.append(flipped_byte)
-
-		return "".join(map(chr, flipped_bytes))
+		try:
+			fileno = input_file.fileno()
+		except (AttributeError, io.UnsupportedOperation):
+			return input_file.read().translate(FileReader.FLIPPED_BYTES)
+		return self.flip_bytes_mapped(fileno)
 
 
-	def reverse_bits(self, input_byte):
-		output_byte = 0
+	def flip_bytes_mapped(self, fileno):
+		size = os.fstat(fileno).st_size
+		content = bytearray(size)
+		if not size:
+			return content
 
-		for i in range(FileReader.BITS_PER_BYTE):
-			bit = (input_byte & (1 << i)) != 0
-			output_byte += (bit << (FileReader.BITS_PER_BYTE-1-i))
+		with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+			for start in range(0, size, self.chunk_size):
+				end = start + self.chunk_size
+				content[start:end] = mapped[start:end].translate(FileReader.FLIPPED_BYTES)
 
-		return output_byte
+		return content
@@ -1,12 +1,27 @@
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
 from adventure.command_runner import CommandRunner
+from adventure.player import JournalledPlayer
 from adventure.token_processor import TokenProcessor
+from adventure.world_instance import JournalledInstance, TurnJournal
 
 class Game:
 
-	def __init__(self, data, player):
+	UNDO_INPUT = "undo"
+	REDO_INPUT = "redo"
+	UNDONE_RESPONSE = "Undone."
+	REDONE_RESPONSE = "Redone."
+	NOTHING_TO_UNDO_RESPONSE = "There is nothing to undo."
+	NOTHING_TO_REDO_RESPONSE = "There is nothing to redo."
+
+	def __init__(self, data, player, instance=None, journal_depth=0):
 		self.data = data
 		self.player = player
+		self.instance = instance
+		self.journalled_instance = None
 		self.running = True
+		self.set_journal_depth(journal_depth)
 		command_runner = CommandRunner(self.data)
 		self.init_token_processor(self.data, command_runner)
 
@@ -23,10 +38,68 @@ class Game:
 		return self.data.get_start_message()
 
 
+	def activate(self):
+		instance = self.journalled_instance or self.instance
+		if instance:
+			return instance.activate()
+		return nullcontext()
+
+
+	# Each of the last journal_depth turns keeps what it changed, so that it can be undone
+	def set_journal_depth(self, journal_depth):
+		self.journal_depth = journal_depth
+		self.undo_journals = deque(maxlen=journal_depth)
+		self.redo_journals = deque(maxlen=journal_depth)
+		# Games that cannot be undone never look for a journal
+		if journal_depth and not self.journalled_instance:
+			self.journalled_instance = JournalledInstance(self.instance)
+			self.player = self.player.copy_as(JournalledPlayer)
+
+
+	@contextmanager
+	def record_turn(self):
+		if not self.journal_depth:
+			yield
+			return
+
+		journal = TurnJournal()
+		self.journalled_instance.journal = journal
+		try:
+			yield
+		finally:
+			self.journalled_instance.journal = None
+		if journal.entries:
+			self.undo_journals.append(journal)
+			self.redo_journals.clear()
+
+
 	def process_input(self, line):
 		tokens = line.lower().split()
+		# Undo and redo are only taken when the game keeps turns
+		if self.journal_depth and tokens == [Game.UNDO_INPUT]:
+			return Game.UNDONE_RESPONSE if self.undo() else Game.NOTHING_TO_UNDO_RESPONSE
+		if self.journal_depth and tokens == [Game.REDO_INPUT]:
+			return Game.REDONE_RESPONSE if self.redo() else Game.NOTHING_TO_REDO_RESPONSE
 		if tokens:
-			response = self.token_processor.process_tokens(self.player, tokens)
-			self.running = self.player.is_playing()
+			with self.activate(), self.record_turn():
+				response = self.token_processor.process_tokens(self.player, tokens)
+				self.running = self.player.is_playing()
 			return response
 		return ""
+
+
+	def undo(self):
+		return self.swap_journal(self.undo_journals, self.redo_journals)
+
+
+	def redo(self):
+		return self.swap_journal(self.redo_journals, self.undo_journals)
+
+
+	def swap_journal(self, journals, replaced_journals):
+		if not journals:
+			return False
+		with self.activate():
+			replaced_journals.append(journals.pop().swap())
+			self.running = self.player.is_playing()
+		return True
@@ -1,16 +1,20 @@
 from adventure.element import Labels, NamedDataElement
 from adventure.item import Item
 from adventure.item_container import ItemContainer
+from adventure.world_instance import StateField
 
 class Inventory(NamedDataElement, ItemContainer):
 
 	ATTRIBUTE_DEFAULT = 0x1
 
+	weight = StateField()
+
 	def __init__(self, inventory_id, attributes, labels, capacity, location_ids=[]):
 		NamedDataElement.__init__(self, data_id=inventory_id, attributes=attributes, labels=labels)
 		ItemContainer.__init__(self)
 		self.capacity = capacity
 		self.location_ids = location_ids
+		self.base_state.weight = 0
 
 
 	def __copy__(self):
@@ -37,8 +41,30 @@ class Inventory(NamedDataElement, ItemContainer):
 		return self.get_current_weight() + item.size <= self.capacity
 
 
+	# The weight carried is kept as items come and go
 	def get_current_weight(self):
-		return sum(item.get_weight() for item in self.items)
+		return self.weight
+
+
+	def add_item(self, item):
+		if not item in self.items:
+			self.weight += item.get_weight()
+		ItemContainer.add_item(self, item)
+
+
+	def remove(self, item):
+		if item in self.items:
+			self.weight -= item.get_weight()
+		ItemContainer.remove(self, item)
+
+
+	def clear_items(self):
+		ItemContainer.clear_items(self)
+		self.weight = 0
+
+
+	def update_weight(self, previous_weight, weight):
+		self.weight += weight - previous_weight
 
 
 	def drop_all_items(self, non_essential_location, essential_location):
@@ -47,4 +73,4 @@ class Inventory(NamedDataElement, ItemContainer):
 				essential_location.insert(item)
 			else:
 				non_essential_location.insert(item)
-		self.items.clear()
+		self.clear_items()
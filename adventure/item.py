@@ -3,6 +3,7 @@ from enum import Enum
 
 from adventure.element import Labels, NamedDataElement
 from adventure.item_container import ItemContainer
+from adventure.world_instance import StateField
 
 Transformation = namedtuple("Transformation", "replacement tool material")
 
@@ -37,16 +38,24 @@ class Item(NamedDataElement):
 
 	MIN_SIZE = 1
 
+	containers = StateField()
+	copied_to = StateField()
+	environment = StateField()
+	categories = StateField()
+
 	def __init__(self, item_id, attributes, labels, size, writing, list_templates, copied_from=None):
 		NamedDataElement.__init__(self, data_id=item_id, attributes=attributes, labels=labels)
 		self.size = size
 		self.writing = writing
-		self.containers = set()
 		self.transformations = {}
 		self.obstruction = bool(attributes & Item.ATTRIBUTE_OBSTRUCTION)
 		self.list_templates = list_templates
 		self.copied_from = copied_from
-		self.copied_to = set()
+		state = self.base_state
+		state.containers = set()
+		state.copied_to = set()
+		state.environment = self.get_environment()
+		state.categories = self.get_categories()
 
 
 	def __copy__(self):
@@ -59,7 +68,7 @@ class Item(NamedDataElement):
 			list_templates=self.list_templates,
 			copied_from=self,
 		)
-		self.copied_to.add(item_copy)
+		self.get_writable_state().copied_to.add(item_copy)
 
 		for command_id, transformation in self.transformations.items():
 			item_copy.transformations[command_id] = transformation
@@ -75,9 +84,9 @@ class Item(NamedDataElement):
 
 	def destroy(self):
 		self.remove_from_containers()
-		self.containers.clear()
+		self.containers = set()
 		if self.copied_from:
-			self.copied_from.copied_to.remove(self)
+			self.copied_from.get_writable_state().copied_to.remove(self)
 
 
 	def break_open(self):
@@ -124,20 +133,72 @@ class Item(NamedDataElement):
 		return self.longname
 
 
+	def get_environment(self):
+		environment = 0
+		if self.gives_light():
+			environment |= ItemContainer.PROVIDES_LIGHT
+		if self.gives_air():
+			environment |= ItemContainer.PROVIDES_AIR
+		if self.gives_gravity():
+			environment |= ItemContainer.PROVIDES_GRAVITY
+		if self.gives_land():
+			environment |= ItemContainer.PROVIDES_LAND
+		return environment
+
+
+	# Called whenever what an item provides to its surroundings may have changed
+	def update_environment(self):
+		previous_environment = self.environment
+		self.environment = self.get_environment()
+		for container in self.containers:
+			container.update_provider_counts(previous_environment, self.environment)
+
+
+	def get_categories(self):
+		categories = 0
+		if not self.is_silent():
+			categories |= ItemContainer.CATEGORY_NON_SILENT
+		if self.is_collectible():
+			categories |= ItemContainer.CATEGORY_COLLECTIBLE
+		return categories
+
+
+	def update_categories(self):
+		previous_categories = self.categories
+		categories = self.get_categories()
+		if categories != previous_categories:
+			self.categories = categories
+			for container in self.containers:
+				container.update_category_counts(previous_categories, categories)
+
+
+	def attributes_changed(self):
+		NamedDataElement.attributes_changed(self)
+		self.update_environment()
+		self.update_categories()
+		self.description_changed()
+
+
+	def description_changed(self):
+		for container in self.containers:
+			container.description_changed()
+
+
 	def remove_from_containers(self):
 		for container in self.containers:
 			container.remove(self)
 
 
 	def update_container(self, container):
+		containers = self.get_writable_state().containers
 		first_container = self.get_first_container()
 		if first_container:
-			self.containers.remove(first_container)
-		self.containers.add(container)
+			containers.remove(first_container)
+		containers.add(container)
 
 
 	def add_container(self, container):
-		self.containers.add(container)
+		self.get_writable_state().containers.add(container)
 
 
 	def get_weight(self):
@@ -257,9 +318,9 @@ class Item(NamedDataElement):
 class ContainerItem(Item, ItemContainer):
 
 	def __init__(self, item_id, attributes, labels, size, writing, list_templates={}, copied_from=None):
+		ItemContainer.__init__(self)
 		Item.__init__(self, item_id=item_id, attributes=attributes, labels=labels, size=size, writing=writing,
 			list_templates=list_templates, copied_from=copied_from)
-		ItemContainer.__init__(self)
 
 
 	def break_open(self):
@@ -283,6 +344,15 @@ class ContainerItem(Item, ItemContainer):
 		return ItemContainer.allows_burning(self)
 
 
+	def contents_changed(self):
+		self.update_environment()
+
+
+	def propagate_contents(self, delta, sign):
+		for container in self.containers:
+			container.update_contents(delta, sign)
+
+
 	def is_essential(self):
 		if Item.is_essential(self):
 			return True
@@ -308,25 +378,11 @@ class ContainerItem(Item, ItemContainer):
 
 
 	def contains(self, item):
-		if self.has_items():
-			inner_item = self.get_contained_item()
-
-			if item == inner_item:
-				return True
-			return inner_item.contains(item)
-
-		return False
+		return ItemContainer.contains(self, item)
 
 
 	def get_allow_copy(self, item):
-		if self.has_items():
-			inner_item = self.get_contained_item()
-
-			if inner_item.is_allow_copy(item):
-				return inner_item
-			return inner_item.get_allow_copy(item)
-
-		return None
+		return ItemContainer.get_allow_copy(self, item)
 
 
 	def get_contained_item(self):
@@ -340,9 +396,9 @@ class ContainerItem(Item, ItemContainer):
 class SentientItem(ItemContainer, Item):
 
 	def __init__(self, item_id, attributes, labels, size, writing, list_templates={}, copied_from=None):
+		ItemContainer.__init__(self)
 		Item.__init__(self, item_id=item_id, attributes=attributes, labels=labels, size=size, writing=writing,
 			list_templates=list_templates, copied_from=copied_from)
-		ItemContainer.__init__(self)
 
 
 	def gives_air(self):
@@ -352,6 +408,15 @@ class SentientItem(ItemContainer, Item):
 		return ItemContainer.gives_air(self)
 
 
+	def contents_changed(self):
+		self.update_environment()
+
+
+	def propagate_contents(self, delta, sign):
+		for container in self.containers:
+			container.update_contents(delta, sign)
+
+
 	def get_list_name(self, list_template_type, indentation=1):
 
 		result = Item.get_list_name(self, list_template_type, indentation)
@@ -430,11 +495,29 @@ class SwitchableItem(Item):
 
 class UsableItem(Item):
 
+	_being_used = StateField()
+
 	def __init__(self, item_id, attributes, labels, size, writing, list_templates, attribute_activated, copied_from=None):
+		self.attribute_activated = attribute_activated
+		self.base_state._being_used = False
 		Item.__init__(self, item_id=item_id, attributes=attributes, labels=labels, size=size, writing=writing,
 			list_templates=list_templates, copied_from=copied_from)
-		self.attribute_activated = attribute_activated
-		self.being_used = False
+
+
+	@property
+	def being_used(self):
+		return self._being_used
+
+
+	@being_used.setter
+	def being_used(self, being_used):
+		previous_weight = self.get_weight()
+		self._being_used = being_used
+		for container in self.containers:
+			container.update_weight(previous_weight, self.get_weight())
+		self.update_environment()
+		self.update_categories()
+		self.description_changed()
 
 
 	def has_attribute(self, attribute):
@@ -1,9 +1,34 @@
 from copy import copy
 
-class ItemContainer:
+from adventure.world_instance import StateField, Stateful
+
+class ItemContainer(Stateful):
+
+	PROVIDES_LIGHT = 0x1
+	PROVIDES_AIR = 0x2
+	PROVIDES_GRAVITY = 0x4
+	PROVIDES_LAND = 0x8
+	PROVIDED = [PROVIDES_LIGHT, PROVIDES_AIR, PROVIDES_GRAVITY, PROVIDES_LAND]
+
+	CATEGORY_NON_SILENT = 0x1
+	CATEGORY_COLLECTIBLE = 0x2
+	CATEGORIES = [CATEGORY_NON_SILENT, CATEGORY_COLLECTIBLE]
+
+	items = StateField()
+	provider_counts = StateField()
+	category_counts = StateField()
+	obstructions = StateField()
+	contents_counts = StateField()
+	copy_index = StateField()
 
 	def __init__(self):
-		self.items = set()
+		state = self.base_state
+		state.items = set()
+		state.provider_counts = dict.fromkeys(ItemContainer.PROVIDED, 0)
+		state.category_counts = dict.fromkeys(ItemContainer.CATEGORIES, 0)
+		state.obstructions = set()
+		state.contents_counts = {}
+		state.copy_index = {}
 
 
 	def has_items(self):
@@ -11,52 +36,150 @@ class ItemContainer:
 
 
 	def contains(self, item):
-		for contained_item in self.items:
-			if item == contained_item or contained_item.contains(item):
-				return True
-		return False
+		return item in self.contents_counts
 
 
 	def get_allow_copy(self, item):
-		for contained_item in self.items:
-			if contained_item.is_allow_copy(item):
-				return contained_item
-			inner_contained_item = contained_item.get_allow_copy(item)
-			if inner_contained_item:
-				return inner_contained_item
+		if item in self.contents_counts:
+			return item
+		copies = self.copy_index.get(item)
+		if copies:
+			return next(iter(copies))
 		return None
 
 
 	def insert(self, item):
 		if item.is_copyable():
 			item = copy(item)
-		self.items.add(item)
+		self.add_item(item)
 		item.update_container(self)
 
 
 	def add(self, item):
-		self.items.add(item)
+		self.add_item(item)
 		item.add_container(self)
 
 
 	def remove(self, item):
-		self.items.discard(item)
+		if item in self.items:
+			state = self.get_writable_state()
+			state.items.remove(item)
+			state.obstructions.discard(item)
+			self.update_provider_counts(item.environment, 0)
+			self.update_category_counts(item.categories, 0)
+			self.update_contents(self.get_contents_delta(item), -1)
+
+
+	def clear_items(self):
+		delta = self.contents_counts
+		self.items = set()
+		self.provider_counts = dict.fromkeys(ItemContainer.PROVIDED, 0)
+		self.category_counts = dict.fromkeys(ItemContainer.CATEGORIES, 0)
+		self.obstructions = set()
+		self.contents_counts = {}
+		self.copy_index = {}
+		self.contents_changed()
+		self.propagate_contents(delta, -1)
+
+
+	def add_item(self, item):
+		if not item in self.items:
+			state = self.get_writable_state()
+			state.items.add(item)
+			if item.is_obstruction():
+				state.obstructions.add(item)
+			self.update_provider_counts(0, item.environment)
+			self.update_category_counts(0, item.categories)
+			self.update_contents(self.get_contents_delta(item), 1)
+
+
+	def get_contents_delta(self, item):
+		delta = {item : 1}
+		if isinstance(item, ItemContainer):
+			for contained_item, count in item.contents_counts.items():
+				delta[contained_item] = delta.get(contained_item, 0) + count
+		return delta
+
+
+	# Indexes every item within at any depth, and the copies of each original
+	def update_contents(self, delta, sign):
+		state = self.get_writable_state()
+		for item, count in delta.items():
+			self.update_count(state.contents_counts, item, sign * count)
+			if item.copied_from:
+				self.update_count(state.copy_index.setdefault(item.copied_from, {}), item, sign * count)
+				if not state.copy_index[item.copied_from]:
+					del state.copy_index[item.copied_from]
+		self.propagate_contents(delta, sign)
+
+
+	def update_count(self, counts, item, change):
+		count = counts.get(item, 0) + change
+		if count > 0:
+			counts[item] = count
+		else:
+			counts.pop(item, None)
+
+
+	def propagate_contents(self, delta, sign):
+		pass
+
+
+	# Counts the items directly inside that provide each part of the environment
+	def update_provider_counts(self, previous_environment, environment):
+		changed = previous_environment ^ environment
+		if not changed:
+			return
+
+		provider_counts = self.get_writable_state().provider_counts
+		for provided in ItemContainer.PROVIDED:
+			if changed & provided:
+				if environment & provided:
+					provider_counts[provided] += 1
+				else:
+					provider_counts[provided] -= 1
+
+		self.contents_changed()
+
+
+	# Counts the items directly inside in each category asked about every turn, and keeps the obstructions
+	def update_category_counts(self, previous_categories, categories):
+		changed = previous_categories ^ categories
+		if not changed:
+			return
+
+		category_counts = self.get_writable_state().category_counts
+		for category in ItemContainer.CATEGORIES:
+			if changed & category:
+				if categories & category:
+					category_counts[category] += 1
+				else:
+					category_counts[category] -= 1
+
+
+	def contents_changed(self):
+		pass
+
+
+	# Called when the weight of an item directly inside this container changes
+	def update_weight(self, previous_weight, weight):
+		pass
 
 
 	def gives_light(self):
-		return any(item.gives_light() for item in self.items)
+		return self.provider_counts[ItemContainer.PROVIDES_LIGHT] > 0
 
 
 	def gives_air(self):
-		return any(item.gives_air() for item in self.items)
+		return self.provider_counts[ItemContainer.PROVIDES_AIR] > 0
 
 
 	def gives_gravity(self):
-		return any(item.gives_gravity() for item in self.items)
+		return self.provider_counts[ItemContainer.PROVIDES_GRAVITY] > 0
 
 
 	def gives_land(self):
-		return any(item.gives_land() for item in self.items)
+		return self.provider_counts[ItemContainer.PROVIDES_LAND] > 0
 
 
 	def get_outermost_container(self):
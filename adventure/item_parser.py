@@ -252,6 +252,7 @@ class ItemParser:
 		for switching_item, switched_element_id in switched_element_ids.items():
 			if switched_element_id in elements_by_id:
 				switching_item.switched_element = elements_by_id[switched_element_id]
+				switching_item.switched_element.switching_items.append(switching_item)
 			else:
 				validation.append(Message(Message.ITEM_SWITCHABLE_INVALID_SWITCHED_ELEMENT, (switching_item.data_id,
 					switching_item.shortname, switched_element_id)))
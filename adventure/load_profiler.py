@@ -0,0 +1,102 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import time
+import tracemalloc
+
+PhaseRecord = namedtuple("PhaseRecord", "name wall_time cpu_time allocated peak")
+
+# Records wall time, cpu time and memory allocated by each loading phase, which must not overlap
+class LoadProfiler:
+
+	HEADER_TEMPLATE = "{0:<28}{1:>10}{2:>10}{3:>12}{4:>12}"
+	ROW_TEMPLATE = "{0:<28}{1:>10.3f}{2:>10.3f}{3:>12.1f}{4:>12.1f}"
+	TOTAL_NAME = "total"
+	BYTES_PER_KIB = 1024
+
+	def __init__(self):
+		self.records = []
+		self.started_tracing = False
+		self.memory_start = 0
+		self.memory_peak = 0
+
+
+	def start(self):
+		if not tracemalloc.is_tracing():
+			tracemalloc.start()
+			self.started_tracing = True
+		tracemalloc.reset_peak()
+		self.memory_start, self.memory_peak = tracemalloc.get_traced_memory()
+
+
+	def stop(self):
+		self.update_peak()
+		if self.started_tracing:
+			tracemalloc.stop()
+			self.started_tracing = False
+
+
+	# Each phase resets the traced peak, so the peak since start is kept here
+	def update_peak(self):
+		if tracemalloc.is_tracing():
+			_, memory_peak = tracemalloc.get_traced_memory()
+			self.memory_peak = max(self.memory_peak, memory_peak)
+
+
+	@contextmanager
+	def phase(self, name):
+		self.update_peak()
+		tracemalloc.reset_peak()
+		memory_start, _ = tracemalloc.get_traced_memory()
+		wall_start = time.perf_counter()
+		cpu_start = time.thread_time()
+
+		try:
+			yield
+		finally:
+			cpu_time = time.thread_time() - cpu_start
+			wall_time = time.perf_counter() - wall_start
+			memory_end, memory_peak = tracemalloc.get_traced_memory()
+			self.memory_peak = max(self.memory_peak, memory_peak)
+			self.records.append(PhaseRecord(
+				name=name,
+				wall_time=wall_time,
+				cpu_time=cpu_time,
+				allocated=memory_end - memory_start,
+				peak=memory_peak - memory_start,
+			))
+
+
+	def get_total(self):
+		return PhaseRecord(
+			name=LoadProfiler.TOTAL_NAME,
+			wall_time=sum(record.wall_time for record in self.records),
+			cpu_time=sum(record.cpu_time for record in self.records),
+			allocated=sum(record.allocated for record in self.records),
+			peak=self.memory_peak - self.memory_start,
+		)
+
+
+	def format_table(self):
+		lines = [LoadProfiler.HEADER_TEMPLATE.format("phase", "wall (s)", "cpu (s)", "alloc (KiB)", "peak (KiB)")]
+		for record in self.records + [self.get_total()]:
+			lines.append(LoadProfiler.ROW_TEMPLATE.format(
+				record.name,
+				record.wall_time,
+				record.cpu_time,
+				record.allocated / LoadProfiler.BYTES_PER_KIB,
+				record.peak / LoadProfiler.BYTES_PER_KIB,
+			))
+		return "\n".join(lines)
+
+
+	def to_json(self):
+		return {
+			"phases" : [record._asdict() for record in self.records],
+			"total" : self.get_total()._asdict(),
+		}
+
+
+	def write_json(self, filename):
+		with open(filename, "w") as output_file:
+			json.dump(self.to_json(), output_file, indent=2)
@@ -1,6 +1,7 @@
 from adventure.direction import Direction
 from adventure.element import NamedDataElement
 from adventure.item_container import ItemContainer
+from adventure.world_instance import StateField
 
 class Location(NamedDataElement, ItemContainer):
 
@@ -13,30 +14,58 @@ class Location(NamedDataElement, ItemContainer):
 	ATTRIBUTE_HAS_LAND = 0x400
 	ATTRIBUTE_HAS_WATER = 0x800
 
+	directions = StateField()
+	seen = StateField()
+	description_version = StateField()
+
 	def __init__(self, location_id, attributes, labels):
 		NamedDataElement.__init__(self, data_id=location_id, attributes=attributes, labels=labels)
 		ItemContainer.__init__(self)
-		self.directions = {}
-		self.seen = False
+		state = self.base_state
+		state.directions = {}
+		state.seen = False
+		state.description_version = object()
+		self.rendered_version = None
+		self.rendered_descriptions = None
 
 
 	def get_adjacent_location(self, direction):
 		return self.directions.get(direction)
 
 
+	def link(self, direction, destination):
+		self.get_writable_state().directions[direction] = destination
+
+
+	def unlink(self, direction):
+		self.get_writable_state().directions.pop(direction, None)
+
+
 	def get_full_description(self):
-		return [self.get_description(), self.get_contents_description()]
+		return list(self.get_rendered_descriptions())
 
 
 	def get_arrival_description(self, verbose):
-		description = ""
+		description, contents_description = self.get_rendered_descriptions()
 
 		if self.seen and not verbose:
 			description = self.longname
-		else:
-			description = self.get_description()
 
-		return [description, self.get_contents_description()]
+		return [description, contents_description]
+
+
+	# Rendered descriptions are kept until the description version changes
+	def get_rendered_descriptions(self):
+		description_version = self.description_version
+		if self.rendered_version is not description_version:
+			self.rendered_descriptions = (self.get_description(), self.get_contents_description())
+			self.rendered_version = description_version
+		return self.rendered_descriptions
+
+
+	# A new object, so that no other state's version ever matches it
+	def description_changed(self):
+		self.description_version = object()
 
 
 	def get_description(self):
@@ -44,11 +73,12 @@ class Location(NamedDataElement, ItemContainer):
 
 
 	def get_contents_description(self):
-		result = ""
-		for item in self.items:
-			if not item.is_silent():
-				result += item.get_list_name_location()
-		return result
+		return "".join(item.get_list_name_location() for item in self.items if not item.is_silent())
+
+
+	# Locations are outermost, so changes to their contents at any depth end here
+	def propagate_contents(self, delta, sign):
+		self.description_changed()
 
 
 	def get_drop_location(self):
@@ -108,11 +138,11 @@ class Location(NamedDataElement, ItemContainer):
 
 
 	def get_obstructions(self):
-		return [item for item in self.items if item.is_obstruction()]
+		return list(self.obstructions)
 
 
 	def count_collectibles(self):
-		return sum(1 for item in self.items if item.is_collectible())
+		return self.category_counts[ItemContainer.CATEGORY_COLLECTIBLE]
 
 
 	def can_reach(self, other_location):
@@ -120,4 +150,4 @@ class Location(NamedDataElement, ItemContainer):
 
 
 	def has_non_silent_items(self):
-		return any(not item.is_silent() for item in self.items)
+		return self.category_counts[ItemContainer.CATEGORY_NON_SILENT] > 0
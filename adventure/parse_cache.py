@@ -0,0 +1,74 @@
+import copyreg
+import os
+import pickle
+import tempfile
+
+from adventure.file_digest import FileDigest
+from adventure.location import Location
+from adventure.world_instance import ElementState
+
+class ParseCache:
+
+	ENGINE_VERSION = 12
+	ENTRY_FILENAME_TEMPLATE = "{0}-v{1}.pickle"
+
+	def __init__(self, cache_dir):
+		self.cache_dir = cache_dir
+
+
+	def get_key(self, filename):
+		return ParseCache.ENTRY_FILENAME_TEMPLATE.format(FileDigest.get_hexdigest(filename), ParseCache.ENGINE_VERSION)
+
+
+	def get_path(self, key):
+		return os.path.join(self.cache_dir, key)
+
+
+	def load(self, key):
+		try:
+			with open(self.get_path(key), "rb") as cache_file:
+				unpickler = pickle.Unpickler(cache_file)
+				entry = unpickler.load()
+				deferred_links = unpickler.load()
+			for location, directions in deferred_links:
+				location.base_state.directions = directions
+		# Unpickling can raise almost anything for an entry written by other code, and any entry that fails is parsed again
+		except Exception:
+			return None
+
+		return entry
+
+
+	def store(self, key, entry):
+		os.makedirs(self.cache_dir, exist_ok=True)
+		temp_fd, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+		try:
+			with os.fdopen(temp_fd, "wb") as cache_file:
+				pickler = ParseCachePickler(cache_file)
+				pickler.dump(entry)
+				pickler.dump(pickler.deferred_links)
+			os.replace(temp_path, self.get_path(key))
+		except:
+			os.unlink(temp_path)
+			raise
+
+
+# Location links are written after the rest of the world, so pickling does not recurse along them
+class ParseCachePickler(pickle.Pickler):
+
+	def __init__(self, cache_file):
+		pickle.Pickler.__init__(self, cache_file, pickle.HIGHEST_PROTOCOL)
+		self.deferred_links = []
+
+
+	def reducer_override(self, obj):
+		if not isinstance(obj, Location):
+			return NotImplemented
+
+		base_state = ElementState()
+		base_state.__dict__.update(obj.base_state.__dict__)
+		self.deferred_links.append((obj, base_state.__dict__.pop("directions")))
+
+		state = obj.__dict__.copy()
+		state["base_state"] = base_state
+		return copyreg.__newobj__, (type(obj),), state
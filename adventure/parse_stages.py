@@ -0,0 +1,65 @@
+from collections import namedtuple
+import time
+
+ParseStage = namedtuple("ParseStage", "name dependencies function")
+StageTiming = namedtuple("StageTiming", "start end")
+
+# Runs parse stages one at a time, each once the stages it depends on have finished
+class StageRunner:
+
+	TIMING_TEMPLATE = "{0:<16}{1:>10.3f}{2:>10.3f}{3:>10.3f}{4}"
+	CRITICAL_PATH_TEMPLATE = "{0:<36}{1:>10.3f}"
+	CRITICAL_PATH_MARKER = " *"
+
+	def __init__(self):
+		self.timings = {}
+		self.dependencies = {}
+
+
+	def run(self, stages):
+		results = {}
+		pending = list(stages)
+		self.timings = {}
+		self.dependencies = {stage.name : stage.dependencies for stage in stages}
+		self.start_time = time.perf_counter()
+
+		while pending:
+			ready = [stage for stage in pending if all(dependency in results for dependency in stage.dependencies)]
+			if not ready:
+				raise ValueError("Unresolvable parse stage dependencies: {0}.".format(
+					", ".join(sorted(stage.name for stage in pending))))
+
+			for stage in ready:
+				dependency_results = {dependency : results[dependency] for dependency in stage.dependencies}
+				results[stage.name] = self.run_stage(stage, dependency_results)
+				pending.remove(stage)
+
+		return results
+
+
+	def run_stage(self, stage, dependency_results):
+		start = time.perf_counter()
+		result = stage.function(dependency_results)
+		end = time.perf_counter()
+		self.timings[stage.name] = StageTiming(start=start - self.start_time, end=end - self.start_time)
+		return result
+
+
+	# The chain of dependent stages taking longest in total, which no ordering of the stages could shorten
+	def get_critical_path(self):
+		paths = {}
+		# Stages are timed in the order they ran, so each comes after its dependencies
+		for name, timing in self.timings.items():
+			elapsed, path = max((paths[dependency] for dependency in self.dependencies[name]), default=(0.0, []))
+			paths[name] = (elapsed + timing.end - timing.start, path + [name])
+		return max(paths.values(), default=(0.0, []))
+
+
+	def format_timings(self):
+		critical_elapsed, critical_path = self.get_critical_path()
+		lines = ["{0:<16}{1:>10}{2:>10}{3:>10}".format("stage", "start", "end", "elapsed")]
+		for name, timing in sorted(self.timings.items(), key=lambda item: item[1].start):
+			marker = StageRunner.CRITICAL_PATH_MARKER if name in critical_path else ""
+			lines.append(StageRunner.TIMING_TEMPLATE.format(name, timing.start, timing.end, timing.end - timing.start, marker))
+		lines.append(StageRunner.CRITICAL_PATH_TEMPLATE.format("critical path", critical_elapsed))
+		return "\n".join(lines)
@@ -1,5 +1,6 @@
 from adventure.element import DataElement
 from adventure.inventory import Inventory
+from adventure.world_instance import OwnStateField, Stateful, current_instance
 
 class Player(DataElement):
 
@@ -29,6 +30,29 @@ class Player(DataElement):
 		self.inventories_by_location_id = inventories_by_location_id
 
 
+	def __copy__(self):
+		return self.copy_as(type(self))
+
+
+	def copy_as(self, player_class):
+		player = player_class(self.data_id, self.attributes, self.location, self.essential_drop_location,
+			self.reincarnation_location, self.collectible_location, self.default_inventory, self.inventories_by_location_id)
+		player.drop_location = self.drop_location
+		player.previous_location = self.previous_location
+		player.score = self.score
+		player.current_command = self.current_command
+		player.current_args = list(self.current_args)
+		player.instructions = self.instructions
+		player.completed_events = set(self.completed_events)
+		player.solved_puzzles = set(self.solved_puzzles)
+		return player
+
+
+	# Mutable fields are changed in place through this, so that a journalled player can record them
+	def get_writable_state(self):
+		return self
+
+
 	def get_location_id(self):
 		return self.location.data_id
 
@@ -70,6 +94,15 @@ class Player(DataElement):
 		return self.inventories_by_location_id.get(location_id, self.default_inventory)
 
 
+	def get_inventory_by_id(self, inventory_id):
+		if self.default_inventory.data_id == inventory_id:
+			return self.default_inventory
+		for inventory in self.inventories_by_location_id.values():
+			if inventory.data_id == inventory_id:
+				return inventory
+		return None
+
+
 	def holding_items(self):
 		return self.get_inventory().has_items()
 
@@ -129,7 +162,7 @@ class Player(DataElement):
 
 
 	def complete_event(self, event_id):
-		self.completed_events.add(event_id)
+		self.get_writable_state().completed_events.add(event_id)
 
 
 	def count_solved_puzzles(self):
@@ -141,7 +174,7 @@ class Player(DataElement):
 
 
 	def solve_puzzle(self, event_id):
-		self.solved_puzzles.add(event_id)
+		self.get_writable_state().solved_puzzles.add(event_id)
 
 
 	def get_arrival_location_description(self):
@@ -248,3 +281,24 @@ class Player(DataElement):
 		self.set_alive(True)
 		self.location = self.reincarnation_location
 		self.previous_location = None
+
+
+# A player whose state is kept apart from it, so that a game's turn journal can record it
+class JournalledPlayer(Player, Stateful):
+
+	attributes = OwnStateField()
+	location = OwnStateField()
+	drop_location = OwnStateField()
+	previous_location = OwnStateField()
+	score = OwnStateField()
+	current_command = OwnStateField()
+	current_args = OwnStateField()
+	instructions = OwnStateField()
+	completed_events = OwnStateField()
+	solved_puzzles = OwnStateField()
+
+	def get_writable_state(self):
+		instance = current_instance.get()
+		if instance is None:
+			return self.base_state
+		return instance.get_own_writable_state(self)
@@ -0,0 +1,45 @@
+from collections import namedtuple
+import time
+
+ReplayStep = namedtuple("ReplayStep", "line response elapsed")
+ReplaySummary = namedtuple("ReplaySummary", "commands total mean slowest")
+
+# Plays transcripts through games spawned from one template, timing each command
+class TranscriptReplayer:
+
+	def __init__(self, template, journal_depth=0):
+		self.template = template
+		self.journal_depth = journal_depth
+
+
+	def read_transcript(self, filename):
+		with open(filename) as transcript_file:
+			return [line.rstrip("\n") for line in transcript_file if line.strip()]
+
+
+	def replay(self, lines):
+		game = self.template.spawn(self.journal_depth)
+		steps = []
+
+		for line in lines:
+			if not game.is_running():
+				break
+			start = time.perf_counter()
+			response = game.process_input(line)
+			steps.append(ReplayStep(line=line, response=response, elapsed=time.perf_counter() - start))
+
+		return steps
+
+
+	def replay_file(self, filename):
+		return self.replay(self.read_transcript(filename))
+
+
+	def summarize(self, steps):
+		total = sum(step.elapsed for step in steps)
+		return ReplaySummary(
+			commands=len(steps),
+			total=total,
+			mean=total / len(steps) if steps else 0.0,
+			slowest=max((step.elapsed for step in steps), default=0.0),
+		)
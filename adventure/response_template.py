@@ -0,0 +1,49 @@
+import string
+
+# A response parsed once into its literal text, with a placeholder for each field, and the index of each field's content
+class ResponseTemplate:
+
+	FORMATTER = string.Formatter()
+
+	def __init__(self, text):
+		self.text = text
+		self.literal = None
+		self.pattern = None
+		self.indexes = None
+		self.field_count = None
+
+		literals = []
+		indexes = []
+		literal = ""
+		for literal_text, field_name, format_spec, conversion in ResponseTemplate.FORMATTER.parse(text):
+			# Escaped braces split the literal text into several parts
+			literal += literal_text
+			if field_name is None:
+				continue
+			if not field_name.isdigit() or format_spec or conversion:
+				# Fields with names, attributes or formatting of their own are left to str.format
+				return
+			literals.append(literal)
+			indexes.append(int(field_name))
+			literal = ""
+
+		if not indexes:
+			self.literal = literal
+			return
+
+		literals.append(literal)
+		self.pattern = "%s".join(literal.replace("%", "%%") for literal in literals)
+		self.indexes = tuple(indexes)
+		# Contents given for exactly the fields in order need not be rearranged
+		if self.indexes == tuple(range(len(indexes))):
+			self.field_count = len(indexes)
+
+
+	def format(self, *contents):
+		if self.literal is not None:
+			return self.literal
+		if len(contents) == self.field_count:
+			return self.pattern % contents
+		if self.pattern is None:
+			return self.text.format(*contents)
+		return self.pattern % tuple([contents[index] for index in self.indexes])
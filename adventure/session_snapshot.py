@@ -0,0 +1,189 @@
+from copy import copy
+import json
+import zlib
+
+from adventure.direction import Direction
+from adventure.inventory import Inventory
+from adventure.item import Item, UsableItem
+from adventure.location import Location
+
+# Records how a spawned game differs from its template: its changed state and its player
+class SessionSnapshot:
+
+	FORMAT_VERSION = 1
+
+	def save(self, game):
+		if not game.instance:
+			raise ValueError("Only a game spawned from a world template can be saved.")
+
+		with game.activate():
+			copies_by_original = self.get_copies_by_original(game.instance)
+			copy_refs = {}
+			for original, copies in copies_by_original.items():
+				for i, item_copy in enumerate(copies):
+					copy_refs[item_copy] = [original.data_id, i]
+
+			content = {
+				"version" : SessionSnapshot.FORMAT_VERSION,
+				"copies" : [[original.data_id, len(copies)] for original, copies in copies_by_original.items()],
+				"elements" : self.save_elements(game.instance, copy_refs),
+				"player" : self.save_player(game.player),
+			}
+
+		return zlib.compress(json.dumps(content, separators=(",", ":")).encode("utf-8"))
+
+
+	def restore(self, template, snapshot):
+		content = json.loads(str(zlib.decompress(snapshot), "utf-8"))
+		if content.get("version") != SessionSnapshot.FORMAT_VERSION:
+			raise ValueError("Unsupported session snapshot version {0}.".format(content.get("version")))
+
+		game = template.spawn()
+		with game.activate():
+			copies = self.restore_copies(template.data, content["copies"])
+			self.restore_elements(template.data, game.player, copies, content["elements"])
+			self.restore_player(template.data, game.player, content["player"])
+
+		return game
+
+
+	def get_copies_by_original(self, instance):
+		copies_by_original = {}
+		for element in instance.states:
+			if isinstance(element, Item) and element.copied_from and not element.copied_from in copies_by_original:
+				copies_by_original[element.copied_from] = list(element.copied_from.copied_to)
+		return copies_by_original
+
+
+	def get_ref(self, element, copy_refs):
+		if isinstance(element, Item) and element.copied_from:
+			return copy_refs.get(element)
+		return element.data_id
+
+
+	def save_elements(self, instance, copy_refs):
+		element_records = []
+
+		for element, state in instance.states.items():
+			# The player is saved on its own, and inventories hold nothing but their items
+			if not isinstance(element, (Location, Item)):
+				continue
+
+			ref = self.get_ref(element, copy_refs)
+			if ref is None:
+				# A copy that has since been destroyed
+				continue
+
+			record = self.save_element(element, state, copy_refs, isinstance(ref, list))
+			if record:
+				element_records.append([ref, record])
+
+		return element_records
+
+
+	def save_element(self, element, state, copy_refs, is_copy):
+		base_state = element.base_state
+		changed = {name for name, value in state.__dict__.items() if is_copy or value != base_state.__dict__.get(name)}
+		record = {}
+
+		if "attributes" in changed:
+			record["attributes"] = state.attributes
+		if "extended_description_index" in changed:
+			record["extended_description_index"] = state.extended_description_index
+
+		if isinstance(element, Location):
+			if "seen" in changed:
+				record["seen"] = state.seen
+			directions = self.save_directions(state.directions, base_state.directions)
+			if directions:
+				record["directions"] = directions
+
+		if isinstance(element, Item):
+			if "containers" in changed:
+				record["containers"] = [self.get_ref(container, copy_refs) for container in state.containers
+					if not isinstance(container, Inventory)]
+				record["inventories"] = [container.data_id for container in state.containers if isinstance(container, Inventory)]
+			if isinstance(element, UsableItem) and "_being_used" in changed:
+				record["being_used"] = state._being_used
+
+		return record
+
+
+	def save_directions(self, directions, base_directions):
+		changed_directions = {}
+		for direction in set(directions) | set(base_directions):
+			destination = directions.get(direction)
+			if destination is not base_directions.get(direction):
+				changed_directions[direction.value] = destination.data_id if destination else None
+		return changed_directions
+
+
+	def save_player(self, player):
+		return {
+			"attributes" : player.attributes,
+			"location" : player.location.data_id,
+			"previous_location" : player.previous_location.data_id if player.previous_location else None,
+			"drop_location" : player.drop_location.data_id,
+			"score" : player.score,
+			"instructions" : player.instructions,
+			"completed_events" : sorted(player.completed_events),
+			"solved_puzzles" : sorted(player.solved_puzzles),
+		}
+
+
+	def restore_copies(self, data, copy_inputs):
+		copies = {}
+		for original_id, count in copy_inputs:
+			original = data.get_element_by_id(original_id)
+			for i in range(count):
+				copies[(original_id, i)] = copy(original)
+		return copies
+
+
+	def get_element(self, data, copies, ref):
+		if isinstance(ref, list):
+			return copies[tuple(ref)]
+		return data.get_element_by_id(ref)
+
+
+	def restore_elements(self, data, player, copies, element_inputs):
+		for ref, record in element_inputs:
+			element = self.get_element(data, copies, ref)
+
+			if "attributes" in record:
+				element.attributes = record["attributes"]
+				element.attributes_changed()
+			if "extended_description_index" in record:
+				element.set_extended_description_index(record["extended_description_index"])
+			if "seen" in record:
+				element.seen = record["seen"]
+			for direction_value, destination_id in record.get("directions", {}).items():
+				direction = Direction(int(direction_value))
+				if destination_id is None:
+					element.unlink(direction)
+				else:
+					element.link(direction, data.get_location(destination_id))
+			if "being_used" in record:
+				element.being_used = record["being_used"]
+			if "containers" in record:
+				self.restore_containers(data, player, copies, element, record)
+
+
+	def restore_containers(self, data, player, copies, item, record):
+		item.remove_from_containers()
+		item.containers = set()
+		for ref in record["containers"]:
+			self.get_element(data, copies, ref).add(item)
+		for inventory_id in record["inventories"]:
+			player.get_inventory_by_id(inventory_id).add(item)
+
+
+	def restore_player(self, data, player, player_input):
+		player.attributes = player_input["attributes"]
+		player.location = data.get_location(player_input["location"])
+		player.previous_location = data.get_location(player_input["previous_location"])
+		player.drop_location = data.get_location(player_input["drop_location"])
+		player.score = player_input["score"]
+		player.instructions = player_input["instructions"]
+		player.completed_events = set(player_input["completed_events"])
+		player.solved_puzzles = set(player_input["solved_puzzles"])
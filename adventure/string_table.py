@@ -0,0 +1,111 @@
+import struct
+
+class StringTable:
+
+	COUNT = struct.Struct("<I")
+	OFFSET = struct.Struct("<I")
+	SPAN = struct.Struct("<II")
+
+	def __init__(self, buffer, offset):
+		self.buffer = buffer
+		(count,) = StringTable.COUNT.unpack_from(buffer, offset)
+		self.count = count
+		self.offsets_start = offset + StringTable.COUNT.size
+		self.content_start = self.offsets_start + (count + 1) * StringTable.OFFSET.size
+
+
+	def get(self, index):
+		start, end = self.get_span(index)
+		return str(self.buffer[start:end], "utf-8")
+
+
+	def get_span(self, index):
+		start, end = StringTable.SPAN.unpack_from(self.buffer, self.offsets_start + index * StringTable.OFFSET.size)
+		return self.content_start + start, self.content_start + end
+
+
+	def is_empty(self, index):
+		start, end = self.get_span(index)
+		return start == end
+
+
+	def get_reference(self, index):
+		return StringReference(self, index)
+
+
+# Stands in for a str whose text stays in the table until it is rendered
+class StringReference:
+
+	__slots__ = ("table", "index")
+
+	def __init__(self, table, index):
+		self.table = table
+		self.index = index
+
+
+	def resolve(self):
+		return self.table.get(self.index)
+
+
+	def __str__(self):
+		return self.resolve()
+
+
+	def __repr__(self):
+		return "StringReference({0!r})".format(self.resolve())
+
+
+	def __format__(self, format_spec):
+		return format(self.resolve(), format_spec)
+
+
+	def __add__(self, other):
+		return self.resolve() + other
+
+
+	def __radd__(self, other):
+		return other + self.resolve()
+
+
+	def __bool__(self):
+		return not self.table.is_empty(self.index)
+
+
+	def __len__(self):
+		return len(self.resolve())
+
+
+	def __eq__(self, other):
+		if isinstance(other, StringReference):
+			other = other.resolve()
+		return self.resolve() == other
+
+
+	def __hash__(self):
+		return hash(self.resolve())
+
+
+class StringTableBuilder:
+
+	def __init__(self):
+		self.indexes = {}
+		self.strings = []
+
+
+	def add(self, text):
+		index = self.indexes.get(text)
+		if index is None:
+			index = len(self.strings)
+			self.indexes[text] = index
+			self.strings.append(text.encode("utf-8"))
+		return index
+
+
+	def to_bytes(self):
+		offsets = [0]
+		for encoded in self.strings:
+			offsets.append(offsets[-1] + len(encoded))
+
+		header = StringTable.COUNT.pack(len(self.strings))
+		offset_table = struct.pack("<{0}I".format(len(offsets)), *offsets)
+		return header + offset_table + b"".join(self.strings)
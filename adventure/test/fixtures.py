@@ -0,0 +1,7 @@
+import os
+
+GAME_FILENAME = os.path.join(os.path.dirname(__file__), "data", "game.json")
+
+# Items in a container are held in a set, so listings may come out in any order
+def get_lines(game, line):
+	return sorted(game.process_input(line).split("\n"))
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from adventure.benchmark import Benchmark
+from adventure.data_parser import DataParser
+from adventure.load_profiler import LoadProfiler
+from adventure.world_generator import WorldGenerator
+
+class TestBenchmark(unittest.TestCase):
+
+	def setUp(self):
+		self.benchmark = Benchmark(sizes=[(20, 200)], samples=3, seed=1)
+
+
+	def test_run(self):
+		results = self.benchmark.run()
+
+		self.assertEqual(Benchmark.FORMAT_VERSION, results["version"])
+		metrics = results["sizes"]["20x200"]
+		self.assertGreater(metrics["decode.throughput"], 0)
+		self.assertGreater(metrics["parse.seconds"], 0)
+		self.assertGreater(metrics["parse.peak"], 0)
+		for name in ["look", "inventory", "go", "take", "drop", "empty", "insert", "rub"]:
+			self.assertGreater(metrics["command.{0}.p50".format(name)], 0)
+			self.assertGreaterEqual(metrics["command.{0}.p99".format(name)], metrics["command.{0}.p50".format(name)])
+
+
+	def test_scenarios_succeed(self):
+		generator = WorldGenerator(20, 200, 1)
+		world = generator.generate()
+		with tempfile.TemporaryDirectory() as world_dir:
+			filename = os.path.join(world_dir, "game")
+			generator.write(filename)
+			template = DataParser().parse_template(filename)
+
+		responses = {}
+		for scenario in self.benchmark.get_scenarios(world):
+			game = template.spawn()
+			self.benchmark.move_player(game, scenario.location_id)
+			for _ in range(2):
+				for name, line in scenario.steps:
+					responses.setdefault(name, []).append(game.process_input(line))
+
+		self.assertEqual(["Taken.", "Taken."], responses["take"])
+		self.assertEqual(["Dropped.", "Dropped."], responses["drop"])
+		self.assertTrue(all(response.startswith("You empty") for response in responses["empty"]))
+		self.assertTrue(all(response.startswith("You put") for response in responses["insert"]))
+		self.assertEqual(["Something changes.", "Something changes."], responses["rub"])
+		self.assertTrue(all(response.startswith("You are in") for response in responses["go"]))
+
+
+	def test_measure_parse_peak_covers_all_phases(self):
+		with tempfile.TemporaryDirectory() as world_dir:
+			filename = os.path.join(world_dir, "game")
+			WorldGenerator(20, 200, 1).write(filename)
+			profiler = LoadProfiler()
+			DataParser(profiler=profiler).parse(filename)
+
+			_, metrics = self.benchmark.measure_parse(filename)
+
+		self.assertGreater(metrics["parse.peak"], max(record.peak for record in profiler.records))
+
+
+	def test_get_percentile(self):
+		values = [5, 1, 4, 2, 3, 6, 7, 8, 9, 10]
+
+		self.assertEqual(5, self.benchmark.get_percentile(values, 50))
+		self.assertEqual(9, self.benchmark.get_percentile(values, 90))
+		self.assertEqual(10, self.benchmark.get_percentile(values, 99))
+		self.assertEqual(3, self.benchmark.get_percentile([3], 50))
+
+
+	def test_compare_regression(self):
+		baseline = {"sizes": {"20x200": {"parse.seconds": 1.0, "command.take.p50": 0.001}}}
+		current = {"sizes": {"20x200": {"parse.seconds": 1.2, "command.take.p50": 0.00105}}}
+
+		regressions = self.benchmark.compare(baseline, current, 0.1)
+
+		self.assertEqual(1, len(regressions))
+		regression = regressions[0]
+		self.assertEqual(("20x200", "parse.seconds", 1.0, 1.2), regression[:4])
+		self.assertAlmostEqual(0.2, regression.change)
+
+
+	def test_compare_throughput(self):
+		baseline = {"sizes": {"20x200": {"decode.throughput": 100.0}}}
+
+		self.assertEqual(1, len(self.benchmark.compare(baseline, {"sizes": {"20x200": {"decode.throughput": 80.0}}})))
+		self.assertEqual([], self.benchmark.compare(baseline, {"sizes": {"20x200": {"decode.throughput": 150.0}}}))
+
+
+	def test_compare_missing(self):
+		baseline = {"sizes": {"20x200": {"parse.seconds": 1.0}}}
+		current = {"sizes": {"20x200": {"parse.seconds": 1.0, "parse.peak": 10}, "40x400": {"parse.seconds": 9.0}}}
+
+		self.assertEqual([], self.benchmark.compare(baseline, current))
+
+
+	def test_write_read(self):
+		results = {"version": Benchmark.FORMAT_VERSION, "sizes": {"20x200": {"parse.seconds": 1.0}}}
+
+		with tempfile.TemporaryDirectory() as output_dir:
+			filename = os.path.join(output_dir, "baseline.json")
+			self.benchmark.write(results, filename)
+
+			self.assertEqual(results, self.benchmark.read(filename))
+
+
+	def test_read_wrong_version(self):
+		with tempfile.TemporaryDirectory() as output_dir:
+			filename = os.path.join(output_dir, "baseline.json")
+			self.benchmark.write({"version": 0, "sizes": {}}, filename)
+
+			with self.assertRaises(ValueError):
+				self.benchmark.read(filename)
+
+
+if __name__ == "__main__":
+	unittest.main()
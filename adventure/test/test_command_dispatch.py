@@ -0,0 +1,76 @@
+import unittest
+
+from adventure.command import Command
+from adventure.command_dispatch import CommandDispatch
+
+class TestCommandDispatch(unittest.TestCase):
+
+	def setUp(self):
+		self.inventory_command = Command(26, 0x0, [], [], ["inventory", "i"], {})
+		self.insert_command = Command(25, 0x0, [], [], ["insert"], {})
+		self.north_command = Command(34, 0x40, [], [], ["north", "n"], {})
+		self.node_command = Command(68, 0x10, [], [], ["node"], {})
+		self.say_command = Command(51, 0x4, [], [], ["say", "shout"], {})
+		self.switch_command = Command(61, 0x200, [], [], ["switch"], {})
+
+		commands_by_name = {}
+		for command in [self.inventory_command, self.insert_command, self.north_command, self.node_command,
+				self.say_command, self.switch_command]:
+			for alias in command.aliases:
+				commands_by_name[alias] = command
+
+		item_related_commands = {
+			"lamp" : self.switch_command,
+			"inventory" : self.switch_command,
+		}
+
+		self.dispatch = CommandDispatch(commands_by_name, item_related_commands)
+
+
+	def test_get_alias(self):
+		self.assertEqual((self.inventory_command, 1), self.dispatch.get("inventory"))
+		self.assertEqual((self.inventory_command, 1), self.dispatch.get("i"))
+
+
+	def test_get_alias_verb_is_first_arg(self):
+		self.assertEqual((self.say_command, 0), self.dispatch.get("say"))
+
+
+	def test_get_item_related(self):
+		self.assertEqual((self.switch_command, 0), self.dispatch.get("lamp"))
+
+
+	def test_get_alias_before_item_related(self):
+		self.assertEqual((self.inventory_command, 1), self.dispatch.get("inventory"))
+
+
+	def test_get_abbreviation_unique(self):
+		self.assertEqual((self.inventory_command, 1), self.dispatch.get("inv"))
+		self.assertEqual((self.insert_command, 1), self.dispatch.get("ins"))
+		self.assertEqual((self.north_command, 1), self.dispatch.get("no"))
+		self.assertEqual((self.switch_command, 1), self.dispatch.get("sw"))
+
+
+	def test_get_abbreviation_ambiguous(self):
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("in"))
+
+
+	def test_get_abbreviation_secret(self):
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("nod"))
+
+
+	def test_get_abbreviation_verb_is_first_arg(self):
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("sa"))
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("sho"))
+
+
+	def test_get_abbreviation_longer_than_alias(self):
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("inventoryx"))
+
+
+	def test_get_unknown(self):
+		self.assertEqual(CommandDispatch.NO_ENTRY, self.dispatch.get("xyzzy"))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -5,6 +5,7 @@ from adventure.command import Command
 from adventure.command_runner import CommandRunner
 from adventure.element import Labels
 from adventure.item import Item
+from adventure.text_collection import TextCollection
 
 class TestCommandRunner(unittest.TestCase):
 
@@ -15,10 +16,10 @@ class TestCommandRunner(unittest.TestCase):
 
 	def setup_data(self):
 		self.data = Mock()
-		self.data.get_response.side_effect = lambda x: {
+		self.data.get_response_template.side_effect = TextCollection({
 			"confirm" : "Action \"{0}\" successful.",
 			"reject" : "Action unsuccessful.",
-		}.get(x)
+		}).get_template
 
 
 	def arg_function_movement(self, command, player, *args):
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adventure.compiled_world import CompiledWorldReader, WorldCompiler
+from adventure.data_parser import DataParser
+from adventure.string_table import StringReference
+from adventure.test.fixtures import GAME_FILENAME, get_lines
+
+class TestCompiledWorld(unittest.TestCase):
+
+	def setUp(self):
+		self.output_dir = tempfile.mkdtemp()
+		self.artifact_filename = os.path.join(self.output_dir, "game.vdw")
+		self.json_content = DataParser().get_json_content(GAME_FILENAME, True)
+		WorldCompiler().write(self.json_content, self.artifact_filename)
+
+
+	def tearDown(self):
+		shutil.rmtree(self.output_dir)
+
+
+	def test_read_locations(self):
+		content = CompiledWorldReader().read(self.artifact_filename)
+
+		cave_input = content["locations"][0]
+		self.assertEqual(10, cave_input["data_id"])
+		self.assertEqual("707", cave_input["attributes"])
+		self.assertEqual({"up": 12}, cave_input["directions"])
+		self.assertEqual("Cave", cave_input["labels"]["shortname"])
+		self.assertIsInstance(cave_input["labels"]["longname"], StringReference)
+		self.assertEqual("in a cave", cave_input["labels"]["longname"])
+		self.assertEqual([". The walls are bare", ". The walls are glowing"], cave_input["labels"]["extended_descriptions"])
+
+
+	def test_read_items(self):
+		content = CompiledWorldReader().read(self.artifact_filename)
+
+		book_input = content["items"][0]
+		self.assertEqual(1105, book_input["data_id"])
+		self.assertEqual("2", book_input["attributes"])
+		self.assertEqual(2, book_input["size"])
+		self.assertEqual(["book"], book_input["labels"]["shortnames"])
+		self.assertEqual("a book of fairytales", book_input["labels"]["description"])
+		self.assertEqual("The Pied Piper", book_input["writing"])
+		self.assertEqual([11], book_input["container_ids"])
+		self.assertFalse("writing" in content["items"][1])
+
+
+	def test_read_texts_translated(self):
+		content = CompiledWorldReader().read(self.artifact_filename)
+
+		self.assertEqual("You are {0}.", content["responses"]["confirm_look"])
+		self.assertEqual("There is no hint for that.", content["hints"]["default"])
+
+
+	def test_compile_deduplicates_strings(self):
+		self.json_content["responses"]["describe_location"] = "You are $0."
+		self.json_content["responses"]["confirm_look"] = "You are $0."
+
+		compiled = WorldCompiler().compile(self.json_content)
+
+		self.assertEqual(1, compiled.count(b"You are {0}."))
+
+
+	def test_read_wrong_magic(self):
+		with open(self.artifact_filename, "r+b") as artifact_file:
+			artifact_file.write(b"JUNK")
+
+		with self.assertRaises(ValueError):
+			CompiledWorldReader().read(self.artifact_filename)
+
+
+	def test_parse_compiled_matches_text(self):
+		text_game = DataParser().parse(GAME_FILENAME, True)
+		compiled_game = DataParser().parse(self.artifact_filename, compiled_input=True)
+
+		self.assertEqual(text_game.get_start_message(), compiled_game.get_start_message())
+		for line in ["look", "take book", "read book", "s", "rub lamp", "look", "e", "inventory", "w", "s", "d", "score"]:
+			self.assertEqual(get_lines(text_game, line), get_lines(compiled_game, line))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,151 @@
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from adventure.data_parser import DataParser
+from adventure.test.fixtures import GAME_FILENAME
+from adventure.validation import ValidationMode
+from adventure.validation_stamp import ValidationStamp
+
+class TestDataParser(unittest.TestCase):
+
+	def setUp(self):
+		self.original_dir = os.getcwd()
+		self.output_dir = tempfile.mkdtemp()
+		os.chdir(self.output_dir)
+
+		with open(GAME_FILENAME) as game_file:
+			self.game_content = json.load(game_file)
+		self.filename = os.path.join(self.output_dir, "game.json")
+
+
+	def tearDown(self):
+		os.chdir(self.original_dir)
+		shutil.rmtree(self.output_dir)
+
+
+	def write_game(self):
+		with open(self.filename, "w") as game_file:
+			json.dump(self.game_content, game_file)
+
+
+	def add_duplicate_inventory(self):
+		self.game_content["inventories"].append(dict(self.game_content["inventories"][0]))
+
+
+	@patch("builtins.print")
+	def test_parse_full_invalid(self, mock_print):
+		self.add_duplicate_inventory()
+		self.write_game()
+
+		parser = DataParser()
+		parser.parse(self.filename, True)
+
+		self.assertTrue(parser.validation)
+		self.assertTrue(os.path.exists(DataParser.VALIDATION_MESSAGE_FILENAME))
+
+
+	def test_parse_restores_gc(self):
+		self.write_game()
+
+		DataParser().parse(self.filename, True)
+		self.assertTrue(gc.isenabled())
+
+		gc.disable()
+		try:
+			DataParser().parse(self.filename, True)
+			self.assertFalse(gc.isenabled())
+		finally:
+			gc.enable()
+
+
+	def test_validate(self):
+		self.add_duplicate_inventory()
+		self.write_game()
+
+		validation = DataParser().validate(self.filename, True)
+
+		self.assertEqual(["INVENTORY_SHARED_ID"], [message.get_key() for message in validation])
+		self.assertFalse(os.path.exists(DataParser.VALIDATION_MESSAGE_FILENAME))
+
+
+	def test_validate_invalid_response(self):
+		self.game_content["responses"]["confirm_dropped"] = "Dropped {0"
+		self.write_game()
+
+		validation = DataParser().validate(self.filename, True)
+
+		self.assertEqual(["RESPONSE_INVALID_TEMPLATE"], [message.get_key() for message in validation])
+
+
+	@patch("builtins.print")
+	def test_parse_background_invalid(self, mock_print):
+		self.add_duplicate_inventory()
+		self.write_game()
+
+		parser = DataParser(validation_mode=ValidationMode.BACKGROUND)
+		game = parser.parse(self.filename, True)
+		self.assertTrue(game.get_start_message())
+		parser.wait_for_validation()
+
+		self.assertTrue(parser.validation)
+		self.assertTrue(os.path.exists(DataParser.VALIDATION_MESSAGE_FILENAME))
+
+
+	def test_parse_background_valid(self):
+		self.write_game()
+
+		parser = DataParser(validation_mode=ValidationMode.BACKGROUND)
+		game = parser.parse(self.filename, True)
+		parser.wait_for_validation()
+
+		self.assertEqual([], parser.validation)
+		self.assertFalse(os.path.exists(DataParser.VALIDATION_MESSAGE_FILENAME))
+		self.assertEqual("You are at a lighthouse by the sea. Nearby:\n\ta book", game.process_input("look"))
+
+
+	@patch("adventure.data_parser.PostParseValidator")
+	def test_parse_prevalidated_marked(self, mock_validator_class):
+		self.write_game()
+		ValidationStamp(self.filename).write()
+
+		parser = DataParser(validation_mode=ValidationMode.PREVALIDATED)
+		parser.parse(self.filename, True)
+
+		self.assertIsNone(parser.validation)
+		mock_validator_class.assert_not_called()
+
+
+	@patch("builtins.print")
+	def test_parse_prevalidated_unmarked(self, mock_print):
+		self.add_duplicate_inventory()
+		self.write_game()
+
+		parser = DataParser(validation_mode=ValidationMode.PREVALIDATED)
+		parser.parse(self.filename, True)
+
+		self.assertTrue(parser.validation)
+		self.assertTrue(mock_print.call_args_list[0][0][0].endswith("is not marked as validated, validating in full."))
+		self.assertIs(sys.stderr, mock_print.call_args_list[0][1]["file"])
+
+
+	@patch("builtins.print")
+	def test_parse_cached_notices_on_stderr(self, mock_print):
+		self.write_game()
+		cache_dir = os.path.join(self.output_dir, "cache")
+
+		DataParser().parse(self.filename, True, cache_dir)
+		DataParser().parse(self.filename, True, cache_dir)
+
+		self.assertEqual(2, mock_print.call_count)
+		for call in mock_print.call_args_list:
+			self.assertIs(sys.stderr, call[1]["file"])
+
+
+if __name__ == "__main__":
+	unittest.main()
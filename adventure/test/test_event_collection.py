@@ -0,0 +1,118 @@
+from copy import copy
+import unittest
+
+from adventure.command import Command
+from adventure.element import Labels
+from adventure.event import Event, EventMatch, EventMatchArgument, EventMatchArgumentKind, EventOutcome
+from adventure.event_collection import EventCollection
+from adventure.item import Item
+
+class TestEventCollection(unittest.TestCase):
+
+	def setUp(self):
+		self.rub_command = Command(48, 0x0, [], [], ["rub"], {})
+		self.say_command = Command(51, 0x0, [], [], ["say"], {})
+		self.lamp = Item(1043, 0x2, Labels("lamp", "a lamp", "a small lamp"), 2, None, {})
+		self.potion = Item(1058, 0x900, Labels("potion", "some potion", "some magical potion"), 1, None, {})
+		self.water = Item(1109, 0x100, Labels("water", "some water", "some water"), 1, None, {})
+		self.book = Item(1044, 0x2, Labels("book", "a book", "a book of fairytales"), 2, None, {})
+
+		self.rub_lamp_event = self.create_event(3001, 0x4, self.rub_command, [self.create_item_argument(self.lamp)])
+		self.rub_potion_event = self.create_event(3002, 0x0, self.rub_command, [self.create_item_argument(self.potion)])
+		self.say_event = self.create_event(3003, 0x4, self.say_command,
+			[self.create_item_argument(self.lamp), EventMatchArgument(kind=EventMatchArgumentKind.TEXT, value="hello")])
+		self.no_command_event = self.create_event(3004, 0x4, None, [])
+
+		self.collection = EventCollection([self.rub_lamp_event, self.rub_potion_event, self.say_event, self.no_command_event])
+
+
+	def create_event(self, event_id, attributes, command, arguments):
+		match = EventMatch(command=command, arguments=arguments, prerequisites=[])
+		return Event(event_id=event_id, attributes=attributes, match=match, outcome=EventOutcome(text_key="event_key", actions=[]))
+
+
+	def create_item_argument(self, item):
+		return EventMatchArgument(kind=EventMatchArgumentKind.ITEM, value=item)
+
+
+	def create_class_argument(self, attribute=None):
+		if attribute:
+			return EventMatchArgument(kind=EventMatchArgumentKind.ATTRIBUTE, value=attribute)
+		return EventMatchArgument(kind=EventMatchArgumentKind.ANY, value=None)
+
+
+	def test_get_single_argument(self):
+		self.assertEqual([self.rub_lamp_event], self.collection.get(48, [self.lamp]))
+		self.assertEqual([self.rub_potion_event], self.collection.get(48, [self.potion]))
+
+
+	def test_get_copy_matches_original(self):
+		self.assertEqual([self.rub_potion_event], self.collection.get(48, [copy(self.potion)]))
+
+
+	def test_get_multiple_arguments(self):
+		self.assertEqual([self.say_event], self.collection.get(51, [self.lamp, "hello"]))
+		self.assertIsNone(self.collection.get(51, [self.lamp, "goodbye"]))
+
+
+	def test_get_unknown_command(self):
+		self.assertIsNone(self.collection.get(150, [self.lamp]))
+
+
+	def test_has_events(self):
+		self.assertTrue(self.collection.has_events(48))
+		self.assertFalse(self.collection.has_events(150))
+
+
+	def test_get_attribute_argument(self):
+		rub_liquid_event = self.create_event(3005, 0x0, self.rub_command, [self.create_class_argument(0x100)])
+		collection = EventCollection([self.rub_potion_event, rub_liquid_event])
+
+		self.assertEqual([rub_liquid_event], collection.get(48, [self.water]))
+		self.assertEqual([], collection.get(48, [self.book]))
+		self.assertEqual([], collection.get(48, ["hello"]))
+
+
+	def test_get_any_argument(self):
+		rub_any_event = self.create_event(3005, 0x0, self.rub_command, [self.create_class_argument()])
+		collection = EventCollection([rub_any_event])
+
+		self.assertEqual([rub_any_event], collection.get(48, [self.book]))
+		self.assertEqual([rub_any_event], collection.get(48, [copy(self.water)]))
+		self.assertEqual([], collection.get(48, ["hello"]))
+		self.assertEqual([], collection.get(48, []))
+
+
+	def test_get_exact_before_attribute_before_any(self):
+		rub_any_event = self.create_event(3005, 0x0, self.rub_command, [self.create_class_argument()])
+		rub_liquid_event = self.create_event(3006, 0x0, self.rub_command, [self.create_class_argument(0x100)])
+		collection = EventCollection([rub_any_event, rub_liquid_event, self.rub_potion_event])
+
+		self.assertEqual([self.rub_potion_event, rub_liquid_event, rub_any_event], collection.get(48, [self.potion]))
+		self.assertEqual([rub_liquid_event, rub_any_event], collection.get(48, [self.water]))
+		self.assertEqual([rub_any_event], collection.get(48, [self.lamp]))
+
+
+	def test_get_class_argument_with_exact_argument(self):
+		say_any_event = self.create_event(3005, 0x0, self.say_command,
+			[self.create_class_argument(), EventMatchArgument(kind=EventMatchArgumentKind.TEXT, value="hello")])
+		collection = EventCollection([say_any_event])
+
+		self.assertEqual([say_any_event], collection.get(51, [self.book, "hello"]))
+		self.assertEqual([], collection.get(51, [self.book, "goodbye"]))
+
+
+	def test_patterns_shared(self):
+		events = [self.create_event(3005 + i, 0x0, self.rub_command, [self.create_class_argument(0x100)]) for i in range(3)]
+		collection = EventCollection(events)
+
+		self.assertEqual([(("attribute", 0x100),)], collection.patterns[48])
+		self.assertEqual(events, collection.get(48, [self.water]))
+
+
+	def test_puzzle_count(self):
+		self.assertEqual(3, self.collection.puzzle_count)
+
+
+if __name__ == "__main__":
+	unittest.main()
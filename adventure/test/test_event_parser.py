@@ -9,6 +9,7 @@ from adventure.event import EventMatchPrerequisiteKind, ItemEventMatchPrerequisi
 from adventure.event_parser import EventParser
 from adventure.item import Item
 from adventure.location import Location
+from adventure.validation import Severity
 
 class TestEventParser(unittest.TestCase):
 
@@ -39,6 +40,7 @@ class TestEventParser(unittest.TestCase):
 	def setup_items(self):
 		self.book = self.book = Item(1043, 0x2, Labels("book", "a book", "a book of fairytales"), 2, "The Pied Piper", {})
 		self.bread = Item(1109, 0x2, Labels("bread", "some bread", "a loaf of bread"), 2, None, {})
+		self.potion = Item(1058, 0x102, Labels("potion", "some potion", "some magical potion"), 1, None, {})
 		self.items_by_id = {
 			1043 : self.book,
 			1044 : self.bread,
@@ -62,12 +64,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -109,12 +111,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48, self.book, "hello") in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48, self.book, "hello")]
+		events = collection.get(48, [self.book, "hello"])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -132,6 +134,98 @@ class TestEventParser(unittest.TestCase):
 		self.assertEqual(0, collection.puzzle_count)
 
 
+	def test_parse_with_class_match_args(self):
+		event_inputs = json.loads(
+			"[ \
+				{ \
+					\"data_id\": 3001, \
+					\"attributes\": \"0\", \
+					\"match\": { \
+						\"command_id\": 48, \
+						\"arguments\": [ \
+							{ \
+								\"kind\": \"any\" \
+							}, \
+							{ \
+								\"kind\": \"attribute\", \
+								\"value\": \"100\" \
+							} \
+						] \
+					}, \
+					\"outcome\": { \
+						\"text_key\" : \"event_genie_lamp\" \
+					} \
+				} \
+			]"
+		)
+
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+
+		events = collection.get(48, [self.book, self.potion])
+		self.assertEqual(1, len(events))
+
+		match = events[0].match
+		self.assertEqual(2, len(match.arguments))
+
+		any_argument = match.arguments[0]
+		self.assertEqual(EventMatchArgumentKind.ANY, any_argument.kind)
+		self.assertIsNone(any_argument.value)
+
+		attribute_argument = match.arguments[1]
+		self.assertEqual(EventMatchArgumentKind.ATTRIBUTE, attribute_argument.kind)
+		self.assertEqual(0x100, attribute_argument.value)
+		self.assertFalse(validation)
+
+
+	def test_parse_with_invalid_attribute_match_arg(self):
+		event_inputs = json.loads(
+			"[ \
+				{ \
+					\"data_id\": 3001, \
+					\"attributes\": \"0\", \
+					\"match\": { \
+						\"command_id\": 48, \
+						\"arguments\": [ \
+							{ \
+								\"kind\": \"attribute\", \
+								\"value\": \"lamp\" \
+							} \
+						] \
+					}, \
+					\"outcome\": { \
+						\"text_key\" : \"event_genie_lamp\" \
+					} \
+				}, \
+				{ \
+					\"data_id\": 3002, \
+					\"attributes\": \"0\", \
+					\"match\": { \
+						\"command_id\": 48, \
+						\"arguments\": [ \
+							{ \
+								\"kind\": \"item\", \
+								\"value\": 1043 \
+							} \
+						] \
+					}, \
+					\"outcome\": { \
+						\"text_key\" : \"event_book\" \
+					} \
+				} \
+			]"
+		)
+
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+
+		self.assertIsNone(collection.get(48, [self.potion]))
+		self.assertEqual(1, len(collection.get(48, [self.book])))
+		self.assertEqual(1, len(validation))
+		validation_line = validation[0]
+		self.assertEqual("Event {0} has an attribute match argument with invalid value \"{1}\". This event will be ignored.", validation_line.template)
+		self.assertEqual(Severity.ERROR, validation_line.severity)
+		self.assertEqual((3001, "lamp"), validation_line.args)
+
+
 	def test_parse_with_item_match_prerequisites(self):
 		event_inputs = json.loads(
 			"[ \
@@ -166,12 +260,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -220,12 +314,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -264,12 +358,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -330,13 +424,13 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(2, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
-		self.assertTrue((self.command_49,) in collection.events)
+		self.assertTrue(collection.has_events(48))
+		self.assertTrue(collection.has_events(49))
 
-		events_48 = collection.events[(self.command_48,)]
+		events_48 = collection.get(48, [])
 		self.assertEqual(2, len(events_48))
 
 		event_48_0 = events_48[0]
@@ -355,7 +449,7 @@ class TestEventParser(unittest.TestCase):
 		outcome = event_48_1.outcome
 		self.assertEqual("event_lamp_disappear", outcome.text_key)
 
-		events_49 = collection.events[(self.command_49,)]
+		events_49 = collection.get(49, [])
 		self.assertEqual(1, len(events_49))
 
 		event_49_0 = events_49[0]
@@ -403,12 +497,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -463,12 +557,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -515,12 +609,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -573,12 +667,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -631,12 +725,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -675,12 +769,12 @@ class TestEventParser(unittest.TestCase):
 			]"
 		)
 
-		collection = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
+		collection, validation = EventParser().parse(event_inputs, self.commands, self.items_by_id, self.locations_by_id)
 
 		self.assertEqual(1, len(collection.events))
-		self.assertTrue((self.command_48,) in collection.events)
+		self.assertTrue(collection.has_events(48))
 
-		events = collection.events[(self.command_48,)]
+		events = collection.get(48, [])
 		self.assertEqual(1, len(events))
 
 		event = events[0]
@@ -5,11 +5,12 @@ from unittest.mock import Mock
 from adventure.command import Command
 from adventure.direction import Direction
 from adventure.element import Labels
-from adventure.event import Event, EventMatch, EventOutcome, EventOutcomeActionKind, PlayerEventOutcomeAction, ItemEventOutcomeAction
+from adventure.event import Event, EventMatch, EventMatchArgument, EventMatchArgumentKind, EventOutcome, EventOutcomeActionKind, PlayerEventOutcomeAction, ItemEventOutcomeAction
 from adventure.event import LocationEventOutcomeAction, LinkEventOutcomeAction, DescriptionEventOutcomeAction
 from adventure.event import EventMatchPrerequisiteKind, ItemEventMatchPrerequisite, ItemEventMatchPrerequisiteContainer, ItemEventMatchPrerequisiteContainerKind
 from adventure.event import LocationEventMatchPrerequisite, EventEventMatchPrerequisite
 from adventure.event import ItemEventOutcomeActionDestination, ItemEventOutcomeActionDestinationKind
+from adventure.event_collection import EventCollection
 from adventure.event_resolver import EventResolver
 from adventure.item import Item, ContainerItem, SwitchableItem, SwitchInfo
 from adventure.location import Location
@@ -28,6 +29,7 @@ class TestEventResolver(unittest.TestCase):
 	def setup_data(self):
 		self.data = Mock()
 		self.setup_commands()
+		self.data.get_commands.return_value.commands_by_id = {}
 		self.setup_locations()
 		self.setup_items()
 
@@ -66,8 +68,26 @@ class TestEventResolver(unittest.TestCase):
 		self.player = Mock()
 
 
+	def create_item_arguments(self, *items):
+		return [EventMatchArgument(kind=EventMatchArgumentKind.ITEM, value=item) for item in items]
+
+
+	def test_init_data_skips_commands_without_events(self):
+		resolver = EventResolver()
+		handler_function = Mock()
+		self.rub_command.resolver_functions = [handler_function, resolver.resolve_event]
+		self.wave_command.resolver_functions = [handler_function, resolver.resolve_event]
+		self.data.get_commands.return_value.commands_by_id = {48 : self.rub_command, 150 : self.wave_command}
+		self.data.has_events.side_effect = lambda x: x == 48
+
+		resolver.init_data(self.data)
+
+		self.assertEqual([handler_function, resolver.resolve_event], self.rub_command.resolver_functions)
+		self.assertEqual([handler_function], self.wave_command.resolver_functions)
+
+
 	def test_resolve_event_without_match(self):
-		self.data.get_events.side_effect = lambda x: {}.get(x)
+		self.data.get_events.side_effect = EventCollection([]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -75,10 +95,10 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_match_to_non_copyable_item(self):
-		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=[self.lamp], prerequisites=[])
+		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=self.create_item_arguments(self.lamp), prerequisites=[])
 		rub_lamp_event_outcome = EventOutcome(text_key="event_response_key", actions=[])
 		rub_lamp_event = Event(event_id=3001, attributes=0x0, match=rub_lamp_event_match, outcome=rub_lamp_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.rub_command, self.lamp): [rub_lamp_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([rub_lamp_event]).get
 
 		response = self.resolver.resolve_event(self.rub_command, self.player, self.lamp)
 
@@ -86,10 +106,10 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_match_to_copyable_item(self):
-		drink_potion_event_match = EventMatch(command=self.drink_command, arguments=[self.potion], prerequisites=[])
+		drink_potion_event_match = EventMatch(command=self.drink_command, arguments=self.create_item_arguments(self.potion), prerequisites=[])
 		drink_potion_event_outcome = EventOutcome(text_key="event_response_key", actions=[])
 		drink_potion_event = Event(event_id=3002, attributes=0x0, match=drink_potion_event_match, outcome=drink_potion_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.drink_command, self.potion): [drink_potion_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([drink_potion_event]).get
 		potion_copy = copy(self.potion)
 
 		response = self.resolver.resolve_event(self.drink_command, self.player, potion_copy)
@@ -98,25 +118,57 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_match_to_two_args(self):
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
 
 		self.assertEqual((True, ["event_response_key"], [self.potion, self.bean], [self.potion, self.bean]), response)
 
 
+	def test_resolve_event_with_match_to_any_item(self):
+		wave_any_event_match = EventMatch(command=self.wave_command,
+			arguments=[EventMatchArgument(kind=EventMatchArgumentKind.ANY, value=None)], prerequisites=[])
+		wave_any_event_outcome = EventOutcome(text_key="event_any_key", actions=[])
+		wave_any_event = Event(event_id=3007, attributes=0x0, match=wave_any_event_match, outcome=wave_any_event_outcome)
+		self.data.get_events.side_effect = EventCollection([wave_any_event]).get
+
+		response = self.resolver.resolve_event(self.wave_command, self.player, self.bean)
+
+		self.assertEqual((True, ["event_any_key"], [self.bean], [self.bean]), response)
+
+
+	def test_resolve_event_with_exact_prerequisite_without_match_falls_back_to_any_item(self):
+		prerequisite = EventEventMatchPrerequisite(EventMatchPrerequisiteKind.EVENT, False, 3002)
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[prerequisite])
+		wave_wand_event_outcome = EventOutcome(text_key="event_wand_key", actions=[])
+		wave_wand_event = Event(event_id=3006, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
+		wave_any_event_match = EventMatch(command=self.wave_command,
+			arguments=[EventMatchArgument(kind=EventMatchArgumentKind.ANY, value=None)], prerequisites=[])
+		wave_any_event_outcome = EventOutcome(text_key="event_any_key", actions=[])
+		wave_any_event = Event(event_id=3007, attributes=0x0, match=wave_any_event_match, outcome=wave_any_event_outcome)
+		self.data.get_events.side_effect = EventCollection([wave_any_event, wave_wand_event]).get
+
+		self.player.has_completed_event.return_value = True
+		self.assertEqual((True, ["event_wand_key"], [self.wand], [self.wand]),
+			self.resolver.resolve_event(self.wave_command, self.player, self.wand))
+
+		self.player.has_completed_event.return_value = False
+		self.assertEqual((True, ["event_any_key"], [self.wand], [self.wand]),
+			self.resolver.resolve_event(self.wave_command, self.player, self.wand))
+
+
 	def test_resolve_event_with_item_outcome_action_destroy(self):
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.lighthouse_location.add(self.bean)
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
@@ -126,12 +178,12 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_item_outcome_action_current_location(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wand_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.CURRENT_LOCATION, named_data_element=None)
 		wand_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=wand_destination)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[wand_action])
 		wave_wand_event = Event(event_id=3004, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -140,12 +192,12 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_item_outcome_action_current_inventory(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wand_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.CURRENT_INVENTORY, named_data_element=None)
 		wand_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=wand_destination)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[wand_action])
 		wave_wand_event = Event(event_id=3005, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -154,12 +206,12 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_item_outcome_action_absolute_container_non_copyable(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wand_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.ABSOLUTE_CONTAINER, named_data_element=self.lighthouse_location)
 		wand_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=wand_destination)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[wand_action])
 		wave_wand_event = Event(event_id=3006, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -168,12 +220,12 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_item_outcome_action_absolute_container_copyable(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wand_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.ABSOLUTE_CONTAINER, named_data_element=self.bottle)
 		wand_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.potion, destination=wand_destination)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[wand_action])
 		wave_wand_event = Event(event_id=3006, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event]}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -184,12 +236,12 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_item_outcome_action_replace(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wand_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.REPLACE, named_data_element=self.lamp)
 		wand_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=wand_destination)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[wand_action])
 		wave_wand_event = Event(event_id=3005, attributes=0x0, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 		self.lighthouse_location.add(self.bean)
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
@@ -206,13 +258,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_container = ItemEventMatchPrerequisiteContainer(prerequisite_container_kind, None)
 		prerequisite = ItemEventMatchPrerequisite(prerequisite_kind, False, prerequisite_item, prerequisite_container)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.get_location.return_value = self.lighthouse_location
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
@@ -228,13 +280,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_container = ItemEventMatchPrerequisiteContainer(prerequisite_container_kind, None)
 		prerequisite = ItemEventMatchPrerequisite(prerequisite_kind, False, prerequisite_item, prerequisite_container)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.get_location.return_value = self.lighthouse_location
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
@@ -250,13 +302,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_container = ItemEventMatchPrerequisiteContainer(prerequisite_container_kind, None)
 		prerequisite = ItemEventMatchPrerequisite(prerequisite_kind, False, prerequisite_item, prerequisite_container)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.get_location.return_value = self.lighthouse_location
 		self.lighthouse_location.add(self.bean)
 
@@ -271,13 +323,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location = self.lighthouse_location
 		prerequisite = LocationEventMatchPrerequisite(prerequisite_kind, False, prerequisite_location)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.lighthouse_location.add(self.bean)
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
@@ -291,13 +343,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location = self.lighthouse_location
 		prerequisite = LocationEventMatchPrerequisite(prerequisite_kind, False, prerequisite_location)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.get_location.return_value = self.lighthouse_location
 		self.lighthouse_location.add(self.bean)
 
@@ -312,13 +364,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location = 3002
 		prerequisite = EventEventMatchPrerequisite(prerequisite_kind, False, prerequisite_location)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.has_completed_event.return_value = False
 		self.lighthouse_location.add(self.bean)
 
@@ -333,13 +385,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location = 3002
 		prerequisite = EventEventMatchPrerequisite(prerequisite_kind, False, prerequisite_location)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.has_completed_event.return_value = True
 		self.lighthouse_location.add(self.bean)
 
@@ -354,13 +406,13 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location = 3002
 		prerequisite = EventEventMatchPrerequisite(prerequisite_kind, True, prerequisite_location)
 
-		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite])
+		pour_potion_bean_event_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite])
 		destroy_bean_destination = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination)
 		pour_potion_bean_event_outcome = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action])
 		pour_potion_bean_event = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_match, outcome=pour_potion_bean_event_outcome)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event]).get
 		self.player.has_completed_event.return_value = True
 		self.lighthouse_location.add(self.bean)
 
@@ -375,17 +427,17 @@ class TestEventResolver(unittest.TestCase):
 		prerequisite_location_0 = self.lighthouse_location
 		prerequisite_0 = LocationEventMatchPrerequisite(prerequisite_kind_0, False, prerequisite_location_0)
 
-		pour_potion_bean_event_0_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[prerequisite_0])
+		pour_potion_bean_event_0_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[prerequisite_0])
 		destroy_bean_destination_0 = ItemEventOutcomeActionDestination(kind=ItemEventOutcomeActionDestinationKind.DESTROY, named_data_element=None)
 		destroy_bean_action_0 = ItemEventOutcomeAction(kind=EventOutcomeActionKind.ITEM, item=self.bean, destination=destroy_bean_destination_0)
 		pour_potion_bean_event_outcome_0 = EventOutcome(text_key="event_response_key", actions=[destroy_bean_action_0])
 		pour_potion_bean_event_0 = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_0_match, outcome=pour_potion_bean_event_outcome_0)
 
-		pour_potion_bean_event_1_match = EventMatch(command=self.pour_command, arguments=[self.potion, self.bean], prerequisites=[])
+		pour_potion_bean_event_1_match = EventMatch(command=self.pour_command, arguments=self.create_item_arguments(self.potion, self.bean), prerequisites=[])
 		pour_potion_bean_event_outcome_1 = EventOutcome(text_key="event_response_key", actions=[])
 		pour_potion_bean_event_1 = Event(event_id=3003, attributes=0x0, match=pour_potion_bean_event_1_match, outcome=pour_potion_bean_event_outcome_1)
 
-		self.data.get_events.side_effect = lambda x: {(self.pour_command, self.potion, self.bean): [pour_potion_bean_event_0, pour_potion_bean_event_1],}.get(x)
+		self.data.get_events.side_effect = EventCollection([pour_potion_bean_event_0, pour_potion_bean_event_1]).get
 		self.lighthouse_location.add(self.bean)
 
 		response = self.resolver.resolve_event(self.pour_command, self.player, self.potion, self.bean)
@@ -395,10 +447,10 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_without_special_player_outcomes(self):
-		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=[self.lamp], prerequisites=[])
+		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=self.create_item_arguments(self.lamp), prerequisites=[])
 		rub_lamp_event_outcome = EventOutcome(text_key="event_response_key", actions=[])
 		rub_lamp_event = Event(event_id=3001, attributes=0x0, match=rub_lamp_event_match, outcome=rub_lamp_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.rub_command, self.lamp): [rub_lamp_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([rub_lamp_event]).get
 
 		response = self.resolver.resolve_event(self.rub_command, self.player, self.lamp)
 
@@ -409,10 +461,10 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_end_game(self):
-		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=[self.lamp], prerequisites=[])
+		rub_lamp_event_match = EventMatch(command=self.rub_command, arguments=self.create_item_arguments(self.lamp), prerequisites=[])
 		rub_lamp_event_outcome = EventOutcome(text_key="event_response_key", actions=[])
 		rub_lamp_event = Event(event_id=3001, attributes=0x1, match=rub_lamp_event_match, outcome=rub_lamp_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.rub_command, self.lamp): [rub_lamp_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([rub_lamp_event]).get
 
 		response = self.resolver.resolve_event(self.rub_command, self.player, self.lamp)
 
@@ -421,10 +473,10 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_puzzle(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -433,11 +485,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_player_outcome_action_set_attribute(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = PlayerEventOutcomeAction(kind=EventOutcomeActionKind.PLAYER, attribute=0x8, on=True)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -446,11 +498,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_player_outcome_action_unset_attribute(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = PlayerEventOutcomeAction(kind=EventOutcomeActionKind.PLAYER, attribute=0x8, on=False)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -459,11 +511,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_location_outcome_action_set_attribute(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = LocationEventOutcomeAction(kind=EventOutcomeActionKind.LOCATION, location=self.lighthouse_location, attribute=0x2, on=True)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -472,11 +524,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_location_outcome_action_unset_attribute(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = LocationEventOutcomeAction(kind=EventOutcomeActionKind.LOCATION, location=self.lighthouse_location, attribute=0x1, on=False)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -485,11 +537,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_link_outcome_action_add_link(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = LinkEventOutcomeAction(kind=EventOutcomeActionKind.LINK, source=self.lighthouse_location, direction=Direction.NORTH, destination=self.beach_location)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -500,11 +552,11 @@ class TestEventResolver(unittest.TestCase):
 	def test_resolve_event_with_link_outcome_action_remove_link_already_exists(self):
 		self.lighthouse_location.directions[Direction.EAST] = self.beach_location
 
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = LinkEventOutcomeAction(kind=EventOutcomeActionKind.LINK, source=self.lighthouse_location, direction=Direction.EAST, destination=None)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -513,11 +565,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_link_outcome_action_remove_link_does_not_already_exist(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = LinkEventOutcomeAction(kind=EventOutcomeActionKind.LINK, source=self.lighthouse_location, direction=Direction.EAST, destination=None)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -526,11 +578,11 @@ class TestEventResolver(unittest.TestCase):
 
 
 	def test_resolve_event_with_description_outcome_action(self):
-		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=[self.wand], prerequisites=[])
+		wave_wand_event_match = EventMatch(command=self.wave_command, arguments=self.create_item_arguments(self.wand), prerequisites=[])
 		action = DescriptionEventOutcomeAction(kind=EventOutcomeActionKind.DESCRIPTION, named_data_element=self.lighthouse_location, extended_description_index=1)
 		wave_wand_event_outcome = EventOutcome(text_key="event_response_key", actions=[action])
 		wave_wand_event = Event(event_id=3004, attributes=0x4, match=wave_wand_event_match, outcome=wave_wand_event_outcome)
-		self.data.get_events.side_effect = lambda x: {(self.wave_command, self.wand): [wave_wand_event],}.get(x)
+		self.data.get_events.side_effect = EventCollection([wave_wand_event]).get
 
 		response = self.resolver.resolve_event(self.wave_command, self.player, self.wand)
 
@@ -1,4 +1,5 @@
 import io
+import tempfile
 import unittest
 
 from adventure import file_reader
@@ -17,7 +18,7 @@ class TestFileReader(unittest.TestCase):
 		input_stream = io.BytesIO(input_bytes)
 		reader = file_reader.FileReader(input_stream)
 
-		self.assertEqual("aniseed\nbasil cinnamon\n", reader.content)
+		self.assertEqual(b"aniseed\nbasil cinnamon\n", reader.content)
 
 
 	def test_with_quotes(self):
@@ -25,7 +26,30 @@ class TestFileReader(unittest.TestCase):
 		input_stream = io.BytesIO(input_bytes)
 		reader = file_reader.FileReader(input_stream)
 
-		self.assertEqual("aniseed \"basil\" cinnamon", reader.content)
+		self.assertEqual(b"aniseed \"basil\" cinnamon", reader.content)
+
+
+	def test_mapped_empty(self):
+		with tempfile.TemporaryFile() as input_file:
+			reader = file_reader.FileReader(input_file)
+
+		self.assertFalse(reader.content)
+
+
+	def test_mapped_multiple_chunks(self):
+		input_bytes = bytes([134, 118, 150, 206, 166, 166, 38, 80, 70, 134, 206, 150, 54, 4, 198, 150, 118, 118, 134, 182, 246, 118, 80])
+		with tempfile.TemporaryFile() as input_file:
+			input_file.write(input_bytes)
+			input_file.flush()
+			reader = file_reader.FileReader(input_file, chunk_size=5)
+
+		self.assertEqual(b"aniseed\nbasil cinnamon\n", reader.content)
+
+
+	def test_flipped_bytes_reverse_bits(self):
+		for input_byte in range(256):
+			expected = sum(((input_byte >> i) & 1) << (7 - i) for i in range(8))
+			self.assertEqual(expected, file_reader.FileReader.FLIPPED_BYTES[input_byte])
 
 
 if __name__ == "__main__":
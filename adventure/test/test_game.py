@@ -1,7 +1,9 @@
 import unittest
 from unittest.mock import Mock
 
+from adventure.element import Labels
 from adventure.game import Game
+from adventure.location import Location
 
 class TestGame(unittest.TestCase):
 
@@ -68,5 +70,81 @@ class TestGame(unittest.TestCase):
 		self.assertFalse(self.game.running)
 
 
+	def test_undo_without_journal(self):
+		self.game.process_input("hello")
+
+		self.assertFalse(self.game.undo())
+
+
+	def test_undo_redo(self):
+		location = self.get_location_changed_by_turns()
+		self.game.set_journal_depth(2)
+
+		self.game.process_input("hello")
+		self.game.process_input("hello")
+
+		self.assertTrue(self.game.undo())
+		self.assertEqual(0x1, location.attributes)
+		self.assertTrue(self.game.undo())
+		self.assertEqual(0x0, location.attributes)
+		self.assertFalse(self.game.undo())
+		self.assertTrue(self.game.redo())
+		self.assertEqual(0x1, location.attributes)
+
+
+	def test_undo_journal_depth(self):
+		location = self.get_location_changed_by_turns()
+		self.game.set_journal_depth(1)
+
+		self.game.process_input("hello")
+		self.game.process_input("hello")
+
+		self.assertTrue(self.game.undo())
+		self.assertFalse(self.game.undo())
+		self.assertEqual(0x1, location.attributes)
+
+
+	def test_turn_after_undo_clears_redo(self):
+		self.get_location_changed_by_turns()
+		self.game.set_journal_depth(2)
+
+		self.game.process_input("hello")
+		self.game.undo()
+		self.game.process_input("hello")
+
+		self.assertFalse(self.game.redo())
+
+
+	def test_process_input_undo_redo(self):
+		location = self.get_location_changed_by_turns()
+		self.game.set_journal_depth(2)
+		self.game.process_input("hello")
+
+		self.assertEqual("Undone.", self.game.process_input("Undo\n"))
+		self.assertEqual(0x0, location.attributes)
+		self.assertEqual("There is nothing to undo.", self.game.process_input("undo"))
+		self.assertEqual("Redone.", self.game.process_input("redo"))
+		self.assertEqual(0x1, location.attributes)
+		self.assertEqual("There is nothing to redo.", self.game.process_input("redo"))
+		self.assertEqual(1, self.token_processor.process_tokens.call_count)
+
+
+	def test_process_input_undo_without_journal(self):
+		response = self.game.process_input("undo")
+
+		self.assertEqual("goodbye", response)
+		self.token_processor.process_tokens.assert_called_once_with(self.player, ["undo"])
+
+
+	def get_location_changed_by_turns(self):
+		location = Location(12, 0x0, Labels("Lighthouse", "at a lighthouse", " by the sea."))
+		attributes = iter([0x1, 0x2])
+		def change_location(player, tokens):
+			location.set_attribute(next(attributes))
+			return "goodbye"
+		self.token_processor.process_tokens.side_effect = change_location
+		return location
+
+
 if __name__ == "__main__":
  	unittest.main()
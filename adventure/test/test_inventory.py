@@ -82,6 +82,66 @@ class TestInventory(unittest.TestCase):
 		self.assertFalse(self.inventory.can_accommodate_remove(self.suit))
 
 
+	def test_get_current_weight_insert_remove(self):
+		self.inventory.insert(self.book)
+		self.inventory.insert(self.coin)
+		self.inventory.insert(self.coin)
+		self.assertEqual(3, self.inventory.get_current_weight())
+
+		self.inventory.remove(self.book)
+		self.inventory.remove(self.book)
+		self.assertEqual(1, self.inventory.get_current_weight())
+
+
+	def test_get_current_weight_being_used(self):
+		self.inventory.insert(self.suit)
+
+		self.suit.being_used = True
+		self.assertEqual(0, self.inventory.get_current_weight())
+
+		self.suit.being_used = False
+		self.assertEqual(2, self.inventory.get_current_weight())
+
+
+	def test_get_current_weight_remove_being_used(self):
+		self.inventory.insert(self.suit)
+		self.suit.being_used = True
+
+		self.inventory.remove(self.suit)
+		self.non_essential_drop_location.insert(self.suit)
+
+		self.assertEqual(0, self.inventory.get_current_weight())
+
+
+	def test_get_current_weight_after_drop_all_items(self):
+		self.inventory.insert(self.book)
+		self.inventory.insert(self.coin)
+
+		self.inventory.drop_all_items(self.non_essential_drop_location, self.essential_drop_location)
+
+		self.assertEqual(0, self.inventory.get_current_weight())
+
+
+	def test_gives_air_usable_item(self):
+		self.inventory.insert(self.suit)
+		self.assertFalse(self.inventory.gives_air())
+
+		self.suit.being_used = True
+		self.assertTrue(self.inventory.gives_air())
+
+		self.suit.being_used = False
+		self.assertFalse(self.inventory.gives_air())
+
+
+	def test_gives_light_after_drop_all_items(self):
+		self.inventory.insert(self.lamp)
+
+		self.inventory.drop_all_items(self.non_essential_drop_location, self.essential_drop_location)
+
+		self.assertFalse(self.inventory.gives_light())
+		self.assertTrue(self.non_essential_drop_location.gives_light())
+
+
 	def test_drop_all_items_none(self):
 		self.inventory.drop_all_items(self.non_essential_drop_location, self.essential_drop_location)
 
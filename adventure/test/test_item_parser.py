@@ -529,6 +529,7 @@ class TestItemParser(unittest.TestCase):
 		lever = lever_list[0]
 		self.assertTrue(isinstance(lever, SwitchableItem))
 		self.assertEqual(self.library_location, lever.switched_element)
+		self.assertEqual([lever], self.library_location.switching_items)
 		self.assertEqual(0x40, lever.switched_attribute)
 		self.assertEqual(1, len(related_commands))
 		self.assertEqual(1, len(lever.list_templates))
@@ -0,0 +1,111 @@
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from adventure.data_parser import DataParser
+from adventure.load_profiler import LoadProfiler
+from adventure.test.fixtures import GAME_FILENAME
+
+class TestLoadProfiler(unittest.TestCase):
+
+	def setUp(self):
+		self.profiler = LoadProfiler()
+		self.profiler.start()
+
+
+	def tearDown(self):
+		self.profiler.stop()
+
+
+	def test_phase_records_allocation(self):
+		with self.profiler.phase("allocate"):
+			block = bytearray(1 << 16)
+
+		record = self.profiler.records[0]
+		self.assertEqual("allocate", record.name)
+		self.assertGreaterEqual(record.allocated, 1 << 16)
+		self.assertGreaterEqual(record.peak, record.allocated)
+		self.assertGreaterEqual(record.wall_time, 0)
+		self.assertGreaterEqual(record.cpu_time, 0)
+
+
+	def test_phase_records_on_error(self):
+		with self.assertRaises(ValueError):
+			with self.profiler.phase("fail"):
+				raise ValueError()
+
+		self.assertEqual(["fail"], [record.name for record in self.profiler.records])
+
+
+	def test_stop_only_when_started(self):
+		self.profiler.stop()
+		tracemalloc.start()
+		profiler = LoadProfiler()
+
+		profiler.start()
+		profiler.stop()
+
+		self.assertTrue(tracemalloc.is_tracing())
+		tracemalloc.stop()
+
+
+	def test_total_peak_covers_all_phases(self):
+		with self.profiler.phase("keep"):
+			kept = bytearray(1 << 20)
+		with self.profiler.phase("discard"):
+			bytearray(1 << 20)
+		self.profiler.stop()
+
+		total = self.profiler.get_total()
+		self.assertGreaterEqual(total.peak, 2 << 20)
+		self.assertGreater(total.peak, max(record.peak for record in self.profiler.records))
+
+
+	def test_format_table(self):
+		with self.profiler.phase("decode"):
+			pass
+		with self.profiler.phase("json.loads"):
+			pass
+
+		lines = self.profiler.format_table().split("\n")
+
+		self.assertEqual(4, len(lines))
+		self.assertTrue(lines[1].startswith("decode"))
+		self.assertTrue(lines[3].startswith(LoadProfiler.TOTAL_NAME))
+
+
+	def test_write_json(self):
+		with self.profiler.phase("decode"):
+			pass
+		output_dir = tempfile.mkdtemp()
+		try:
+			filename = os.path.join(output_dir, "profile.json")
+			self.profiler.write_json(filename)
+			with open(filename) as profile_file:
+				profile = json.load(profile_file)
+		finally:
+			shutil.rmtree(output_dir)
+
+		self.assertEqual("decode", profile["phases"][0]["name"])
+		self.assertEqual(LoadProfiler.TOTAL_NAME, profile["total"]["name"])
+
+
+	def test_parse_phases(self):
+		self.profiler.stop()
+
+		DataParser(profiler=self.profiler).parse(GAME_FILENAME, True)
+
+		names = [record.name for record in self.profiler.records]
+		self.assertEqual(["decode", "json.loads", "parse commands"], names[:3])
+		self.assertTrue("parse events" in names)
+		self.assertTrue("validate" in names)
+		self.assertTrue("init event_resolver" in names)
+		self.assertEqual("build game", names[-1])
+		self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == "__main__":
+	unittest.main()
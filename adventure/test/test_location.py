@@ -3,8 +3,9 @@ import unittest
 
 from adventure.direction import Direction
 from adventure.element import Labels
-from adventure.item import Item, ContainerItem
+from adventure.item import Item, ContainerItem, ListTemplateType, SentientItem, SwitchableItem, SwitchInfo
 from adventure.location import Location
+from adventure.world_instance import WorldInstance
 
 class TestLocation(unittest.TestCase):
 
@@ -19,6 +20,9 @@ class TestLocation(unittest.TestCase):
 		self.obstruction = Item(1000, 0x4, Labels("obstruction", "an obstruction", "an obstruction blocking you"), 8, None, {})
 		self.basket = ContainerItem(1107, 0x3, Labels("basket", "a basket", "a large basket"), 6, None, {})
 		self.box = ContainerItem(1108, 0x3, Labels("box", "a box", "a small box"), 3, None, {})
+		self.lamp = Item(1043, 0x12, Labels("lamp", "a lamp", "a small lamp"), 2, None, {})
+		self.bottle = Item(1044, 0x22, Labels("bottle", "a bottle", "a bottle of air"), 1, None, {})
+		self.cat = SentientItem(1047, 0x80002, Labels("cat", "a cat", "a black cat"), 3, None, {})
 
 
 	def test_contains_simple(self):
@@ -107,6 +111,80 @@ class TestLocation(unittest.TestCase):
 		self.assertEqual(["in the mines. There are dark passages everywhere. The walls are dark and cold", ""], description)
 
 
+	def test_get_full_description_rendered_once(self):
+		self.mine_location.insert(self.book)
+		first = self.mine_location.get_full_description()
+
+		second = self.mine_location.get_full_description()
+
+		self.assertEqual(first, second)
+		self.assertIs(first[1], second[1])
+
+
+	def test_get_full_description_after_insert_and_remove(self):
+		self.mine_location.get_full_description()
+
+		self.mine_location.insert(self.book)
+		self.assertEqual("\n\ta book", self.mine_location.get_full_description()[1])
+
+		self.mine_location.remove(self.book)
+		self.assertEqual("", self.mine_location.get_full_description()[1])
+
+
+	def test_get_full_description_after_nested_insert(self):
+		self.basket.insert(self.box)
+		self.mine_location.insert(self.basket)
+		self.mine_location.get_full_description()
+
+		self.box.insert(self.book)
+
+		self.assertEqual("\n\ta basket +\n\t\ta box +\n\t\t\ta book", self.mine_location.get_full_description()[1])
+
+
+	def test_get_full_description_after_attribute_change(self):
+		self.mine_location.insert(self.book)
+		self.mine_location.get_full_description()
+
+		self.book.set_attribute(Item.ATTRIBUTE_SILENT)
+
+		self.assertEqual("", self.mine_location.get_full_description()[1])
+
+
+	def test_get_full_description_after_extended_description_change(self):
+		self.mine_location.get_full_description()
+
+		self.mine_location.set_extended_description_index(1)
+
+		self.assertEqual("in the mines. There are dark passages everywhere. The walls are glowing",
+			self.mine_location.get_full_description()[0])
+
+
+	def test_get_full_description_after_switch(self):
+		lever = SwitchableItem(1201, 0x8, Labels("lever", "a lever", "a lever"), 3, None, {ListTemplateType.DEFAULT : "{0} ({1})"},
+			SwitchInfo(Location.ATTRIBUTE_GIVES_LIGHT, "down", "up"))
+		lever.switched_element = self.mine_location
+		self.mine_location.switching_items.append(lever)
+		self.lighthouse_location.insert(lever)
+		self.assertEqual("\n\ta lever (down)", self.lighthouse_location.get_full_description()[1])
+
+		lever.switch_on()
+
+		self.assertEqual("\n\ta lever (up)", self.lighthouse_location.get_full_description()[1])
+
+
+	def test_get_full_description_per_instance(self):
+		self.mine_location.get_full_description()
+		instance = WorldInstance()
+
+		with instance.activate():
+			self.mine_location.insert(self.book)
+			self.assertEqual("\n\ta book", self.mine_location.get_full_description()[1])
+
+		self.assertEqual("", self.mine_location.get_full_description()[1])
+		with instance.activate():
+			self.assertEqual("\n\ta book", self.mine_location.get_full_description()[1])
+
+
 	def test_get_drop_location_has_floor(self):
 		self.assertIs(self.lower_mine_location, self.lower_mine_location.get_drop_location())
 
@@ -134,6 +212,63 @@ class TestLocation(unittest.TestCase):
 		self.assertIs(self.obstruction, obstructions[0])
 
 
+	def test_get_obstructions_removed(self):
+		self.mine_location.insert(self.obstruction)
+
+		self.mine_location.remove(self.obstruction)
+
+		self.assertEqual([], self.mine_location.get_obstructions())
+
+
+	def test_count_collectibles(self):
+		self.book.set_attribute(Item.ATTRIBUTE_COLLECTIBLE)
+		self.lamp.set_attribute(Item.ATTRIBUTE_COLLECTIBLE)
+		self.mine_location.insert(self.book)
+		self.mine_location.insert(self.lamp)
+		self.mine_location.insert(self.bottle)
+		self.assertEqual(2, self.mine_location.count_collectibles())
+
+		self.mine_location.remove(self.lamp)
+		self.assertEqual(1, self.mine_location.count_collectibles())
+
+		self.book.unset_attribute(Item.ATTRIBUTE_COLLECTIBLE)
+		self.assertEqual(0, self.mine_location.count_collectibles())
+
+
+	def test_has_non_silent_items(self):
+		self.assertFalse(self.mine_location.has_non_silent_items())
+
+		self.mine_location.insert(self.desk)
+		self.assertFalse(self.mine_location.has_non_silent_items())
+
+		self.mine_location.insert(self.book)
+		self.assertTrue(self.mine_location.has_non_silent_items())
+
+		self.book.set_attribute(Item.ATTRIBUTE_SILENT)
+		self.assertFalse(self.mine_location.has_non_silent_items())
+
+
+	def test_categories_after_destroy(self):
+		self.mine_location.insert(self.book)
+		self.mine_location.insert(self.obstruction)
+
+		self.book.destroy()
+		self.obstruction.destroy()
+
+		self.assertFalse(self.mine_location.has_non_silent_items())
+		self.assertEqual([], self.mine_location.get_obstructions())
+
+
+	def test_categories_per_instance(self):
+		instance = WorldInstance()
+
+		with instance.activate():
+			self.mine_location.insert(self.book)
+			self.assertTrue(self.mine_location.has_non_silent_items())
+
+		self.assertFalse(self.mine_location.has_non_silent_items())
+
+
 	def test_can_reach_no_ways(self):
 		self.assertFalse(self.mine_location.can_reach(self.lighthouse_location))
 
@@ -200,5 +335,151 @@ class TestLocation(unittest.TestCase):
 		self.assertFalse(self.mine_location.gives_tether())
 
 
+
+	def test_gives_light_item(self):
+		self.mine_location.insert(self.lamp)
+
+		self.assertTrue(self.mine_location.gives_light())
+
+
+	def test_gives_light_item_removed(self):
+		self.mine_location.insert(self.lamp)
+		self.mine_location.insert(self.book)
+		self.mine_location.remove(self.lamp)
+
+		self.assertFalse(self.mine_location.gives_light())
+
+
+	def test_gives_light_item_removed_twice(self):
+		self.mine_location.insert(self.lamp)
+		self.mine_location.remove(self.lamp)
+		self.mine_location.remove(self.lamp)
+		self.mine_location.insert(self.lamp)
+
+		self.assertTrue(self.mine_location.gives_light())
+
+
+	def test_gives_light_item_attribute_changed(self):
+		self.mine_location.insert(self.lamp)
+
+		self.lamp.unset_attribute(Item.ATTRIBUTE_GIVES_LIGHT)
+		self.assertFalse(self.mine_location.gives_light())
+
+		self.lamp.toggle_attribute(Item.ATTRIBUTE_GIVES_LIGHT)
+		self.assertTrue(self.mine_location.gives_light())
+
+
+	def test_gives_light_multiple_items(self):
+		other_lamp = Item(1045, 0x12, Labels("lamp", "a lamp", "another lamp"), 2, None, {})
+		self.mine_location.insert(self.lamp)
+		self.mine_location.insert(other_lamp)
+		self.mine_location.remove(self.lamp)
+
+		self.assertTrue(self.mine_location.gives_light())
+
+
+	def test_gives_light_item_in_container(self):
+		self.box.insert(self.lamp)
+		self.mine_location.insert(self.box)
+
+		self.assertFalse(self.mine_location.gives_light())
+
+
+	def test_gives_air_item_in_container(self):
+		self.mine_location.insert(self.basket)
+		self.basket.insert(self.box)
+		self.box.insert(self.bottle)
+
+		self.assertTrue(self.mine_location.gives_air())
+
+
+	def test_gives_air_item_in_container_removed(self):
+		self.mine_location.insert(self.basket)
+		self.basket.insert(self.box)
+		self.box.insert(self.bottle)
+		self.box.remove(self.bottle)
+
+		self.assertFalse(self.mine_location.gives_air())
+
+
+	def test_gives_light_item_held_by_sentient(self):
+		self.cat.insert(self.lamp)
+		self.mine_location.insert(self.cat)
+
+		self.assertTrue(self.mine_location.gives_light())
+
+		self.lamp.unset_attribute(Item.ATTRIBUTE_GIVES_LIGHT)
+		self.assertFalse(self.mine_location.gives_light())
+
+
+
+	def test_contains_container_multi_removed(self):
+		self.mine_location.insert(self.basket)
+		self.basket.insert(self.box)
+		self.box.insert(self.book)
+
+		self.box.remove(self.book)
+
+		self.assertFalse(self.mine_location.contains(self.book))
+		self.assertFalse(self.basket.contains(self.book))
+		self.assertTrue(self.mine_location.contains(self.box))
+
+
+	def test_contains_container_moved(self):
+		self.box.insert(self.book)
+		self.mine_location.insert(self.box)
+
+		self.mine_location.remove(self.box)
+		self.lighthouse_location.insert(self.box)
+
+		self.assertFalse(self.mine_location.contains(self.book))
+		self.assertTrue(self.lighthouse_location.contains(self.book))
+
+
+	def test_contains_destroyed(self):
+		self.box.insert(self.book)
+		self.mine_location.insert(self.box)
+
+		self.book.destroy()
+
+		self.assertFalse(self.mine_location.contains(self.book))
+		self.assertFalse(self.box.contains(self.book))
+
+
+	def test_contains_added_to_multiple_containers(self):
+		self.mine_location.insert(self.basket)
+		self.basket.add(self.book)
+		self.mine_location.add(self.book)
+
+		self.mine_location.remove(self.book)
+
+		self.assertTrue(self.mine_location.contains(self.book))
+
+
+	def test_contains_deep_nesting(self):
+		containers = [ContainerItem(2000 + i, 0x3, Labels("box", "a box", "a box"), 100 - i, None, {}) for i in range(50)]
+		self.mine_location.insert(containers[0])
+		for outer, inner in zip(containers, containers[1:]):
+			outer.insert(inner)
+		containers[-1].insert(self.book)
+
+		self.assertTrue(self.mine_location.contains(self.book))
+		self.assertIs(self.book, self.mine_location.get_allow_copy(self.book))
+
+		containers[0].remove(containers[1])
+		self.assertFalse(self.mine_location.contains(self.book))
+
+
+	def test_get_allow_copy_copy_removed(self):
+		book_copy = copy(self.book)
+		self.box.insert(book_copy)
+		self.mine_location.insert(self.box)
+
+		self.box.remove(book_copy)
+
+		self.assertIsNone(self.mine_location.get_allow_copy(self.book))
+		self.assertEqual({}, self.mine_location.copy_index)
+
+
 if __name__ == "__main__":
 	unittest.main()
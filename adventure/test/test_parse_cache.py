@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from adventure.data_parser import DataParser
+from adventure.direction import Direction
+from adventure.element import Labels
+from adventure.location import Location
+from adventure.parse_cache import ParseCache
+from adventure.test.fixtures import GAME_FILENAME, get_lines
+
+class TestParseCache(unittest.TestCase):
+
+	def setUp(self):
+		self.cache_dir = tempfile.mkdtemp()
+		self.cache = ParseCache(self.cache_dir)
+
+
+	def tearDown(self):
+		shutil.rmtree(self.cache_dir)
+
+
+	def write_file(self, content):
+		path = os.path.join(self.cache_dir, "game.dat")
+		with open(path, "wb") as output_file:
+			output_file.write(content)
+		return path
+
+
+	def test_get_key_same_content(self):
+		key = self.cache.get_key(self.write_file(b"abc"))
+
+		self.assertEqual(key, self.cache.get_key(self.write_file(b"abc")))
+
+
+	def test_get_key_different_content(self):
+		key = self.cache.get_key(self.write_file(b"abc"))
+
+		self.assertNotEqual(key, self.cache.get_key(self.write_file(b"abd")))
+
+
+	def test_get_key_different_engine_version(self):
+		filename = self.write_file(b"abc")
+		key = self.cache.get_key(filename)
+
+		with patch.object(ParseCache, "ENGINE_VERSION", ParseCache.ENGINE_VERSION + 1):
+			self.assertNotEqual(key, self.cache.get_key(filename))
+
+
+	def test_load_missing(self):
+		self.assertIsNone(self.cache.load("missing"))
+
+
+	def test_load_corrupt(self):
+		with open(self.cache.get_path("corrupt"), "wb") as cache_file:
+			cache_file.write(b"not a pickle")
+
+		self.assertIsNone(self.cache.load("corrupt"))
+
+
+	def test_load_unknown_class(self):
+		with open(self.cache.get_path("unknown"), "wb") as cache_file:
+			cache_file.write(b"cadventure.location\nMissingLocation\n.")
+
+		self.assertIsNone(self.cache.load("unknown"))
+
+
+	def test_load_unknown_module(self):
+		with open(self.cache.get_path("unknown"), "wb") as cache_file:
+			cache_file.write(b"cadventure.missing_module\nLocation\n.")
+
+		self.assertIsNone(self.cache.load("unknown"))
+
+
+	def test_store_load_linked_locations(self):
+		locations = [Location(i, 0x707, Labels("Tunnel", "in a tunnel", ".")) for i in range(5000)]
+		for location, next_location in zip(locations, locations[1:]):
+			location.directions[Direction.NORTH] = next_location
+			next_location.directions[Direction.SOUTH] = location
+
+		self.cache.store("linked", locations)
+		loaded_locations = self.cache.load("linked")
+
+		self.assertEqual(5000, len(loaded_locations))
+		self.assertIs(loaded_locations[1], loaded_locations[0].directions[Direction.NORTH])
+		self.assertIs(loaded_locations[0], loaded_locations[1].directions[Direction.SOUTH])
+
+
+	@patch("builtins.print")
+	def test_parse_cold_then_warm(self, mock_print):
+		cold_game = DataParser().parse(GAME_FILENAME, True, self.cache_dir)
+		warm_game = DataParser().parse(GAME_FILENAME, True, self.cache_dir)
+
+		self.assertTrue(mock_print.call_args_list[0][0][0].startswith("Parsed"))
+		self.assertTrue(mock_print.call_args_list[1][0][0].startswith("Loaded"))
+		for line in ["look", "take book", "s", "rub lamp", "e", "inventory", "score"]:
+			self.assertEqual(get_lines(cold_game, line), get_lines(warm_game, line))
+
+
+	@patch("builtins.print")
+	def test_parse_rewrites_unloadable_entry(self, mock_print):
+		key = self.cache.get_key(GAME_FILENAME)
+		with open(self.cache.get_path(key), "wb") as cache_file:
+			cache_file.write(b"cadventure.location\nMissingLocation\n.")
+
+		DataParser().parse(GAME_FILENAME, True, self.cache_dir)
+
+		self.assertTrue(mock_print.call_args_list[0][0][0].startswith("Parsed"))
+		self.assertIsNotNone(self.cache.load(key))
+
+
+if __name__ == "__main__":
+	unittest.main()
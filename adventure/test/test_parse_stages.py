@@ -0,0 +1,87 @@
+import time
+import unittest
+
+from adventure.parse_stages import ParseStage, StageRunner
+
+class TestStageRunner(unittest.TestCase):
+
+	def setUp(self):
+		self.runner = StageRunner()
+
+
+	def test_run_passes_dependency_results(self):
+		stages = [
+			ParseStage("sum", ["one", "two"], lambda results: results["one"] + results["two"]),
+			ParseStage("one", [], lambda results: 1),
+			ParseStage("two", ["one"], lambda results: results["one"] * 2),
+		]
+
+		results = self.runner.run(stages)
+
+		self.assertEqual({"one": 1, "two": 2, "sum": 3}, results)
+
+
+	def test_run_in_dependency_order(self):
+		order = []
+		stages = [
+			ParseStage("items", ["locations"], lambda results: order.append("items")),
+			ParseStage("locations", [], lambda results: order.append("locations")),
+		]
+
+		self.runner.run(stages)
+
+		self.assertEqual(["locations", "items"], order)
+
+
+	def test_run_unresolvable(self):
+		stages = [
+			ParseStage("items", ["locations"], lambda results: None),
+		]
+
+		with self.assertRaises(ValueError):
+			self.runner.run(stages)
+
+
+	def test_run_stage_error(self):
+		stages = [
+			ParseStage("items", [], lambda results: 1 // 0),
+		]
+
+		with self.assertRaises(ZeroDivisionError):
+			self.runner.run(stages)
+
+
+	def test_critical_path(self):
+		stages = [
+			ParseStage("commands", [], lambda results: time.sleep(0.01)),
+			ParseStage("texts", [], lambda results: None),
+			ParseStage("locations", ["commands", "texts"], lambda results: time.sleep(0.01)),
+			ParseStage("player", ["locations"], lambda results: None),
+		]
+
+		self.runner.run(stages)
+		elapsed, path = self.runner.get_critical_path()
+
+		self.assertEqual(["commands", "locations", "player"], path)
+		self.assertGreaterEqual(elapsed, 0.02)
+		self.assertLessEqual(elapsed, self.runner.timings["player"].end)
+
+
+	def test_format_timings(self):
+		stages = [
+			ParseStage("commands", [], lambda results: None),
+			ParseStage("texts", [], lambda results: None),
+		]
+
+		self.runner.run(stages)
+		lines = self.runner.format_timings().split("\n")
+
+		self.assertEqual(4, len(lines))
+		self.assertTrue(lines[0].startswith("stage"))
+		self.assertTrue(lines[1].startswith("commands"))
+		self.assertEqual(1, sum(line.endswith(StageRunner.CRITICAL_PATH_MARKER) for line in lines))
+		self.assertTrue(lines[3].startswith("critical path"))
+
+
+if __name__ == "__main__":
+	unittest.main()
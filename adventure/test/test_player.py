@@ -3,7 +3,8 @@ import unittest
 from adventure.element import Labels
 from adventure.inventory import Inventory
 from adventure.location import Location
-from adventure.player import Player
+from adventure.player import JournalledPlayer, Player
+from adventure.world_instance import JournalledInstance, TurnJournal
 
 class TestPlayer(unittest.TestCase):
 
@@ -26,5 +27,42 @@ class TestPlayer(unittest.TestCase):
 		self.assertIsNone(self.player.previous_location)
 
 
+	def test_get_inventory_by_id(self):
+		cave_inventory = Inventory(1, 0x0, Labels("Cave Inventory", "in the cave inventory", "."), 9, [9])
+		self.player.inventories_by_location_id = {9 : cave_inventory}
+
+		self.assertIs(self.inventory, self.player.get_inventory_by_id(0))
+		self.assertIs(cave_inventory, self.player.get_inventory_by_id(1))
+		self.assertIsNone(self.player.get_inventory_by_id(2))
+
+
+	def test_copy_as_journalled(self):
+		self.player.score = 5
+		self.player.complete_event(321)
+
+		journalled_player = self.player.copy_as(JournalledPlayer)
+
+		self.assertIsInstance(journalled_player, JournalledPlayer)
+		self.assertEqual(5, journalled_player.score)
+		self.assertEqual({321}, journalled_player.completed_events)
+		self.assertIs(self.lighthouse_location, journalled_player.location)
+
+
+	def test_journalled_player_swap(self):
+		journalled_player = self.player.copy_as(JournalledPlayer)
+		journalled_instance = JournalledInstance()
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			journalled_player.location = self.beach_location
+			journalled_player.complete_event(321)
+			journalled_player.set_alive(False)
+		journal.swap()
+
+		self.assertIs(self.lighthouse_location, journalled_player.location)
+		self.assertEqual(set(), journalled_player.completed_events)
+		self.assertTrue(journalled_player.is_alive())
+
+
 if __name__ == "__main__":
 	unittest.main()
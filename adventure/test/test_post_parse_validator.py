@@ -28,6 +28,7 @@ class TestPostParseValidator(unittest.TestCase):
 			elements_by_id=None,
 			items=self.item_collection,
 			item_related_commands=None,
+			command_dispatch=None,
 			hints=None,
 			explanations=None,
 			responses=None,
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+from adventure.data_parser import DataParser
+from adventure.replay import ReplayStep, TranscriptReplayer
+from adventure.test.fixtures import GAME_FILENAME
+
+class TestTranscriptReplayer(unittest.TestCase):
+
+	def setUp(self):
+		self.template = DataParser().parse_template(GAME_FILENAME, True)
+		self.replayer = TranscriptReplayer(self.template)
+
+
+	def test_replay(self):
+		steps = self.replayer.replay(["take book", "inventory"])
+
+		self.assertEqual(["take book", "inventory"], [step.line for step in steps])
+		self.assertEqual(["Taken.", "You are carrying:\n\ta book"], [step.response for step in steps])
+		self.assertTrue(all(step.elapsed >= 0 for step in steps))
+
+
+	def test_replay_separate_games(self):
+		self.replayer.replay(["take book"])
+
+		steps = self.replayer.replay(["inventory"])
+
+		self.assertEqual("You are not carrying anything.", steps[0].response)
+
+
+	def test_replay_stops_when_game_ends(self):
+		steps = self.replayer.replay(["quit", "look"])
+
+		self.assertEqual(["quit"], [step.line for step in steps])
+
+
+	def test_replay_undo(self):
+		replayer = TranscriptReplayer(self.template, 2)
+
+		steps = replayer.replay(["take book", "undo", "inventory"])
+
+		self.assertEqual(["Taken.", "Undone.", "You are not carrying anything."], [step.response for step in steps])
+
+
+	def test_read_transcript(self):
+		with tempfile.TemporaryDirectory() as transcript_dir:
+			filename = os.path.join(transcript_dir, "transcript.txt")
+			with open(filename, "w") as transcript_file:
+				transcript_file.write("take book\n\n  \ninventory\n")
+
+			lines = self.replayer.read_transcript(filename)
+
+		self.assertEqual(["take book", "inventory"], lines)
+
+
+	def test_summarize(self):
+		steps = [ReplayStep("look", "", 0.002), ReplayStep("take book", "", 0.004)]
+
+		summary = self.replayer.summarize(steps)
+
+		self.assertEqual(2, summary.commands)
+		self.assertAlmostEqual(0.006, summary.total)
+		self.assertAlmostEqual(0.003, summary.mean)
+		self.assertAlmostEqual(0.004, summary.slowest)
+
+
+	def test_summarize_empty(self):
+		summary = self.replayer.summarize([])
+
+		self.assertEqual(0, summary.commands)
+		self.assertEqual(0.0, summary.mean)
+
+
+if __name__ == "__main__":
+	unittest.main()
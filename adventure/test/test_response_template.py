@@ -0,0 +1,73 @@
+import unittest
+
+from adventure.response_template import ResponseTemplate
+
+class TestResponseTemplate(unittest.TestCase):
+
+	def test_format_literal(self):
+		template = ResponseTemplate("Taken.")
+
+		self.assertEqual("Taken.", template.literal)
+		self.assertEqual("Taken.", template.format())
+
+
+	def test_format_literal_escaped(self):
+		template = ResponseTemplate("Use {{braces}}.")
+
+		self.assertEqual("Use {braces}.", template.format("ignored"))
+
+
+	def test_format_fields(self):
+		template = ResponseTemplate("You are {0}. Nearby:{1}")
+
+		self.assertEqual("You are %s. Nearby:%s", template.pattern)
+		self.assertEqual(2, template.field_count)
+		self.assertEqual("You are in a cave. Nearby:\n\ta lamp", template.format("in a cave", "\n\ta lamp"))
+
+
+	def test_format_repeated_field(self):
+		template = ResponseTemplate("The {0} is a {0}.")
+
+		self.assertEqual("The lamp is a lamp.", template.format("lamp"))
+
+
+	def test_format_fields_out_of_order(self):
+		template = ResponseTemplate("{1} is 100% {0}.")
+
+		self.assertIsNone(template.field_count)
+		self.assertEqual("The lamp is 100% lit.", template.format("lit", "The lamp"))
+
+
+	def test_format_extra_contents(self):
+		template = ResponseTemplate("You take the {0}.")
+
+		self.assertEqual("You take the lamp.", template.format("lamp", "book"))
+
+
+	def test_format_non_string_field(self):
+		template = ResponseTemplate("Your score is {0}.")
+
+		self.assertEqual("Your score is 12.", template.format(12))
+
+
+	def test_format_too_few_contents(self):
+		template = ResponseTemplate("The {0} is in the {1}.")
+
+		with self.assertRaises(IndexError):
+			template.format("lamp")
+
+
+	def test_format_field_with_format_spec(self):
+		template = ResponseTemplate("Your score is {0:>4}.")
+
+		self.assertIsNone(template.pattern)
+		self.assertEqual("Your score is   12.", template.format(12))
+
+
+	def test_init_invalid(self):
+		with self.assertRaises(ValueError):
+			ResponseTemplate("Unclosed {0")
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import zlib
+
+from adventure.data_parser import DataParser
+from adventure.direction import Direction
+from adventure.item import Item
+from adventure.session_snapshot import SessionSnapshot
+from adventure.test.fixtures import GAME_FILENAME, get_lines
+
+class TestSessionSnapshot(unittest.TestCase):
+
+	def setUp(self):
+		self.template = DataParser().parse_template(GAME_FILENAME, True)
+
+
+	def play(self, game, lines):
+		return [get_lines(game, line) for line in lines]
+
+
+	def test_restore_unchanged(self):
+		game = self.template.spawn()
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		self.assertEqual(11, restored_game.player.get_location_id())
+		self.assertEqual({}, restored_game.instance.states)
+
+
+	def test_restore_plays_as_saved(self):
+		game = self.template.spawn()
+		self.play(game, ["take book", "s", "rub lamp", "take lamp", "e"])
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		continuation = ["look", "inventory", "score", "w", "drop lamp", "look", "e", "look"]
+		self.assertEqual(self.play(game, continuation), self.play(restored_game, continuation))
+
+
+	def test_restore_player(self):
+		game = self.template.spawn()
+		self.play(game, ["take book", "s", "rub lamp", "verbose"])
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		self.assertEqual(12, restored_game.player.get_location_id())
+		self.assertEqual(11, restored_game.player.get_previous_location().data_id)
+		self.assertTrue(restored_game.player.has_completed_event(3001))
+		self.assertEqual(1, restored_game.player.count_solved_puzzles())
+		self.assertEqual(game.player.instructions, restored_game.player.instructions)
+		self.assertEqual(game.player.attributes, restored_game.player.attributes)
+
+
+	def test_restore_links_and_descriptions(self):
+		game = self.template.spawn()
+		self.play(game, ["s", "rub lamp"])
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		with restored_game.activate():
+			location = self.template.data.get_location(12)
+			lamp = self.template.data.get_item_by_id(1043)
+			self.assertEqual(13, location.get_adjacent_location(Direction.EAST).data_id)
+			self.assertEqual(1, lamp.extended_description_index)
+		self.assertIsNone(location.get_adjacent_location(Direction.EAST))
+		self.assertEqual(0, lamp.extended_description_index)
+
+
+	def test_restore_rebuilds_indexes(self):
+		game = self.template.spawn()
+		self.play(game, ["take book"])
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		book = self.template.data.get_item_by_id(1105)
+		with restored_game.activate():
+			self.assertTrue(restored_game.player.get_inventory().contains(book))
+			self.assertFalse(self.template.data.get_location(11).contains(book))
+		self.assertTrue(self.template.data.get_location(11).contains(book))
+
+
+	def test_restore_copies(self):
+		book = self.template.data.get_item_by_id(1105)
+		book.set_attribute(Item.ATTRIBUTE_COPYABLE)
+		game = self.template.spawn()
+		self.play(game, ["take book"])
+
+		restored_game = self.template.restore(self.template.save(game))
+
+		with restored_game.activate():
+			inventory = restored_game.player.get_inventory()
+			book_copy = inventory.get_allow_copy(book)
+			self.assertIsNot(book, book_copy)
+			self.assertIs(book, book_copy.copied_from)
+			self.assertEqual({book_copy}, book.copied_to)
+			self.assertFalse(book_copy.is_copyable())
+			self.assertTrue(self.template.data.get_location(11).contains(book))
+		self.assertEqual(set(), book.copied_to)
+
+
+	def test_snapshot_is_small(self):
+		game = self.template.spawn()
+		self.play(game, ["take book", "s", "rub lamp", "take lamp", "e", "drop book", "w"])
+
+		self.assertLess(len(self.template.save(game)), 1024)
+
+
+	def test_save_game_without_instance(self):
+		game = DataParser().parse(GAME_FILENAME, True)
+
+		with self.assertRaises(ValueError):
+			SessionSnapshot().save(game)
+
+
+	def test_restore_unsupported_version(self):
+		snapshot = zlib.compress(b'{"version":0}')
+
+		with self.assertRaises(ValueError):
+			self.template.restore(snapshot)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from adventure.string_table import StringReference, StringTable, StringTableBuilder
+
+class TestStringTable(unittest.TestCase):
+
+	def setUp(self):
+		self.builder = StringTableBuilder()
+		self.lamp_index = self.builder.add("a lamp")
+		self.empty_index = self.builder.add("")
+		self.cafe_index = self.builder.add("a café")
+		self.table = StringTable(b"pad" + self.builder.to_bytes(), 3)
+
+
+	def test_add_duplicate(self):
+		self.assertEqual(self.lamp_index, self.builder.add("a lamp"))
+		self.assertEqual(3, len(self.builder.strings))
+
+
+	def test_get(self):
+		self.assertEqual("a lamp", self.table.get(self.lamp_index))
+		self.assertEqual("", self.table.get(self.empty_index))
+		self.assertEqual("a café", self.table.get(self.cafe_index))
+
+
+	def test_reference_str(self):
+		reference = self.table.get_reference(self.lamp_index)
+
+		self.assertEqual("a lamp", str(reference))
+		self.assertEqual("You see a lamp.", "You see {0}.".format(reference))
+		self.assertEqual(6, len(reference))
+
+
+	def test_reference_add(self):
+		reference = self.table.get_reference(self.lamp_index)
+
+		self.assertEqual("a lamp.", reference + ".")
+		self.assertEqual("Take a lamp", "Take " + reference)
+		self.assertEqual("a lampa café", reference + self.table.get_reference(self.cafe_index))
+
+
+	def test_reference_bool(self):
+		self.assertTrue(self.table.get_reference(self.lamp_index))
+		self.assertFalse(self.table.get_reference(self.empty_index))
+
+
+	def test_reference_eq(self):
+		reference = self.table.get_reference(self.lamp_index)
+
+		self.assertEqual("a lamp", reference)
+		self.assertEqual(reference, StringReference(self.table, self.lamp_index))
+		self.assertNotEqual("a café", reference)
+		self.assertEqual(hash("a lamp"), hash(reference))
+
+
+if __name__ == "__main__":
+	unittest.main()
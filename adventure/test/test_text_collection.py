@@ -0,0 +1,60 @@
+import unittest
+
+from adventure.text_collection import TextCollection
+from adventure.validation import Severity
+
+class TestTextCollection(unittest.TestCase):
+
+	def setUp(self):
+		self.collection = TextCollection({
+			"confirm_look" : "You are {0}.",
+			"list_location" : "Nearby:{1}",
+			"confirm_taken" : "Taken.",
+		})
+
+
+	def test_get_missing(self):
+		self.assertEqual("", self.collection.get("missing"))
+
+
+	def test_get_template_single(self):
+		template = self.collection.get_template(("confirm_taken",))
+
+		self.assertEqual("Taken.", template.format())
+
+
+	def test_get_template_sequence(self):
+		template = self.collection.get_template(("confirm_look", "list_location"))
+
+		self.assertEqual("You are in a cave. Nearby:\n\ta lamp", template.format("in a cave", "\n\ta lamp"))
+
+
+	def test_get_template_memoised(self):
+		template = self.collection.get_template(("confirm_look", "list_location"))
+
+		self.assertIs(template, self.collection.get_template(("confirm_look", "list_location")))
+
+
+	def test_precompile(self):
+		validation = self.collection.precompile([("confirm_look", "list_location")])
+
+		self.assertEqual({("confirm_look",), ("list_location",), ("confirm_taken",), ("confirm_look", "list_location")},
+			set(self.collection.templates))
+		self.assertFalse(validation)
+
+
+	def test_precompile_invalid(self):
+		self.collection.texts["confirm_dropped"] = "Dropped {0"
+
+		validation = self.collection.precompile([("confirm_look", "confirm_dropped")])
+
+		self.assertEqual(2, len(validation))
+		self.assertEqual("Response \"{0}\" is not a valid template: {1}.", validation[0].template)
+		self.assertEqual(Severity.ERROR, validation[0].severity)
+		self.assertEqual("confirm_dropped", validation[0].args[0])
+		self.assertEqual("confirm_look confirm_dropped", validation[1].args[0])
+		self.assertEqual({("confirm_look",), ("list_location",), ("confirm_taken",)}, set(self.collection.templates))
+
+
+if __name__ == "__main__":
+	unittest.main()
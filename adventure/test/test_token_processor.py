@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock
 
+from adventure.command_dispatch import CommandDispatch
 from adventure.element import Labels
 from adventure.token_processor import TokenProcessor
 from adventure.inventory import Inventory
@@ -20,45 +21,41 @@ class TestTokenProcessor(unittest.TestCase):
 		self.data = Mock()
 		self.setup_commands()
 		self.setup_item_related_commands()
+		self.data.get_command_dispatch.return_value = CommandDispatch(self.commands_by_name, self.item_related_commands)
 		self.setup_inventories()
 		self.setup_locations()
 		self.data.matches_input.side_effect = self.matches_input_side_effect
 
 
 	def setup_commands(self):
-		self.die_command = Mock()
-		self.die_command.verb_is_first_arg.return_value = False
+		self.die_command = self.create_command()
+		self.look_command = self.create_command()
+		self.take_command = self.create_command()
+		self.switch_command = self.create_command()
+		self.say_command = self.create_command(verb_is_first_arg=True)
 
-		self.look_command = Mock()
-		self.look_command.verb_is_first_arg.return_value = False
-
-		self.take_command = Mock()
-		self.take_command.verb_is_first_arg.return_value = False
-
-		self.switch_command = Mock()
-		self.switch_command.verb_is_first_arg.return_value = False
-
-		self.commands = Mock()
-		self.commands.get_by_name.side_effect = lambda x: {
+		self.commands_by_name = {
 			"die" : self.die_command,
 			"look" : self.look_command,
+			"say" : self.say_command,
 			"switch" : self.switch_command,
 			"take" : self.take_command,
-		}.get(x)
+		}
+
 
-		self.data.get_commands.return_value = self.commands
+	def create_command(self, verb_is_first_arg=False):
+		command = Mock()
+		command.verb_is_first_arg.return_value = verb_is_first_arg
+		command.is_secret.return_value = False
+		return command
 
 
 	def setup_item_related_commands(self):
-		self.pour_command = Mock()
-		self.pour_command.verb_is_first_arg.return_value = True
+		self.pour_command = self.create_command()
 
-		self.item_related_commands = Mock()
-		self.item_related_commands.get.side_effect = lambda x: {
+		self.item_related_commands = {
 			"water" : self.pour_command,
-		}.get(x)
-
-		self.data.get_item_related_commands.return_value = self.item_related_commands
+		}
 
 
 	def setup_inventories(self):
@@ -147,6 +144,27 @@ class TestTokenProcessor(unittest.TestCase):
 		self.player.increment_instructions.assert_called_once()
 
 
+	def test_process_tokens_command_abbreviated(self):
+		self.player.get_current_command.return_value = None
+		self.command_runner.run.return_value = "Done."
+
+		response = self.processor.process_tokens(self.player, ["ta", "lamp"])
+
+		self.assertEqual("Done.", response)
+		self.command_runner.run.assert_called_once_with(self.take_command, self.player, ["lamp"])
+		self.player.increment_instructions.assert_called_once()
+
+
+	def test_process_tokens_command_verb_is_first_arg(self):
+		self.player.get_current_command.return_value = None
+		self.command_runner.run.return_value = "Done."
+
+		response = self.processor.process_tokens(self.player, ["say", "hello"])
+
+		self.assertEqual("Done.", response)
+		self.command_runner.run.assert_called_once_with(self.say_command, self.player, ["say", "hello"])
+
+
 	def test_process_tokens_command_known_extra_arg(self):
 		self.player.get_current_command.return_value = None
 		self.command_runner.run.return_value = "Done."
@@ -10,5 +10,24 @@ class TestValidation(unittest.TestCase):
 		self.assertEqual("ERROR Invalid input: abc.", message.get_formatted_message())
 
 
+	def test_get_key(self):
+		message = Message(Message.INVENTORY_SHARED_ID, (3,))
+
+		self.assertEqual("INVENTORY_SHARED_ID", message.get_key())
+
+
+	def test_get_key_unknown(self):
+		message = Message((Severity.ERROR, "Invalid input: {0}."), ("abc",))
+
+		self.assertIsNone(message.get_key())
+
+
+	def test_to_json(self):
+		message = Message(Message.INVENTORY_SHARED_ID, (3,))
+
+		self.assertEqual({"severity": "ERROR", "key": "INVENTORY_SHARED_ID", "args": [3],
+			"message": "Multiple inventories found with id 3."}, message.to_json())
+
+
 if __name__ == "__main__":
 	unittest.main()
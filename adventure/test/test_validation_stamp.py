@@ -0,0 +1,54 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from adventure.validation_stamp import ValidationStamp
+
+class TestValidationStamp(unittest.TestCase):
+
+	def setUp(self):
+		self.output_dir = tempfile.mkdtemp()
+		self.filename = os.path.join(self.output_dir, "game.json")
+		self.write_file(b"{}")
+		self.stamp = ValidationStamp(self.filename)
+
+
+	def tearDown(self):
+		shutil.rmtree(self.output_dir)
+
+
+	def write_file(self, content):
+		with open(self.filename, "wb") as output_file:
+			output_file.write(content)
+
+
+	def test_is_current_missing(self):
+		self.assertFalse(self.stamp.is_current())
+
+
+	def test_is_current_written(self):
+		self.stamp.write()
+
+		self.assertTrue(self.stamp.is_current())
+		self.assertTrue(os.path.exists(self.filename + ValidationStamp.FILENAME_SUFFIX))
+
+
+	def test_is_current_file_changed(self):
+		self.stamp.write()
+		self.write_file(b"{ }")
+
+		self.assertFalse(self.stamp.is_current())
+
+
+	def test_is_current_different_validator_version(self):
+		self.stamp.write()
+		ValidationStamp.VALIDATOR_VERSION += 1
+		try:
+			self.assertFalse(self.stamp.is_current())
+		finally:
+			ValidationStamp.VALIDATOR_VERSION -= 1
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+
+from adventure.data_parser import DataParser
+from adventure.direction import Direction
+from adventure.world_generator import WorldGenerator
+
+class TestWorldGenerator(unittest.TestCase):
+
+	def setUp(self):
+		self.generator = WorldGenerator(location_count=40, item_count=300, seed=7)
+
+
+	def test_generate_counts(self):
+		data = self.generator.generate()
+
+		self.assertEqual(40, len(data["locations"]))
+		self.assertEqual(300, len(data["items"]))
+		self.assertTrue(data["events"])
+
+
+	def test_generate_unique_ids(self):
+		data = self.generator.generate()
+
+		ids = [element["data_id"] for element in data["locations"] + data["items"] + data["events"]]
+		self.assertEqual(len(ids), len(set(ids)))
+
+
+	def test_generate_deterministic(self):
+		data = self.generator.generate()
+
+		self.assertEqual(data, self.generator.generate())
+		self.assertEqual(data, WorldGenerator(location_count=40, item_count=300, seed=7).generate())
+		self.assertNotEqual(data, WorldGenerator(location_count=40, item_count=300, seed=8).generate())
+
+
+	def test_generate_connected(self):
+		data = self.generator.generate()
+
+		links = {location["data_id"]: location["directions"] for location in data["locations"]}
+		start_id = data["players"][0]["location_id"]
+		reached = {start_id}
+		pending = [start_id]
+		while pending:
+			for destination_id in links[pending.pop()].values():
+				if not destination_id in reached:
+					reached.add(destination_id)
+					pending.append(destination_id)
+
+		self.assertEqual(set(links), reached)
+
+
+	def test_generate_directions(self):
+		data = WorldGenerator(location_count=200, item_count=0, seed=7).generate()
+
+		used = {direction for location in data["locations"] for direction in location["directions"]}
+		self.assertEqual({direction.name.lower() for direction in Direction if direction != Direction.BACK}, used)
+
+
+	def test_write_text_valid(self):
+		with tempfile.TemporaryDirectory() as output_dir:
+			filename = os.path.join(output_dir, "game.json")
+			self.generator.write(filename, text_output=True)
+
+			with open(filename) as output_file:
+				self.assertEqual(300, len(json.load(output_file)["items"]))
+			self.assertEqual([], DataParser().validate(filename, text_input=True))
+
+
+	def test_write_binary_valid(self):
+		with tempfile.TemporaryDirectory() as output_dir:
+			filename = os.path.join(output_dir, "game")
+			self.generator.write(filename)
+
+			self.assertEqual([], DataParser().validate(filename))
+
+
+	def test_play(self):
+		with tempfile.TemporaryDirectory() as output_dir:
+			filename = os.path.join(output_dir, "game.json")
+			self.generator.write(filename, text_output=True)
+			game = DataParser().parse_template(filename, text_input=True).spawn()
+
+		self.assertEqual("Welcome to the generated game.", game.get_start_message())
+		self.assertTrue(game.process_input("look").startswith("You are in a"))
+
+
+	def test_single_item_left_not_paired(self):
+		data = WorldGenerator(location_count=1, item_count=1, seed=0).generate()
+
+		self.assertEqual(1, len(data["items"]))
+
+
+if __name__ == "__main__":
+	unittest.main()
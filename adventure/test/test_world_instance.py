@@ -0,0 +1,193 @@
+import unittest
+
+from adventure.direction import Direction
+from adventure.element import Labels
+from adventure.item import Item, ContainerItem
+from adventure.location import Location
+from adventure.world_instance import ElementState, JournalledInstance, TurnJournal, WorldInstance, current_instance
+
+class TestWorldInstance(unittest.TestCase):
+
+	def setUp(self):
+		self.lighthouse_location = Location(12, 0x1, Labels("Lighthouse", "at a lighthouse", " by the sea."))
+		self.beach_location = Location(13, 0x1, Labels("Beach", "on a beach", " of black sand"))
+		self.book = Item(1105, 0x2, Labels("book", "a book", "a book of fairytales"), 2, "The Pied Piper", {})
+		self.lamp = Item(1043, 0x12, Labels("lamp", "a lamp", "a small lamp"), 2, None, {})
+		self.box = ContainerItem(1108, 0x3, Labels("box", "a box", "a small box"), 3, None, {})
+		self.lighthouse_location.insert(self.book)
+		self.instance = WorldInstance()
+
+
+	def test_state_copy_nested(self):
+		state = ElementState()
+		state.items = {self.book}
+		state.copy_index = {self.book : {self.lamp : 1}}
+
+		state_copy = state.copy()
+		state_copy.items.add(self.lamp)
+		state_copy.copy_index[self.book][self.box] = 1
+
+		self.assertEqual({self.book}, state.items)
+		self.assertEqual({self.lamp : 1}, state.copy_index[self.book])
+
+
+	def test_activate(self):
+		with self.instance.activate():
+			self.assertIs(self.instance, current_instance.get())
+		self.assertIsNone(current_instance.get())
+
+
+	def test_read_unchanged(self):
+		with self.instance.activate():
+			self.assertTrue(self.lighthouse_location.contains(self.book))
+
+		self.assertEqual({}, self.instance.states)
+
+
+	def test_write_attribute(self):
+		with self.instance.activate():
+			self.lamp.unset_attribute(Item.ATTRIBUTE_GIVES_LIGHT)
+			self.assertFalse(self.lamp.gives_light())
+
+		self.assertTrue(self.lamp.gives_light())
+		self.assertEqual({self.lamp}, set(self.instance.states))
+
+
+	def test_write_items(self):
+		with self.instance.activate():
+			self.book.remove_from_containers()
+			self.beach_location.insert(self.book)
+			self.assertTrue(self.beach_location.contains(self.book))
+			self.assertFalse(self.lighthouse_location.contains(self.book))
+			self.assertEqual({self.beach_location}, self.book.containers)
+
+		self.assertTrue(self.lighthouse_location.contains(self.book))
+		self.assertFalse(self.beach_location.contains(self.book))
+		self.assertEqual({self.lighthouse_location}, self.book.containers)
+
+
+	def test_write_directions(self):
+		with self.instance.activate():
+			self.lighthouse_location.link(Direction.SOUTH, self.beach_location)
+			self.assertIs(self.beach_location, self.lighthouse_location.get_adjacent_location(Direction.SOUTH))
+
+		self.assertIsNone(self.lighthouse_location.get_adjacent_location(Direction.SOUTH))
+
+
+	def test_write_separate_instances(self):
+		other_instance = WorldInstance()
+
+		with self.instance.activate():
+			self.lighthouse_location.seen = True
+		with other_instance.activate():
+			self.assertFalse(self.lighthouse_location.seen)
+		with self.instance.activate():
+			self.assertTrue(self.lighthouse_location.seen)
+
+
+	def test_new_element_in_instance(self):
+		mine_location = Location(11, 0x0, Labels("Mines", "in the mines", ". There are dark passages everywhere"))
+
+		with self.instance.activate():
+			self.box.insert(self.lamp)
+			mine_location.insert(self.box)
+			self.box.unset_attribute(Item.ATTRIBUTE_MOBILE)
+			self.assertTrue(mine_location.contains(self.lamp))
+			self.assertTrue(mine_location.has_items())
+
+		self.assertFalse(mine_location.contains(self.lamp))
+		self.assertFalse(mine_location.has_items())
+		self.assertTrue(self.box.is_mobile())
+
+
+	def test_journal_swap_own_state(self):
+		journalled_instance = JournalledInstance()
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			self.book.remove_from_containers()
+			self.book.set_attribute(0x10)
+		replaced = journal.swap()
+
+		self.assertTrue(self.lighthouse_location.contains(self.book))
+		self.assertFalse(self.book.has_attribute(0x10))
+		replaced.swap()
+		self.assertFalse(self.lighthouse_location.contains(self.book))
+		self.assertTrue(self.book.has_attribute(0x10))
+
+
+	def test_journal_swap_instance_state(self):
+		journalled_instance = JournalledInstance(self.instance)
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			self.beach_location.insert(self.book)
+		journal.swap()
+
+		self.assertEqual({}, self.instance.states)
+		self.assertTrue(self.lighthouse_location.contains(self.book))
+
+
+	def test_journal_records_first_state_only(self):
+		journalled_instance = JournalledInstance()
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			self.book.set_attribute(0x10)
+			self.book.set_attribute(0x20)
+		journal.swap()
+
+		self.assertEqual(0x2, self.book.attributes)
+
+
+	def test_journal_grows_with_changes_only(self):
+		for item_id in range(2000, 2100):
+			self.lighthouse_location.insert(Item(item_id, 0x2, Labels("pebble", "a pebble", "a pebble"), 1, None, {}))
+		journalled_instance = JournalledInstance()
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			self.book.remove_from_containers()
+			self.beach_location.insert(self.book)
+
+		self.assertLess(len(journal.entries), 20)
+		replaced = journal.swap()
+		self.assertTrue(self.lighthouse_location.contains(self.book))
+		self.assertEqual(101, len(self.lighthouse_location.items))
+		self.assertFalse(self.beach_location.contains(self.book))
+		replaced.swap()
+		self.assertFalse(self.lighthouse_location.contains(self.book))
+		self.assertTrue(self.beach_location.contains(self.book))
+
+
+	def test_journal_swap_copies(self):
+		water = Item(1109, 0x902, Labels("water", "some water", "some water"), 1, None, {})
+		journalled_instance = JournalledInstance(self.instance)
+		journal = journalled_instance.journal = TurnJournal()
+
+		with journalled_instance.activate():
+			self.beach_location.insert(water)
+			water_copy = self.beach_location.get_allow_copy(water)
+		replaced = journal.swap()
+
+		self.assertIsNot(water, water_copy)
+		self.assertEqual({}, self.instance.states)
+		self.assertIsNone(self.beach_location.get_allow_copy(water))
+		replaced.swap()
+		with self.instance.activate():
+			self.assertIs(water_copy, self.beach_location.get_allow_copy(water))
+			self.assertEqual({water_copy}, water.copied_to)
+
+
+	def test_journalled_instance_without_journal(self):
+		journalled_instance = JournalledInstance(self.instance)
+
+		with journalled_instance.activate():
+			self.beach_location.insert(self.book)
+
+		self.assertTrue(self.beach_location in self.instance.states)
+		self.assertFalse(self.beach_location.contains(self.book))
+
+
+if __name__ == "__main__":
+	unittest.main()
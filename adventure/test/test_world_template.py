@@ -0,0 +1,71 @@
+import unittest
+
+from adventure.data_parser import DataParser
+from adventure.test.fixtures import GAME_FILENAME
+
+class TestWorldTemplate(unittest.TestCase):
+
+	def setUp(self):
+		self.template = DataParser().parse_template(GAME_FILENAME, True)
+
+
+	def test_spawn_separate_players(self):
+		game = self.template.spawn()
+		other_game = self.template.spawn()
+
+		game.process_input("s")
+
+		self.assertIsNot(game.player, other_game.player)
+		self.assertEqual(12, game.player.get_location_id())
+		self.assertEqual(11, other_game.player.get_location_id())
+		self.assertEqual(11, self.template.player.get_location_id())
+
+
+	def test_spawn_separate_worlds(self):
+		game = self.template.spawn()
+		other_game = self.template.spawn()
+
+		game.process_input("take book")
+		game.process_input("s")
+		game.process_input("rub lamp")
+
+		self.assertEqual("You are at a lighthouse by the sea. Nearby:\n\ta book", other_game.process_input("look"))
+		self.assertEqual("You are not carrying anything.", other_game.process_input("inventory"))
+		self.assertEqual("You are carrying:\n\ta book", game.process_input("inventory"))
+		other_game.process_input("s")
+		self.assertEqual("You cannot go that way.", other_game.process_input("e"))
+		self.assertEqual("You are in a store full of shelves.", game.process_input("e"))
+
+
+	def test_spawn_shares_unchanged_elements(self):
+		game = self.template.spawn()
+
+		game.process_input("look")
+		game.process_input("take book")
+
+		changed_ids = {element.data_id for element in game.instance.states}
+		self.assertTrue(1105 in changed_ids)
+		self.assertFalse(1043 in changed_ids)
+		self.assertFalse(10 in changed_ids)
+
+
+	def test_spawn_undo(self):
+		game = self.template.spawn(journal_depth=5)
+		other_game = self.template.spawn()
+
+		game.process_input("take book")
+		game.process_input("s")
+		game.process_input("rub lamp")
+		other_game.process_input("take book")
+		game.undo()
+		game.undo()
+
+		self.assertEqual(11, game.player.get_location_id())
+		self.assertEqual("You are carrying:\n\ta book", game.process_input("inventory"))
+		self.assertEqual("You are carrying:\n\ta book", other_game.process_input("inventory"))
+		game.process_input("s")
+		self.assertEqual("You cannot go that way.", game.process_input("e"))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -1,8 +1,36 @@
+from adventure.response_template import ResponseTemplate
+from adventure.validation import Message
+
 class TextCollection:
 
 	def __init__(self, texts):
 		self.texts = texts
+		self.templates = {}
 
 
 	def get(self, text_key):
-		return self.texts.get(text_key, "")
+		return str(self.texts.get(text_key, ""))
+
+
+	def get_template(self, text_keys):
+		template = self.templates.get(text_keys)
+		if not template:
+			template = ResponseTemplate(" ".join(self.get(text_key) for text_key in text_keys))
+			self.templates[text_keys] = template
+		return template
+
+
+	def precompile(self, text_key_sequences):
+		validation = []
+		for text_key in self.texts:
+			self.precompile_template((text_key,), validation)
+		for text_keys in text_key_sequences:
+			self.precompile_template(text_keys, validation)
+		return validation
+
+
+	def precompile_template(self, text_keys, validation):
+		try:
+			self.get_template(text_keys)
+		except ValueError as e:
+			validation.append(Message(Message.RESPONSE_INVALID_TEMPLATE, (" ".join(text_keys), str(e))))
@@ -1,3 +1,4 @@
+from adventure.string_table import StringReference
 from adventure.text_collection import TextCollection
 from adventure.token_translator import TokenTranslator
 
@@ -14,7 +15,10 @@ class TextParser:
 		texts = {}
 
 		for key, raw_value in text_inputs.items():
-			value = TokenTranslator.translate_substitution_tokens(raw_value)
+			if isinstance(raw_value, StringReference):
+				value = raw_value
+			else:
+				value = TokenTranslator.translate_substitution_tokens(raw_value)
 			texts[key] = value
 
 		return texts
@@ -2,8 +2,7 @@ class TokenProcessor:
 
 	def __init__(self, data, command_runner):
 		self.data = data
-		self.commands = data.get_commands()
-		self.item_related_commands = data.get_item_related_commands()
+		self.command_dispatch = data.get_command_dispatch()
 		self.command_runner = command_runner
 
 
@@ -31,24 +30,15 @@ class TokenProcessor:
 		command_args = tokens
 
 		if not command:
-			command = self.get_command_from_input(tokens)
-			if command and not command.verb_is_first_arg():
-				command_args = tokens[1:]
 			player.increment_instructions()
-
-		if not command:
-			command = self.item_related_commands.get(tokens[0])
-
-		if not command:
-			return ""
+			command, arg_offset = self.command_dispatch.get(tokens[0])
+			if not command:
+				return ""
+			command_args = tokens[arg_offset:]
 
 		return self.command_runner.run(command, player, command_args)
 
 
-	def get_command_from_input(self, tokens):
-		return self.commands.get_by_name(tokens[0])
-
-
 	def process_tokens_as_reincarnation_answer(self, player, tokens):
 		answer = tokens[0]
 
@@ -5,6 +5,12 @@ class Severity(Enum):
 	WARN = "WARN"
 
 
+class ValidationMode(Enum):
+	FULL = "full"
+	BACKGROUND = "background"
+	PREVALIDATED = "prevalidated"
+
+
 class Message:
 
 	COMMAND_NON_SWITCHABLE_WITH_SWITCH_INFO = (Severity.WARN, "Command {0} \"{1}\" is not a switchable command, but switch info has been given. This switch info will be ignored.")
@@ -20,6 +26,8 @@ class Message:
 	COMMAND_TELEPORT_UNKNOWN_DESTINATION_ID = (Severity.ERROR, "Unknown destination location id {0} for teleport command {1} \"{2}\".")
 	COMMAND_TELEPORT_UNKNOWN_SOURCE_ID = (Severity.WARN, "Unknown source location id {0} for teleport command {1} \"{2}\". This command will be unreachable.")
 	COMMAND_UNRECOGNIZED_HANDLER = (Severity.WARN, "Unrecognized handler {0} for command {1} \"{2}\". This command will not be available.")
+	EVENT_INVALID_ATTRIBUTE_ARGUMENT = (Severity.ERROR, "Event {0} has an attribute match argument with invalid value \"{1}\". This event will be ignored.")
+	FILE_UNPARSEABLE = (Severity.ERROR, "File could not be parsed: {0}.")
 	INVENTORY_DEFAULT_WITH_LOCATIONS = (Severity.WARN, "Default inventory {0} \"{1}\" has location ids specified. This is redundant.")
 	INVENTORY_SHARED_ID = (Severity.ERROR, "Multiple inventories found with id {0}.")
 	INVENTORY_MULTIPLE_DEFAULT = (Severity.ERROR, "Multiple default inventories found ({0}). Exactly one inventory must be marked as default.")
@@ -71,6 +79,7 @@ class Message:
 	LOCATION_SHARED_ID = (Severity.ERROR, "Multiple locations found with id {0}.")
 	LOCATION_UNKNOWN_LINK_DESTINATION = (Severity.ERROR, "Unknown link destination {0} for direction {1} from location {2}.")
 	LOCATION_UNKNOWN_LINK_DIRECTION = (Severity.ERROR, "Unknown link direction \"{0}\" from location {1}.")
+	RESPONSE_INVALID_TEMPLATE = (Severity.ERROR, "Response \"{0}\" is not a valid template: {1}.")
 
 
 	def __init__(self, error, args):
@@ -80,3 +89,20 @@ class Message:
 
 	def get_formatted_message(self):
 		return self.severity.value + " " + self.template.format(*self.args)
+
+
+	def get_key(self):
+		return MESSAGE_KEYS.get((self.severity, self.template))
+
+
+	def to_json(self):
+		return {
+			"severity" : self.severity.value,
+			"key" : self.get_key(),
+			"args" : list(self.args),
+			"message" : self.template.format(*self.args),
+		}
+
+
+# Each message's name, by its severity and template
+MESSAGE_KEYS = {error : key for key, error in vars(Message).items() if isinstance(error, tuple)}
@@ -0,0 +1,32 @@
+from adventure.file_digest import FileDigest
+
+# Marks a game file as validated, by the digest it had when validated
+class ValidationStamp:
+
+	VALIDATOR_VERSION = 1
+	FILENAME_SUFFIX = ".validated"
+	CONTENT_TEMPLATE = "{0}-v{1}"
+
+	def __init__(self, filename):
+		self.filename = filename
+
+
+	def get_path(self):
+		return self.filename + ValidationStamp.FILENAME_SUFFIX
+
+
+	def get_expected_content(self):
+		return ValidationStamp.CONTENT_TEMPLATE.format(FileDigest.get_hexdigest(self.filename), ValidationStamp.VALIDATOR_VERSION)
+
+
+	def is_current(self):
+		try:
+			with open(self.get_path(), "r") as stamp_file:
+				return stamp_file.read().strip() == self.get_expected_content()
+		except OSError:
+			return False
+
+
+	def write(self):
+		with open(self.get_path(), "w") as stamp_file:
+			stamp_file.write(self.get_expected_content() + "\n")
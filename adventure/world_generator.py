@@ -0,0 +1,411 @@
+import json
+import math
+import random
+
+from adventure.direction import Direction
+from adventure.file_reader import FileReader
+
+# Generates valid games of any size for benchmarking; the same seed gives the same game
+class WorldGenerator:
+
+	DEFAULT_LOCATION_COUNT = 100
+	DEFAULT_ITEM_COUNT = 1000
+	DEFAULT_SEED = 0
+
+	LOCATION_ID_START = 100
+	PLAYER_ID = 1
+	DEFAULT_INVENTORY_ID = 0
+	INVENTORY_CAPACITY = 20
+
+	SWITCH_COMMAND_ID = 61
+	RUB_COMMAND_ID = 48
+
+	# Locations are laid out on a linked grid, so that every location can be reached
+	GRID_DIRECTIONS = [
+		(Direction.EAST, Direction.WEST, 1, 0),
+		(Direction.SOUTH, Direction.NORTH, 0, 1),
+	]
+	DIAGONAL_DIRECTIONS = [
+		(Direction.SOUTHEAST, Direction.NORTHWEST, 1, 1),
+		(Direction.SOUTHWEST, Direction.NORTHEAST, -1, 1),
+	]
+	DIAGONAL_LINK_CHANCE = 0.2
+	VERTICAL_LINK_CHANCE = 0.1
+	OUT_LINK_CHANCE = 0.1
+	DARK_LOCATION_CHANCE = 0.1
+	EVENTS_PER_LOCATION = 0.05
+
+	LOCATION_ATTRIBUTES = 0x707
+	DARK_LOCATION_ATTRIBUTES = 0x706
+
+	COMMANDS = [
+		{"data_id": 5, "attributes": "48", "handler": "go", "aliases": ["back", "b"]},
+		{"data_id": 13, "attributes": "48", "handler": "go", "aliases": ["down", "d"]},
+		{"data_id": 16, "attributes": "48", "handler": "go", "aliases": ["east", "e"]},
+		{"data_id": 34, "attributes": "48", "handler": "go", "aliases": ["north", "n"]},
+		{"data_id": 35, "attributes": "48", "handler": "go", "aliases": ["northeast", "ne"]},
+		{"data_id": 36, "attributes": "48", "handler": "go", "aliases": ["northwest", "nw"]},
+		{"data_id": 37, "attributes": "48", "handler": "go", "aliases": ["out", "o"]},
+		{"data_id": 52, "attributes": "48", "handler": "go", "aliases": ["south", "s"]},
+		{"data_id": 53, "attributes": "48", "handler": "go", "aliases": ["southeast", "se"]},
+		{"data_id": 54, "attributes": "48", "handler": "go", "aliases": ["southwest", "sw"]},
+		{"data_id": 60, "attributes": "48", "handler": "go", "aliases": ["up", "u"]},
+		{"data_id": 62, "attributes": "48", "handler": "go", "aliases": ["west", "w"]},
+		{"data_id": 9, "attributes": "0", "handler": "commands", "aliases": ["commands"]},
+		{"data_id": 14, "attributes": "400", "handler": "drink", "aliases": ["drink"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+		{"data_id": 15, "attributes": "400", "handler": "drop", "aliases": ["drop", "put"],
+			"argument_infos": [{"attributes": "B", "linkers": []}]},
+		{"data_id": 17, "attributes": "400", "handler": "empty", "aliases": ["empty"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+		{"data_id": 21, "attributes": "0", "handler": "help", "aliases": ["help"]},
+		{"data_id": 25, "attributes": "400", "handler": "insert", "aliases": ["insert"],
+			"argument_infos": [{"attributes": "F", "linkers": []}, {"attributes": "F", "linkers": ["in", "into"]}]},
+		{"data_id": 26, "attributes": "0", "handler": "inventory", "aliases": ["inventory", "i"]},
+		{"data_id": 30, "attributes": "400", "handler": "look", "aliases": ["look", "l"]},
+		{"data_id": 44, "attributes": "0", "handler": "quit", "aliases": ["quit"]},
+		{"data_id": 45, "attributes": "400", "handler": "read", "aliases": ["read"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+		{"data_id": 48, "attributes": "400", "handler": "rub", "aliases": ["rub"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+		{"data_id": 50, "attributes": "0", "handler": "score", "aliases": ["score"]},
+		{"data_id": 56, "attributes": "400", "handler": "take", "aliases": ["take", "get"],
+			"argument_infos": [{"attributes": "7", "linkers": []}]},
+		{"data_id": 61, "attributes": "600", "handler": "switch", "aliases": ["switch", "turn"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+		{"data_id": 65, "attributes": "104", "handler": "verbose", "aliases": ["verbose", "terse"],
+			"switch_info": {"off": "terse", "on": "verbose"}},
+		{"data_id": 66, "attributes": "400", "handler": "wear", "aliases": ["wear"],
+			"argument_infos": [{"attributes": "F", "linkers": []}]},
+	]
+
+	# Responses that substitute content; all others are given plain text made from their keys
+	RESPONSES = {
+		"confirm_emptied_solid": "You empty the $0.",
+		"confirm_insert_solid": "You put the $0 into the $1.",
+		"confirm_look": "You are $0.",
+		"describe_commands": "Commands: $0.",
+		"describe_location": "You are $0.",
+		"describe_score": "Your score is $0 of $1, in $2 instructions.",
+		"describe_start": "Welcome to the generated game.",
+		"describe_switch_item": "The $0 is now $1.",
+		"describe_writing": "It reads \"$0\".",
+		"list_inventory_nonempty": "You are carrying:$0",
+		"list_location": "Nearby:$1",
+		"reject_not_here": "There is no $0 here.",
+		"reject_unknown": "I do not know what $0 is.",
+		"request_addinfo": "What do you want to $0$1?",
+		"request_switch_item": "Switch the $0 $1 or $2?",
+	}
+	RESPONSE_KEYS = [
+		"confirm_burn", "confirm_chop", "confirm_consume", "confirm_disembark", "confirm_dropped", "confirm_emptied_liquid",
+		"confirm_feed", "confirm_given", "confirm_immune_off", "confirm_immune_on", "confirm_insert_liquid",
+		"confirm_poured_no_destination", "confirm_poured_with_destination", "confirm_quit", "confirm_reincarnation",
+		"confirm_remove", "confirm_sail", "confirm_say_audience", "confirm_say_no_audience",
+		"confirm_say_no_sentient_audience", "confirm_smash", "confirm_taken", "confirm_throw", "confirm_tie",
+		"confirm_verbose_off", "confirm_verbose_on", "confirm_wave", "confirm_wearing", "death_darkness", "death_no_air",
+		"death_no_land", "death_untethered", "describe_dead", "describe_help", "describe_item", "describe_item_falling",
+		"describe_item_sink", "describe_item_smash_hear", "describe_item_smash_release_liquid",
+		"describe_item_smash_release_solid", "describe_item_smash_see", "describe_item_switch", "describe_locate_copies",
+		"describe_locate_primary", "describe_node", "describe_reincarnation", "list_inventory_empty",
+		"reject_already_contained", "reject_already_empty", "reject_already_sailing", "reject_already_sailing_item",
+		"reject_already_switched", "reject_already_wearing", "reject_carrying", "reject_climb", "reject_container_self",
+		"reject_container_size", "reject_drink_solid", "reject_eat_liquid", "reject_excess_light", "reject_give_inanimate",
+		"reject_give_liquid", "reject_go", "reject_insert_liquid", "reject_insert_solid", "reject_movement_no_air",
+		"reject_movement_no_back", "reject_movement_no_direction", "reject_movement_no_floor", "reject_movement_no_land",
+		"reject_movement_no_out", "reject_movement_no_water", "reject_no_know_how", "reject_no_know_swim",
+		"reject_no_light", "reject_no_material", "reject_no_node", "reject_no_tool", "reject_no_understand_instruction",
+		"reject_no_understand_selection", "reject_no_water_sail", "reject_no_writing", "reject_not_burnable",
+		"reject_not_choppable", "reject_not_consumable", "reject_not_container", "reject_not_empty",
+		"reject_not_holding", "reject_not_liquid", "reject_not_portable", "reject_not_sailable", "reject_not_sailing",
+		"reject_not_smashable", "reject_not_strong", "reject_not_tyable", "reject_not_wearable", "reject_not_wearing",
+		"reject_nothing", "reject_obstruction_known", "reject_obstruction_unknown", "reject_take_animate",
+		"reject_take_liquid", "reject_throw_liquid", "reject_too_full", "reject_too_full_not_worn", "request_argless",
+		"request_reincarnation", "request_switch_command",
+	]
+
+	ADJECTIVES = ["small", "large", "old", "new", "red", "blue", "green", "rusty", "shiny", "wooden", "heavy", "cracked"]
+	PLACES = ["cave", "hall", "field", "forest", "tunnel", "garden", "tower", "cellar", "beach", "bridge", "library", "yard"]
+	NOUNS = ["book", "stone", "key", "rope", "coin", "shell", "map", "bone", "feather", "candle", "cup", "spoon"]
+
+	# Relative frequencies of the kinds of item generated
+	ITEM_KINDS = [
+		("plain", 40),
+		("scenery", 12),
+		("collectible", 5),
+		("light", 4),
+		("container", 10),
+		("liquid", 8),
+		("switchable", 6),
+		("lever", 3),
+		("wearable", 5),
+		("sentient", 4),
+		("pool", 2),
+		("obstruction", 1),
+	]
+	PAIRED_ITEM_KINDS = {"container", "liquid"}
+
+	def __init__(self, location_count=DEFAULT_LOCATION_COUNT, item_count=DEFAULT_ITEM_COUNT, seed=DEFAULT_SEED):
+		self.location_count = max(location_count, 1)
+		self.item_count = item_count
+		self.seed = seed
+		self.random = None
+		self.item_kinds, self.item_kind_weights = zip(*WorldGenerator.ITEM_KINDS)
+
+
+	def generate(self):
+		self.random = random.Random(self.seed)
+		location_ids = [WorldGenerator.LOCATION_ID_START + i for i in range(self.location_count)]
+		locations = self.generate_locations(location_ids)
+		next_id = location_ids[-1] + 1
+		items, eventful_items = self.generate_items(location_ids, next_id)
+		next_id += len(items)
+		events = self.generate_events(locations, eventful_items, next_id)
+
+		responses = self.generate_responses()
+		for event in events:
+			responses[event["outcome"]["text_key"]] = "Something changes."
+
+		return {
+			"commands": WorldGenerator.COMMANDS,
+			"inventories": [self.generate_default_inventory()],
+			"locations": locations,
+			"items": items,
+			"hints": {"default": "There is no hint for that."},
+			"explanations": {"default": "There is no explanation for that."},
+			"responses": responses,
+			"inputs": {"true": ["yes", "y"], "false": ["no", "n"]},
+			"events": events,
+			"players": [self.generate_player(location_ids)],
+		}
+
+
+	def write(self, filename, text_output=False):
+		content = json.dumps(self.generate(), separators=(",", ":")).encode()
+		if not text_output:
+			content = content.translate(FileReader.FLIPPED_BYTES)
+		with open(filename, "wb") as output_file:
+			output_file.write(content)
+
+
+	def generate_locations(self, location_ids):
+		width = math.ceil(math.sqrt(len(location_ids)))
+		locations = []
+
+		for i, location_id in enumerate(location_ids):
+			name = "{0} {1}".format(self.random.choice(WorldGenerator.ADJECTIVES), self.random.choice(WorldGenerator.PLACES))
+			attributes = WorldGenerator.LOCATION_ATTRIBUTES
+			if i and self.random.random() < WorldGenerator.DARK_LOCATION_CHANCE:
+				attributes = WorldGenerator.DARK_LOCATION_ATTRIBUTES
+			locations.append({
+				"data_id": location_id,
+				"attributes": "{0:x}".format(attributes),
+				"labels": {
+					"shortname": name.title(),
+					"longname": "in a {0}".format(name),
+					"description": ", place {0}".format(location_id),
+					"extended_descriptions": [". Nothing has happened here", ". Something has happened here"],
+				},
+				"directions": {},
+			})
+
+		for i, location in enumerate(locations):
+			x, y = i % width, i // width
+			for direction, reverse, dx, dy in WorldGenerator.GRID_DIRECTIONS:
+				self.link_on_grid(locations, width, location, x + dx, y + dy, direction, reverse)
+			for direction, reverse, dx, dy in WorldGenerator.DIAGONAL_DIRECTIONS:
+				if self.random.random() < WorldGenerator.DIAGONAL_LINK_CHANCE:
+					self.link_on_grid(locations, width, location, x + dx, y + dy, direction, reverse)
+
+		for location in locations:
+			if self.random.random() < WorldGenerator.VERTICAL_LINK_CHANCE:
+				other = self.random.choice(locations)
+				if other is not location:
+					self.link(location, other, Direction.UP, Direction.DOWN)
+			if self.random.random() < WorldGenerator.OUT_LINK_CHANCE:
+				self.link(location, self.random.choice(locations), Direction.OUT, None)
+
+		return locations
+
+
+	def link_on_grid(self, locations, width, location, x, y, direction, reverse):
+		if 0 <= x < width:
+			index = y * width + x
+			if index < len(locations):
+				self.link(location, locations[index], direction, reverse)
+
+
+	def link(self, location, other, direction, reverse):
+		if direction.name.lower() in location["directions"]:
+			return
+		if reverse and reverse.name.lower() in other["directions"]:
+			return
+		location["directions"][direction.name.lower()] = other["data_id"]
+		if reverse:
+			other["directions"][reverse.name.lower()] = location["data_id"]
+
+
+	def generate_items(self, location_ids, next_id):
+		items = []
+		eventful_items = []
+
+		while len(items) < self.item_count:
+			kind = self.random.choices(self.item_kinds, self.item_kind_weights)[0]
+			if kind in WorldGenerator.PAIRED_ITEM_KINDS and len(items) + 1 == self.item_count:
+				kind = "plain"
+			location_id = self.random.choice(location_ids)
+			item_id = next_id + len(items)
+			generate_item = getattr(self, "generate_item_" + kind)
+			generated = generate_item(item_id, location_id)
+			if kind == "plain":
+				eventful_items.append((generated[0], location_id))
+			items.extend(generated)
+
+		return items, eventful_items
+
+
+	def create_item(self, item_id, attributes, noun, size, container_id):
+		adjective = self.random.choice(WorldGenerator.ADJECTIVES)
+		shortname = "{0}{1}".format(noun, item_id)
+		return {
+			"data_id": item_id,
+			"attributes": "{0:x}".format(attributes),
+			"labels": {
+				"shortnames": [shortname, noun],
+				"longname": "a {0} {1}".format(adjective, noun),
+				"description": "a {0} {1}, marked {2}".format(adjective, noun, item_id),
+			},
+			"size": size,
+			"container_ids": [container_id],
+		}
+
+
+	def generate_item_plain(self, item_id, location_id):
+		item = self.create_item(item_id, 0x2, self.random.choice(WorldGenerator.NOUNS), self.random.randint(1, 3), location_id)
+		item["labels"]["extended_descriptions"] = [". It is dull", ". It is glowing"]
+		if self.random.random() < 0.2:
+			item["writing"] = "Number {0}".format(item_id)
+		return [item]
+
+
+	def generate_item_scenery(self, item_id, location_id):
+		return [self.create_item(item_id, 0x20000, self.random.choice(["statue", "pillar", "tree", "rock"]), 10, location_id)]
+
+
+	def generate_item_collectible(self, item_id, location_id):
+		return [self.create_item(item_id, 0x8002, self.random.choice(["gem", "ring", "crown"]), 1, location_id)]
+
+
+	def generate_item_light(self, item_id, location_id):
+		return [self.create_item(item_id, 0x12, "torch", 2, location_id)]
+
+
+	def generate_item_container(self, item_id, location_id):
+		container = self.create_item(item_id, 0x3, self.random.choice(["box", "basket", "sack"]), 5, location_id)
+		content = self.create_item(item_id + 1, 0x2, self.random.choice(WorldGenerator.NOUNS), self.random.randint(1, 3), item_id)
+		return [container, content]
+
+
+	def generate_item_liquid(self, item_id, location_id):
+		container = self.create_item(item_id, 0x203, self.random.choice(["bottle", "flask", "jug"]), 3, location_id)
+		liquid = self.create_item(item_id + 1, 0x902, self.random.choice(["water", "oil", "wine"]), 1, item_id)
+		return [container, liquid]
+
+
+	def generate_item_pool(self, item_id, location_id):
+		return [self.create_item(item_id, 0x900, self.random.choice(["water", "oil"]), 1, location_id)]
+
+
+	# Lamps switch their own light, and levers the light of the location they stand in
+	def generate_item_switchable(self, item_id, location_id):
+		return [self.create_switchable_item(item_id, 0xA, "lamp", 2, location_id, item_id, 0x10)]
+
+
+	def generate_item_lever(self, item_id, location_id):
+		return [self.create_switchable_item(item_id, 0x8, "lever", 4, location_id, location_id, 0x1)]
+
+
+	def create_switchable_item(self, item_id, attributes, noun, size, location_id, element_id, switched_attribute):
+		item = self.create_item(item_id, attributes, noun, size, location_id)
+		item["related_command_id"] = WorldGenerator.SWITCH_COMMAND_ID
+		item["switch_info"] = {"element_id": element_id, "attribute": "{0:x}".format(switched_attribute), "off": "off", "on": "on"}
+		item["list_templates"] = {"default": "$0 (currently $1)"}
+		return item
+
+
+	def generate_item_wearable(self, item_id, location_id):
+		item = self.create_item(item_id, 0x402, self.random.choice(["cloak", "hat", "suit"]), 2, location_id)
+		item["using_info"] = "20"
+		item["list_templates"] = {"using": "(wearing) $0"}
+		return [item]
+
+
+	def generate_item_sentient(self, item_id, location_id):
+		return [self.create_item(item_id, 0x80000, self.random.choice(["cat", "dog", "owl", "troll"]), 3, location_id)]
+
+
+	def generate_item_obstruction(self, item_id, location_id):
+		return [self.create_item(item_id, 0x4, self.random.choice(["boulder", "gate"]), 10, location_id)]
+
+
+	# Rubbing an item changes it and its location, and opens a new way out
+	def generate_events(self, locations, eventful_items, next_id):
+		locations_by_id = {location["data_id"]: location for location in locations}
+		event_count = min(int(len(locations) * WorldGenerator.EVENTS_PER_LOCATION) + 1, len(eventful_items))
+		events = []
+
+		for item, location_id in self.random.sample(eventful_items, event_count):
+			event_id = next_id + len(events)
+			actions = [
+				{"kind": "description", "data_id": item["data_id"], "extended_description_index": 1},
+				{"kind": "description", "data_id": location_id, "extended_description_index": 1},
+			]
+			location = locations_by_id[location_id]
+			free_directions = [direction.name.lower() for direction in Direction
+				if direction != Direction.BACK and not direction.name.lower() in location["directions"]]
+			if free_directions:
+				actions.append({"kind": "link", "source_id": location_id, "direction": self.random.choice(free_directions),
+					"destination_id": self.random.choice(locations)["data_id"]})
+
+			events.append({
+				"data_id": event_id,
+				"attributes": "4",
+				"match": {
+					"command_id": WorldGenerator.RUB_COMMAND_ID,
+					"arguments": [{"kind": "item", "value": item["data_id"]}],
+					"prerequisites": [{"kind": "location", "data_id": location_id}],
+				},
+				"outcome": {"text_key": "event_{0}".format(event_id), "actions": actions},
+			})
+
+		return events
+
+
+	def generate_responses(self):
+		responses = {}
+		for key in WorldGenerator.RESPONSE_KEYS:
+			words = key.split("_")[1:]
+			responses[key] = " ".join(words).capitalize() + "."
+		responses.update(WorldGenerator.RESPONSES)
+		return responses
+
+
+	def generate_default_inventory(self):
+		return {
+			"data_id": WorldGenerator.DEFAULT_INVENTORY_ID,
+			"attributes": "1",
+			"labels": {"shortname": "inventory", "longname": "in your inventory", "description": ", where items live"},
+			"capacity": WorldGenerator.INVENTORY_CAPACITY,
+		}
+
+
+	def generate_player(self, location_ids):
+		start_location_id = location_ids[0]
+		return {
+			"data_id": WorldGenerator.PLAYER_ID,
+			"attributes": "3",
+			"location_id": start_location_id,
+			"essential_drop_location_id": start_location_id,
+			"reincarnation_location_id": start_location_id,
+			"collectible_location_id": start_location_id,
+		}
@@ -0,0 +1,300 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+current_instance = ContextVar("current_instance", default=None)
+
+# Stands in for anything a state or its collections did not hold before a change
+MISSING = object()
+
+# The part of an element that may change during play
+class ElementState:
+
+	def copy(self):
+		state = ElementState()
+		for name, value in self.__dict__.items():
+			if isinstance(value, dict):
+				value = {key : (inner_value.copy() if isinstance(inner_value, dict) else inner_value) for key, inner_value in value.items()}
+			elif isinstance(value, (set, list)):
+				value = value.copy()
+			state.__dict__[name] = value
+		return state
+
+
+class StateField:
+
+	def __set_name__(self, owner, name):
+		self.name = name
+
+
+	# Repeats get_state inline, as reads are the hottest path
+	def __get__(self, element, owner=None):
+		if element is None:
+			return self
+		instance = current_instance.get()
+		if instance is not None:
+			state = instance.states.get(element)
+			if state is not None:
+				return state.__dict__[self.name]
+		return element.__dict__["base_state"].__dict__[self.name]
+
+
+	def __set__(self, element, value):
+		instance = current_instance.get()
+		if instance is None:
+			element.__dict__["base_state"].__dict__[self.name] = value
+		else:
+			setattr(instance.get_writable_state(element), self.name, value)
+
+
+# For elements whose state is always their own
+class OwnStateField(StateField):
+
+	def __get__(self, element, owner=None):
+		if element is None:
+			return self
+		return element.__dict__["base_state"].__dict__[self.name]
+
+
+	def __set__(self, element, value):
+		setattr(element.get_writable_state(), self.name, value)
+
+
+class Stateful:
+
+	# Created before any constructor runs, as some set state fields early
+	def __new__(cls, *args, **kwargs):
+		element = object.__new__(cls)
+		element.base_state = ElementState()
+		return element
+
+
+	def get_state(self):
+		instance = current_instance.get()
+		if instance is not None:
+			state = instance.states.get(self)
+			if state is not None:
+				return state
+		return self.base_state
+
+
+	# Anything that changes a mutable field in place must go through this
+	def get_writable_state(self):
+		instance = current_instance.get()
+		if instance is None:
+			return self.base_state
+		return instance.get_writable_state(self)
+
+
+class WorldInstance:
+
+	def __init__(self):
+		self.states = {}
+
+
+	def get_writable_state(self, element):
+		state = self.states.get(element)
+		if state is None:
+			state = element.base_state.copy()
+			self.states[element] = state
+		return state
+
+
+	def get_own_writable_state(self, element):
+		return element.base_state
+
+
+	@contextmanager
+	def activate(self):
+		token = current_instance.set(self)
+		try:
+			yield self
+		finally:
+			current_instance.reset(token)
+
+
+# Records a game's writes in the current turn's journal, when turns can be undone
+class JournalledInstance(WorldInstance):
+
+	def __init__(self, instance=None):
+		self.instance = instance
+		self.states = instance.states if instance else {}
+		self.journal = None
+
+
+	def get_writable_state(self, element):
+		if self.instance is None:
+			return self.get_own_writable_state(element)
+		if self.journal is None:
+			return self.instance.get_writable_state(element)
+		if not element in self.states:
+			self.journal.record(self.states, element, MISSING)
+		return RecordingState(self.instance.get_writable_state(element), self.journal)
+
+
+	def get_own_writable_state(self, element):
+		if self.journal is None:
+			return element.base_state
+		return RecordingState(element.base_state, self.journal)
+
+
+# What each change in a turn replaced; putting those back undoes the turn
+class TurnJournal:
+
+	def __init__(self):
+		self.entries = []
+
+
+	# The values are a state, or a set or dict within one
+	def record(self, values, key, previous):
+		self.entries.append((values, key, previous))
+
+
+	def swap(self):
+		replaced = TurnJournal()
+		for values, key, previous in reversed(self.entries):
+			replaced.entries.append((values, key, self.restore(values, key, previous)))
+		return replaced
+
+
+	def restore(self, values, key, previous):
+		if isinstance(values, ElementState):
+			values = values.__dict__
+
+		if isinstance(values, set):
+			current = True if key in values else MISSING
+			if previous is MISSING:
+				values.discard(key)
+			else:
+				values.add(key)
+		else:
+			current = values.get(key, MISSING)
+			if previous is MISSING:
+				values.pop(key, None)
+			else:
+				values[key] = previous
+		return current
+
+
+def record_changes(values, journal):
+	if isinstance(values, set):
+		return RecordingSet(values, journal)
+	if isinstance(values, dict):
+		return RecordingDict(values, journal)
+	return values
+
+
+# Records each write made through it in the journal, one field or key at a time
+class RecordingState:
+
+	__slots__ = ("state", "journal")
+
+	def __init__(self, state, journal):
+		object.__setattr__(self, "state", state)
+		object.__setattr__(self, "journal", journal)
+
+
+	def __getattr__(self, name):
+		return record_changes(getattr(self.state, name), self.journal)
+
+
+	def __setattr__(self, name, value):
+		self.journal.record(self.state, name, self.state.__dict__.get(name, MISSING))
+		self.state.__dict__[name] = value
+
+
+class RecordingSet:
+
+	__slots__ = ("values", "journal")
+
+	def __init__(self, values, journal):
+		self.values = values
+		self.journal = journal
+
+
+	def __contains__(self, value):
+		return value in self.values
+
+
+	def __iter__(self):
+		return iter(self.values)
+
+
+	def __len__(self):
+		return len(self.values)
+
+
+	def add(self, value):
+		self.record(value)
+		self.values.add(value)
+
+
+	def remove(self, value):
+		self.record(value)
+		self.values.remove(value)
+
+
+	def discard(self, value):
+		self.record(value)
+		self.values.discard(value)
+
+
+	def record(self, value):
+		self.journal.record(self.values, value, True if value in self.values else MISSING)
+
+
+class RecordingDict:
+
+	__slots__ = ("values", "journal")
+
+	def __init__(self, values, journal):
+		self.values = values
+		self.journal = journal
+
+
+	def __contains__(self, key):
+		return key in self.values
+
+
+	def __iter__(self):
+		return iter(self.values)
+
+
+	def __len__(self):
+		return len(self.values)
+
+
+	def __getitem__(self, key):
+		return record_changes(self.values[key], self.journal)
+
+
+	def get(self, key, default=None):
+		return record_changes(self.values.get(key, default), self.journal)
+
+
+	def items(self):
+		return self.values.items()
+
+
+	def __setitem__(self, key, value):
+		self.record(key)
+		self.values[key] = value
+
+
+	def __delitem__(self, key):
+		self.record(key)
+		del self.values[key]
+
+
+	def pop(self, key, *default):
+		self.record(key)
+		return self.values.pop(key, *default)
+
+
+	def setdefault(self, key, default=None):
+		if not key in self.values:
+			self.record(key)
+		return record_changes(self.values.setdefault(key, default), self.journal)
+
+
+	def record(self, key):
+		self.journal.record(self.values, key, self.values.get(key, MISSING))
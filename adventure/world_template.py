@@ -0,0 +1,24 @@
+from copy import copy
+
+from adventure.game import Game
+from adventure.session_snapshot import SessionSnapshot
+from adventure.world_instance import WorldInstance
+
+# A parsed game from which any number of games may be spawned, each with its own world instance
+class WorldTemplate:
+
+	def __init__(self, data, player):
+		self.data = data
+		self.player = player
+
+
+	def spawn(self, journal_depth=0):
+		return Game(self.data, copy(self.player), WorldInstance(), journal_depth)
+
+
+	def save(self, game):
+		return SessionSnapshot().save(game)
+
+
+	def restore(self, snapshot):
+		return SessionSnapshot().restore(self, snapshot)
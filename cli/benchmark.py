@@ -0,0 +1,85 @@
+import argparse
+import sys
+
+from adventure.benchmark import Benchmark
+from adventure.world_generator import WorldGenerator
+
+SIZE_SEPARATOR = "x"
+SIZE_HEADER_FORMAT = "== {0}\n"
+METRIC_FORMAT = "{0:<24}{1:>16}\n"
+REGRESSION_FORMAT = "{0} {1}: {2} -> {3} ({4:+.1%})\n"
+NO_REGRESSIONS_RESPONSE = "No regressions.\n"
+MS_PER_SECOND = 1000
+BYTES_PER_MIB = 1 << 20
+EXIT_PASSED = 0
+EXIT_REGRESSED = 1
+
+
+def parse_size(text):
+	try:
+		location_count, item_count = text.split(SIZE_SEPARATOR)
+		return int(location_count), int(item_count)
+	except ValueError:
+		raise argparse.ArgumentTypeError("size must be given as LOCATIONSxITEMS, not {0}".format(text))
+
+
+class BenchmarkWriter:
+
+	def __init__(self, output=sys.stdout):
+		self.output = output
+
+
+	def write_results(self, results):
+		for size_key, metrics in results["sizes"].items():
+			self.output.write(SIZE_HEADER_FORMAT.format(size_key))
+			for metric, value in metrics.items():
+				self.output.write(METRIC_FORMAT.format(metric, self.format_value(metric, value)))
+
+
+	def write_regressions(self, regressions):
+		if not regressions:
+			self.output.write(NO_REGRESSIONS_RESPONSE)
+		for regression in regressions:
+			self.output.write(REGRESSION_FORMAT.format(regression.size, regression.metric,
+				self.format_value(regression.metric, regression.baseline), self.format_value(regression.metric, regression.current),
+				regression.change))
+
+
+	def format_value(self, metric, value):
+		if metric == Benchmark.DECODE_THROUGHPUT_METRIC:
+			return "{0:.1f} MiB/s".format(value / BYTES_PER_MIB)
+		if metric == Benchmark.PARSE_PEAK_METRIC:
+			return "{0:.1f} MiB".format(value / BYTES_PER_MIB)
+		if metric == Benchmark.PARSE_TIME_METRIC:
+			return "{0:.3f} s".format(value)
+		return "{0:.3f} ms".format(value * MS_PER_SECOND)
+
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="measure loading and command latency on generated games of several sizes")
+	argparser.add_argument("--sizes", type=parse_size, nargs="+", default=Benchmark.DEFAULT_SIZES, metavar="LOCATIONSxITEMS",
+		help="sizes of the games to generate")
+	argparser.add_argument("--samples", type=int, default=Benchmark.DEFAULT_SAMPLES, help="number of times each command is timed")
+	argparser.add_argument("--seed", type=int, default=WorldGenerator.DEFAULT_SEED, help="seed for generating the games")
+	argparser.add_argument("--output", type=str, metavar="FILE", help="write the results to a json file, for use as a baseline")
+	argparser.add_argument("--compare", type=str, metavar="BASELINE", help="compare the results with a baseline json file")
+	argparser.add_argument("--threshold", type=float, default=Benchmark.DEFAULT_THRESHOLD,
+		help="fraction by which a metric may be worse than its baseline before it counts as a regression")
+
+	args = argparser.parse_args()
+
+	benchmark = Benchmark(args.sizes, args.samples, args.seed)
+	baseline = benchmark.read(args.compare) if args.compare else None
+	results = benchmark.run()
+
+	writer = BenchmarkWriter()
+	writer.write_results(results)
+	if args.output:
+		benchmark.write(results, args.output)
+
+	if baseline:
+		regressions = benchmark.compare(baseline, results, args.threshold)
+		writer.write_regressions(regressions)
+		if regressions:
+			sys.exit(EXIT_REGRESSED)
+	sys.exit(EXIT_PASSED)
@@ -2,6 +2,10 @@ import argparse
 import sys
 
 from adventure import data_parser
+from adventure.compiled_world import WorldCompiler
+from adventure.load_profiler import LoadProfiler
+from adventure.validation import ValidationMode
+from adventure.validation_stamp import ValidationStamp
 
 RESET_COLOUR = "\x1b[0m"
 INPUT_COLOUR = "\x1b[0m"
@@ -35,14 +39,55 @@ if __name__ == '__main__':
 	argparser.add_argument("filename", type=str, help="name of input json file defining game")
 	argparser.add_argument("--validate-only", action="store_true", help="only validate the input file without running game")
 	argparser.add_argument("--text-input", action="store_true", help="use plain json text input file")
+	argparser.add_argument("--cache-dir", type=str, help="directory for caching the parsed game between runs")
+	argparser.add_argument("--compile", type=str, metavar="ARTIFACT", help="compile the input file to a world artifact and exit")
+	argparser.add_argument("--compiled-input", action="store_true", help="use compiled world artifact input file")
+	argparser.add_argument("--stage-timings", action="store_true", help="report how long each parse stage took")
+	argparser.add_argument("--validation", choices=[mode.value for mode in ValidationMode], default=ValidationMode.FULL.value,
+		help="validate in full before playing, in the background while playing, or not at all for files marked as validated")
+	argparser.add_argument("--profile-load", action="store_true", help="print time and memory used by each loading phase")
+	argparser.add_argument("--profile-load-json", type=str, metavar="FILE", help="write time and memory used by each loading phase to a json file")
+	argparser.add_argument("--undo-depth", type=int, default=0, metavar="TURNS", help="number of turns that may be undone with undo and redone with redo")
 
 	args = argparser.parse_args()
 	filename = args.filename
 	validate_only = args.validate_only
 	text_input = args.text_input
+	cache_dir = args.cache_dir
+	compiled_input = args.compiled_input
 
-	current_game = data_parser.DataParser().parse(filename, text_input)
+	if compiled_input and cache_dir:
+		argparser.error("--cache-dir cannot be used with --compiled-input")
+
+	validation_mode = ValidationMode(args.validation)
+	if validate_only and validation_mode != ValidationMode.FULL:
+		argparser.error("--validate-only always validates in full")
+
+	if args.compile:
+		json_content = data_parser.DataParser().get_json_content(filename, text_input)
+		WorldCompiler().write(json_content, args.compile)
+		print("Compiled {0} to {1}.".format(filename, args.compile))
+		sys.exit()
+
+	profiler = None
+	if args.profile_load or args.profile_load_json:
+		profiler = LoadProfiler()
+
+	parser = data_parser.DataParser(args.stage_timings, profiler, validation_mode)
+	current_game = parser.parse(filename, text_input, cache_dir, compiled_input)
+
+	if args.profile_load:
+		print(profiler.format_table())
+	if args.profile_load_json:
+		profiler.write_json(args.profile_load_json)
+
+	if validate_only and parser.validation == []:
+		ValidationStamp(filename).write()
+		print("Marked {0} as validated.".format(filename))
 
 	if not validate_only:
+		current_game.set_journal_depth(args.undo_depth)
 		cli = Cli()
 		cli.run(current_game)
+
+	parser.wait_for_validation()
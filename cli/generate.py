@@ -0,0 +1,15 @@
+import argparse
+
+from adventure.world_generator import WorldGenerator
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="generate a valid game of a given size, for testing how the engine scales")
+	argparser.add_argument("filename", type=str, help="name of output json file defining game")
+	argparser.add_argument("--locations", type=int, default=WorldGenerator.DEFAULT_LOCATION_COUNT, help="number of locations to generate")
+	argparser.add_argument("--items", type=int, default=WorldGenerator.DEFAULT_ITEM_COUNT, help="number of items to generate")
+	argparser.add_argument("--seed", type=int, default=WorldGenerator.DEFAULT_SEED, help="seed for the random choices, so that a game can be generated again")
+	argparser.add_argument("--text-output", action="store_true", help="write plain json text instead of bit-flipped binary")
+
+	args = argparser.parse_args()
+
+	WorldGenerator(args.locations, args.items, args.seed).write(args.filename, args.text_output)
@@ -0,0 +1,192 @@
+import argparse
+import asyncio
+import gc
+import os
+import signal
+import socket
+import sys
+import traceback
+import zlib
+
+from adventure import data_parser
+from cli.server import DEFAULT_HOST, DEFAULT_IDLE_TIMEOUT, DEFAULT_PORT, ENCODING, GameServer
+
+MAX_SESSION_ID_LENGTH = 256
+SESSION_ID_TIMEOUT = 30
+
+
+# Parses the game once, then forks workers that serve sessions by the hash of their names
+class PreforkHost:
+
+	def __init__(self, template, worker_count, idle_timeout=DEFAULT_IDLE_TIMEOUT, journal_depth=0):
+		self.template = template
+		self.worker_count = worker_count
+		self.idle_timeout = idle_timeout
+		self.journal_depth = journal_depth
+		self.channels = []
+		self.worker_pids = []
+
+
+	def get_worker_index(self, session_id):
+		return zlib.crc32(session_id) % self.worker_count
+
+
+	def create_listener(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None):
+		if unix_socket:
+			listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			listener.bind(unix_socket)
+		else:
+			listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+			listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+			listener.bind((host, port))
+		listener.listen()
+		return listener
+
+
+	# Must be called before the master starts its own event loop, so that no worker inherits it
+	def fork_workers(self, listener):
+		gc.freeze()
+
+		for i in range(self.worker_count):
+			channel, worker_channel = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+			pid = os.fork()
+			if pid == 0:
+				listener.close()
+				channel.close()
+				for other_channel in self.channels:
+					other_channel.close()
+				self.run_worker(worker_channel)
+
+			worker_channel.close()
+			self.channels.append(channel)
+			self.worker_pids.append(pid)
+
+
+	def run_worker(self, channel):
+		status = 0
+		try:
+			# Terminal interrupts reach every worker; workers stop only when the master tells them
+			signal.signal(signal.SIGINT, signal.SIG_IGN)
+			asyncio.run(self.serve_worker(channel))
+		except:
+			traceback.print_exc()
+			status = 1
+		finally:
+			sys.stdout.flush()
+			sys.stderr.flush()
+			os._exit(status)
+
+
+	async def serve_worker(self, channel):
+		server = GameServer(self.template, self.idle_timeout, self.journal_depth)
+		stopping = asyncio.Event()
+		loop = asyncio.get_running_loop()
+
+		channel.setblocking(False)
+		loop.add_reader(channel.fileno(), self.receive_connection, channel, server, stopping)
+		await stopping.wait()
+		loop.remove_reader(channel.fileno())
+		await server.close()
+
+
+	def receive_connection(self, channel, server, stopping):
+		try:
+			session_id, fds, _, _ = socket.recv_fds(channel, MAX_SESSION_ID_LENGTH, 1)
+		except BlockingIOError:
+			return
+
+		# The master closing its end of the channel is the signal to stop
+		if not fds:
+			stopping.set()
+			return
+
+		connection = socket.socket(fileno=fds[0])
+		asyncio.get_running_loop().create_task(self.serve_connection(server, connection, str(session_id, ENCODING, "replace")))
+
+
+	async def serve_connection(self, server, connection, session_id):
+		reader, writer = await asyncio.open_connection(sock=connection)
+		await server.handle_named_connection(reader, writer, session_id)
+
+
+	async def route(self, listener):
+		loop = asyncio.get_running_loop()
+		listener.setblocking(False)
+		while True:
+			connection, _ = await loop.sock_accept(listener)
+			loop.create_task(self.route_connection(connection))
+
+
+	async def route_connection(self, connection):
+		try:
+			connection.setblocking(False)
+			session_id = await asyncio.wait_for(self.read_session_id(connection), SESSION_ID_TIMEOUT)
+			if session_id:
+				socket.send_fds(self.channels[self.get_worker_index(session_id)], [session_id], [connection.fileno()])
+		except (asyncio.TimeoutError, OSError):
+			pass
+		finally:
+			connection.close()
+
+
+	# Reads a byte at a time, so nothing after the session id is taken from the worker
+	async def read_session_id(self, connection):
+		loop = asyncio.get_running_loop()
+		session_id = b""
+		while len(session_id) < MAX_SESSION_ID_LENGTH:
+			byte = await loop.sock_recv(connection, 1)
+			if not byte:
+				return None
+			if byte == b"\n":
+				return session_id.strip()
+			session_id += byte
+		return None
+
+
+	async def serve(self, listener):
+		stopping = asyncio.Event()
+		loop = asyncio.get_running_loop()
+		for signal_number in (signal.SIGINT, signal.SIGTERM):
+			loop.add_signal_handler(signal_number, stopping.set)
+
+		routing = loop.create_task(self.route(listener))
+		await stopping.wait()
+		routing.cancel()
+		listener.close()
+		self.stop_workers()
+
+
+	def stop_workers(self):
+		for channel in self.channels:
+			channel.close()
+		for pid in self.worker_pids:
+			os.waitpid(pid, 0)
+		self.channels = []
+		self.worker_pids = []
+
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="serve many sessions of one game from several forked worker processes")
+	argparser.add_argument("filename", type=str, help="name of input json file defining game")
+	argparser.add_argument("--text-input", action="store_true", help="use plain json text input file")
+	argparser.add_argument("--cache-dir", type=str, help="directory for caching the parsed game between runs")
+	argparser.add_argument("--compiled-input", action="store_true", help="use compiled world artifact input file")
+	argparser.add_argument("--host", type=str, default=DEFAULT_HOST, help="address to listen on")
+	argparser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+	argparser.add_argument("--unix-socket", type=str, metavar="PATH", help="listen on a unix socket instead of tcp")
+	argparser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes, defaulting to one per core")
+	argparser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, metavar="SECONDS",
+		help="disconnect sessions that send nothing for this long, and forget them as long after that")
+	argparser.add_argument("--undo-depth", type=int, default=0, metavar="TURNS", help="number of turns that may be undone in each session")
+
+	args = argparser.parse_args()
+
+	if args.compiled_input and args.cache_dir:
+		argparser.error("--cache-dir cannot be used with --compiled-input")
+
+	template = data_parser.DataParser().parse_template(args.filename, args.text_input, args.cache_dir, args.compiled_input)
+	host = PreforkHost(template, args.workers, args.idle_timeout, args.undo_depth)
+	listener = host.create_listener(args.host, args.port, args.unix_socket)
+	host.fork_workers(listener)
+	print("Serving on {0} with {1} workers.".format(listener.getsockname(), args.workers), flush=True)
+	asyncio.run(host.serve(listener))
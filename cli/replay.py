@@ -0,0 +1,79 @@
+import argparse
+import json
+import sys
+
+from adventure import data_parser
+from adventure.replay import TranscriptReplayer
+
+TRANSCRIPT_HEADER_FORMAT = "== {0}\n"
+STEP_FORMAT = "> {0}\n{1}\n"
+TIMED_STEP_FORMAT = "> {0}\n{1}\n[{2:.3f} ms]\n"
+SUMMARY_FORMAT = "{0}: {1} command(s) in {2:.3f} ms, mean {3:.3f} ms, slowest {4:.3f} ms"
+MS_PER_SECOND = 1000
+
+
+class ReplayWriter:
+
+	def __init__(self, output=sys.stdout, summary_output=sys.stderr, json_output=False, timings=False):
+		self.output = output
+		self.summary_output = summary_output
+		self.json_output = json_output
+		self.timings = timings
+
+
+	# Each transcript is written in one piece
+	def write(self, filename, steps):
+		if self.json_output:
+			content = "".join(self.format_json_step(filename, i, step) for i, step in enumerate(steps))
+		else:
+			content = TRANSCRIPT_HEADER_FORMAT.format(filename) + "".join(self.format_step(step) for step in steps)
+		self.output.write(content)
+
+
+	def format_step(self, step):
+		if self.timings:
+			return TIMED_STEP_FORMAT.format(step.line, step.response, step.elapsed * MS_PER_SECOND)
+		return STEP_FORMAT.format(step.line, step.response)
+
+
+	def format_json_step(self, filename, index, step):
+		return json.dumps({
+			"transcript" : filename,
+			"index" : index,
+			"input" : step.line,
+			"response" : step.response,
+			"elapsed" : step.elapsed,
+		}) + "\n"
+
+
+	def write_summary(self, filename, summary):
+		if self.summary_output:
+			self.summary_output.write(SUMMARY_FORMAT.format(filename, summary.commands, summary.total * MS_PER_SECOND,
+				summary.mean * MS_PER_SECOND, summary.slowest * MS_PER_SECOND) + "\n")
+
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="replay transcripts of player input against a game, without prompts")
+	argparser.add_argument("filename", type=str, help="name of input json file defining game")
+	argparser.add_argument("transcripts", type=str, nargs="+", help="files of player input, one command per line")
+	argparser.add_argument("--text-input", action="store_true", help="use plain json text input file")
+	argparser.add_argument("--cache-dir", type=str, help="directory for caching the parsed game between runs")
+	argparser.add_argument("--compiled-input", action="store_true", help="use compiled world artifact input file")
+	argparser.add_argument("--json", action="store_true", help="write one json record per command instead of text")
+	argparser.add_argument("--timings", action="store_true", help="include the time taken by each command in text output")
+	argparser.add_argument("--quiet", action="store_true", help="do not write a timing summary for each transcript")
+	argparser.add_argument("--undo-depth", type=int, default=0, metavar="TURNS", help="number of turns that may be undone in each transcript")
+
+	args = argparser.parse_args()
+
+	if args.compiled_input and args.cache_dir:
+		argparser.error("--cache-dir cannot be used with --compiled-input")
+
+	template = data_parser.DataParser().parse_template(args.filename, args.text_input, args.cache_dir, args.compiled_input)
+	replayer = TranscriptReplayer(template, args.undo_depth)
+	writer = ReplayWriter(json_output=args.json, timings=args.timings, summary_output=None if args.quiet else sys.stderr)
+
+	for transcript in args.transcripts:
+		steps = replayer.replay_file(transcript)
+		writer.write(transcript, steps)
+		writer.write_summary(transcript, replayer.summarize(steps))
@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import signal
+
+from adventure import data_parser
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8023
+DEFAULT_IDLE_TIMEOUT = 600
+ENCODING = "utf-8"
+PROMPT = "> "
+IDLE_RESPONSE = "You have been idle for too long. Goodbye."
+SHUTDOWN_RESPONSE = "The server is shutting down. Goodbye."
+ALREADY_CONNECTED_RESPONSE = "That session is already connected."
+LINE_TOO_LONG_RESPONSE = "That line is too long. Goodbye."
+
+
+# Hosts one game per connection, or per named session, on a single event loop
+class GameServer:
+
+	def __init__(self, template, idle_timeout=DEFAULT_IDLE_TIMEOUT, journal_depth=0):
+		self.template = template
+		self.idle_timeout = idle_timeout
+		self.journal_depth = journal_depth
+		self.server = None
+		self.closing = False
+		self.sessions = {}
+		self.connected_session_ids = set()
+		self.detached_games = {}
+		self.expiries = {}
+
+
+	async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+		self.server = await asyncio.start_server(self.handle_connection, host, port)
+
+
+	async def start_unix(self, path):
+		self.server = await asyncio.start_unix_server(self.handle_connection, path)
+
+
+	def get_address(self):
+		return self.server.sockets[0].getsockname()
+
+
+	async def handle_connection(self, reader, writer):
+		game = self.template.spawn(self.journal_depth)
+		await self.run_session(reader, writer, game, game.get_start_message())
+
+
+	async def handle_named_connection(self, reader, writer, session_id):
+		if session_id in self.connected_session_ids:
+			writer.write((ALREADY_CONNECTED_RESPONSE + "\n").encode(ENCODING))
+			writer.close()
+			return
+
+		expiry = self.expiries.pop(session_id, None)
+		if expiry:
+			expiry.cancel()
+
+		game = self.detached_games.pop(session_id, None)
+		start_message = ""
+		if not game:
+			game = self.template.spawn(self.journal_depth)
+			start_message = game.get_start_message()
+
+		self.connected_session_ids.add(session_id)
+		try:
+			hung_up = await self.run_session(reader, writer, game, start_message)
+		finally:
+			self.connected_session_ids.remove(session_id)
+
+		if hung_up and game.is_running():
+			self.detached_games[session_id] = game
+			self.expiries[session_id] = asyncio.get_running_loop().call_later(self.idle_timeout, self.expire, session_id)
+
+
+	def expire(self, session_id):
+		self.detached_games.pop(session_id, None)
+		self.expiries.pop(session_id, None)
+
+
+	# Returns whether the session ended because the client hung up
+	async def run_session(self, reader, writer, game, start_message):
+		self.sessions[writer] = asyncio.current_task()
+		hung_up = False
+
+		try:
+			await self.send(writer, start_message, True)
+			while game.is_running():
+				try:
+					request = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+				except asyncio.TimeoutError:
+					await self.send(writer, IDLE_RESPONSE, False)
+					break
+				# The rest of an overlong line cannot be told from the next, so the session ends
+				except (ValueError, asyncio.LimitOverrunError):
+					await self.send(writer, LINE_TOO_LONG_RESPONSE, False)
+					break
+
+				if not request:
+					hung_up = not self.closing
+					break
+
+				response = game.process_input(str(request, ENCODING, "replace")).rstrip()
+				await self.send(writer, response, game.is_running())
+		except ConnectionError:
+			hung_up = not self.closing
+		finally:
+			del self.sessions[writer]
+			writer.close()
+
+		return hung_up
+
+
+	async def send(self, writer, response, prompt):
+		if response:
+			writer.write((response + "\n").encode(ENCODING))
+		if prompt:
+			writer.write(PROMPT.encode(ENCODING))
+		await writer.drain()
+
+
+	async def close(self):
+		self.closing = True
+		if self.server:
+			self.server.close()
+		tasks = list(self.sessions.values())
+		for writer in list(self.sessions):
+			writer.write((SHUTDOWN_RESPONSE + "\n").encode(ENCODING))
+			writer.close()
+		await asyncio.gather(*tasks, return_exceptions=True)
+		for expiry in self.expiries.values():
+			expiry.cancel()
+		self.expiries = {}
+		self.detached_games = {}
+		if self.server:
+			await self.server.wait_closed()
+
+
+	async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None):
+		if unix_socket:
+			await self.start_unix(unix_socket)
+		else:
+			await self.start(host, port)
+		print("Serving on {0}.".format(self.get_address()))
+
+		stopping = asyncio.Event()
+		loop = asyncio.get_running_loop()
+		for signal_number in (signal.SIGINT, signal.SIGTERM):
+			loop.add_signal_handler(signal_number, stopping.set)
+
+		await stopping.wait()
+		await self.close()
+
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="serve many sessions of one game over a line-based socket protocol")
+	argparser.add_argument("filename", type=str, help="name of input json file defining game")
+	argparser.add_argument("--text-input", action="store_true", help="use plain json text input file")
+	argparser.add_argument("--cache-dir", type=str, help="directory for caching the parsed game between runs")
+	argparser.add_argument("--compiled-input", action="store_true", help="use compiled world artifact input file")
+	argparser.add_argument("--host", type=str, default=DEFAULT_HOST, help="address to listen on")
+	argparser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+	argparser.add_argument("--unix-socket", type=str, metavar="PATH", help="listen on a unix socket instead of tcp")
+	argparser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, metavar="SECONDS",
+		help="disconnect sessions that send nothing for this long")
+	argparser.add_argument("--undo-depth", type=int, default=0, metavar="TURNS", help="number of turns that may be undone in each session")
+
+	args = argparser.parse_args()
+
+	if args.compiled_input and args.cache_dir:
+		argparser.error("--cache-dir cannot be used with --compiled-input")
+
+	template = data_parser.DataParser().parse_template(args.filename, args.text_input, args.cache_dir, args.compiled_input)
+	server = GameServer(template, args.idle_timeout, args.undo_depth)
+	asyncio.run(server.serve(args.host, args.port, args.unix_socket))
@@ -0,0 +1,47 @@
+import argparse
+import io
+import unittest
+
+from adventure.benchmark import Regression
+from cli.benchmark import BenchmarkWriter, parse_size
+
+class TestBenchmarkWriter(unittest.TestCase):
+
+	def setUp(self):
+		self.output = io.StringIO()
+		self.writer = BenchmarkWriter(self.output)
+
+
+	def test_write_results(self):
+		results = {"sizes": {"20x200": {"decode.throughput": 1 << 21, "parse.seconds": 0.25, "parse.peak": 1 << 20,
+			"command.take.p50": 0.0005}}}
+
+		self.writer.write_results(results)
+
+		self.assertEqual("== 20x200\n"
+			"decode.throughput              2.0 MiB/s\n"
+			"parse.seconds                    0.250 s\n"
+			"parse.peak                       1.0 MiB\n"
+			"command.take.p50                0.500 ms\n", self.output.getvalue())
+
+
+	def test_write_regressions(self):
+		self.writer.write_regressions([Regression("20x200", "command.take.p50", 0.0005, 0.0006, 0.2)])
+
+		self.assertEqual("20x200 command.take.p50: 0.500 ms -> 0.600 ms (+20.0%)\n", self.output.getvalue())
+
+
+	def test_write_no_regressions(self):
+		self.writer.write_regressions([])
+
+		self.assertEqual("No regressions.\n", self.output.getvalue())
+
+
+	def test_parse_size(self):
+		self.assertEqual((20, 200), parse_size("20x200"))
+		with self.assertRaises(argparse.ArgumentTypeError):
+			parse_size("20")
+
+
+if __name__ == "__main__":
+	unittest.main()
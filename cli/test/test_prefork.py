@@ -0,0 +1,53 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import unittest
+from unittest.mock import Mock
+
+from adventure.test.fixtures import GAME_FILENAME
+from cli.prefork import PreforkHost
+
+class TestPreforkHost(unittest.TestCase):
+
+	ROOT_DIR = os.path.join(os.path.dirname(__file__), "..", "..")
+	def test_get_worker_index_stable(self):
+		host = PreforkHost(Mock(), 4)
+
+		indexes = [host.get_worker_index(session_id) for session_id in [b"alice", b"bob", b"carol", b"dave", b"erin"]]
+
+		self.assertTrue(all(0 <= index < 4 for index in indexes))
+		self.assertEqual(indexes, [host.get_worker_index(session_id) for session_id in [b"alice", b"bob", b"carol", b"dave", b"erin"]])
+
+
+	def test_serve(self):
+		process = subprocess.Popen(
+			[sys.executable, "-m", "cli.prefork", GAME_FILENAME, "--text-input", "--port", "0", "--workers", "2"],
+			cwd=TestPreforkHost.ROOT_DIR, stdout=subprocess.PIPE, text=True,
+		)
+		try:
+			port = int(process.stdout.readline().split(")")[0].split(", ")[1])
+
+			self.assertEqual("Welcome to the test game.\n> Taken.\n> ", self.converse(port, "alice", "take book"))
+			self.assertEqual("Welcome to the test game.\n> You are not carrying anything.\n> ", self.converse(port, "bob", "inventory"))
+			self.assertEqual("> You are carrying:\n\ta book\n> ", self.converse(port, "alice", "inventory"))
+		finally:
+			process.send_signal(signal.SIGINT)
+			process.wait(10)
+			process.stdout.close()
+
+		self.assertEqual(0, process.returncode)
+
+
+	def converse(self, port, session_id, line):
+		with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+			connection.sendall("{0}\n{1}\n".format(session_id, line).encode("utf-8"))
+			response = b""
+			while response.count(b"> ") < 2:
+				response += connection.recv(4096)
+		return str(response, "utf-8")
+
+
+if __name__ == "__main__":
+	unittest.main()
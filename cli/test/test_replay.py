@@ -0,0 +1,59 @@
+import io
+import json
+import unittest
+
+from adventure.replay import ReplayStep, ReplaySummary
+from cli.replay import ReplayWriter
+
+class TestReplayWriter(unittest.TestCase):
+
+	def setUp(self):
+		self.output = io.StringIO()
+		self.summary_output = io.StringIO()
+		self.steps = [ReplayStep("take book", "Taken.", 0.0005), ReplayStep("inventory", "You are carrying:\n\ta book", 0.00025)]
+
+
+	def test_write_text(self):
+		writer = ReplayWriter(self.output, self.summary_output)
+
+		writer.write("transcript.txt", self.steps)
+
+		self.assertEqual("== transcript.txt\n> take book\nTaken.\n> inventory\nYou are carrying:\n\ta book\n", self.output.getvalue())
+
+
+	def test_write_text_timings(self):
+		writer = ReplayWriter(self.output, self.summary_output, timings=True)
+
+		writer.write("transcript.txt", self.steps[:1])
+
+		self.assertEqual("== transcript.txt\n> take book\nTaken.\n[0.500 ms]\n", self.output.getvalue())
+
+
+	def test_write_json(self):
+		writer = ReplayWriter(self.output, self.summary_output, json_output=True)
+
+		writer.write("transcript.txt", self.steps)
+
+		records = [json.loads(line) for line in self.output.getvalue().splitlines()]
+		self.assertEqual([0, 1], [record["index"] for record in records])
+		self.assertEqual({"transcript" : "transcript.txt", "index" : 0, "input" : "take book", "response" : "Taken.", "elapsed" : 0.0005}, records[0])
+
+
+	def test_write_summary(self):
+		writer = ReplayWriter(self.output, self.summary_output)
+
+		writer.write_summary("transcript.txt", ReplaySummary(2, 0.00075, 0.000375, 0.0005))
+
+		self.assertEqual("transcript.txt: 2 command(s) in 0.750 ms, mean 0.375 ms, slowest 0.500 ms\n", self.summary_output.getvalue())
+
+
+	def test_write_summary_quiet(self):
+		writer = ReplayWriter(self.output, None)
+
+		writer.write_summary("transcript.txt", ReplaySummary(2, 0.00075, 0.000375, 0.0005))
+
+		self.assertEqual("", self.output.getvalue())
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,196 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+
+from adventure.data_parser import DataParser
+from adventure.test.fixtures import GAME_FILENAME
+from cli.server import GameServer
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+	async def asyncSetUp(self):
+		self.template = DataParser().parse_template(GAME_FILENAME, True)
+		self.server = GameServer(self.template, idle_timeout=5, journal_depth=2)
+		await self.server.start("127.0.0.1", 0)
+		self.connections = []
+
+
+	async def asyncTearDown(self):
+		for _, writer in self.connections:
+			writer.close()
+		await self.server.close()
+
+
+	async def connect(self):
+		host, port = self.server.get_address()
+		connection = await asyncio.open_connection(host, port)
+		self.connections.append(connection)
+		await self.read_response(connection)
+		return connection
+
+
+	async def read_response(self, connection):
+		reader, _ = connection
+		response = await asyncio.wait_for(reader.readuntil(b"> "), 5)
+		return str(response[:-2], "utf-8").rstrip("\n")
+
+
+	async def request(self, connection, line):
+		_, writer = connection
+		writer.write((line + "\n").encode("utf-8"))
+		await writer.drain()
+		return await self.read_response(connection)
+
+
+	async def test_start_message(self):
+		host, port = self.server.get_address()
+		reader, writer = await asyncio.open_connection(host, port)
+		self.connections.append((reader, writer))
+
+		response = await reader.readuntil(b"> ")
+
+		self.assertEqual(b"Welcome to the test game.\n> ", response)
+
+
+	async def test_separate_sessions(self):
+		connection = await self.connect()
+		other_connection = await self.connect()
+
+		self.assertEqual("Taken.", await self.request(connection, "take book"))
+		self.assertEqual("You are carrying:\n\ta book", await self.request(connection, "inventory"))
+		self.assertEqual("You are not carrying anything.", await self.request(other_connection, "inventory"))
+		self.assertEqual(2, len(self.server.sessions))
+
+
+	async def test_undo(self):
+		connection = await self.connect()
+
+		await self.request(connection, "take book")
+
+		self.assertEqual("Undone.", await self.request(connection, "undo"))
+		self.assertEqual("You are not carrying anything.", await self.request(connection, "inventory"))
+
+
+	async def test_quit(self):
+		reader, writer = await self.connect()
+
+		writer.write(b"quit\n")
+		await writer.drain()
+
+		self.assertEqual(b"OK.\n", await asyncio.wait_for(reader.read(), 5))
+
+
+	async def test_disconnect(self):
+		_, writer = await self.connect()
+
+		writer.close()
+		await writer.wait_closed()
+		await asyncio.sleep(0.01)
+
+		self.assertEqual({}, self.server.sessions)
+
+
+	async def test_idle_timeout(self):
+		self.server.idle_timeout = 0.01
+		reader, _ = await self.connect()
+
+		response = await asyncio.wait_for(reader.read(), 5)
+
+		self.assertEqual(b"You have been idle for too long. Goodbye.\n", response)
+		self.assertEqual({}, self.server.sessions)
+
+
+	async def test_line_too_long(self):
+		reader, writer = await self.connect()
+
+		writer.write(b"x" * 100000 + b"\n")
+		await writer.drain()
+
+		self.assertEqual(b"That line is too long. Goodbye.\n", await asyncio.wait_for(reader.read(), 5))
+		self.assertEqual({}, self.server.sessions)
+
+
+	async def test_close(self):
+		reader, _ = await self.connect()
+
+		await self.server.close()
+
+		self.assertEqual(b"The server is shutting down. Goodbye.\n", await asyncio.wait_for(reader.read(), 5))
+		self.assertEqual({}, self.server.sessions)
+
+
+	async def test_unix_socket(self):
+		await self.server.close()
+		with tempfile.TemporaryDirectory() as socket_dir:
+			path = os.path.join(socket_dir, "game.sock")
+			await self.server.start_unix(path)
+			reader, writer = await asyncio.open_unix_connection(path)
+			self.connections.append((reader, writer))
+
+			response = await reader.readuntil(b"> ")
+
+			self.assertEqual(b"Welcome to the test game.\n> ", response)
+
+
+	async def start_named_session(self, session_id):
+		client_socket, server_socket = socket.socketpair()
+		server_reader, server_writer = await asyncio.open_connection(sock=server_socket)
+		task = asyncio.create_task(self.server.handle_named_connection(server_reader, server_writer, session_id))
+		connection = await asyncio.open_connection(sock=client_socket)
+		self.connections.append(connection)
+		return connection, task
+
+
+	async def test_named_session_resumed(self):
+		connection, task = await self.start_named_session("alice")
+		await self.read_response(connection)
+		await self.request(connection, "take book")
+		connection[1].close()
+		await task
+
+		connection, _ = await self.start_named_session("alice")
+
+		self.assertEqual("", await self.read_response(connection))
+		self.assertEqual("You are carrying:\n\ta book", await self.request(connection, "inventory"))
+
+
+	async def test_named_session_separate(self):
+		connection, task = await self.start_named_session("alice")
+		await self.read_response(connection)
+		await self.request(connection, "take book")
+		connection[1].close()
+		await task
+
+		connection, _ = await self.start_named_session("bob")
+
+		self.assertEqual("Welcome to the test game.", await self.read_response(connection))
+		self.assertEqual("You are not carrying anything.", await self.request(connection, "inventory"))
+
+
+	async def test_named_session_already_connected(self):
+		connection, _ = await self.start_named_session("alice")
+		await self.read_response(connection)
+
+		(reader, _), task = await self.start_named_session("alice")
+		await task
+
+		self.assertEqual(b"That session is already connected.\n", await asyncio.wait_for(reader.read(), 5))
+
+
+	async def test_named_session_expired(self):
+		self.server.idle_timeout = 0.01
+		connection, task = await self.start_named_session("alice")
+		await self.read_response(connection)
+		connection[1].close()
+		await task
+
+		await asyncio.sleep(0.05)
+
+		self.assertEqual({}, self.server.detached_games)
+		self.assertEqual({}, self.server.expiries)
+
+
+if __name__ == "__main__":
+	unittest.main()
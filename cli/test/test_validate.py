@@ -0,0 +1,87 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from adventure.test.fixtures import GAME_FILENAME
+from cli.validate import BatchValidator, EXIT_INVALID, EXIT_VALID, REPORT_SUFFIX
+
+class TestBatchValidator(unittest.TestCase):
+
+	def setUp(self):
+		self.input_dir = tempfile.mkdtemp()
+		self.validator = BatchValidator(text_input=True, jobs=2)
+		self.output = io.StringIO()
+
+		with open(GAME_FILENAME) as game_file:
+			self.game_content = json.load(game_file)
+
+
+	def tearDown(self):
+		self.output.close()
+		shutil.rmtree(self.input_dir)
+
+
+	def write_game(self, name, content):
+		filename = os.path.join(self.input_dir, name)
+		with open(filename, "w") as game_file:
+			game_file.write(content)
+		return filename
+
+
+	def read_report(self, filename):
+		with open(filename + REPORT_SUFFIX) as report_file:
+			return [json.loads(line) for line in report_file]
+
+
+	def test_find_files(self):
+		valid_filename = self.write_game("a.json", "{}")
+		other_filename = self.write_game("b.txt", "{}")
+		self.write_game("a.json" + REPORT_SUFFIX, "")
+
+		self.assertEqual([valid_filename], self.validator.find_files([self.input_dir], "*.json"))
+		self.assertEqual([valid_filename, other_filename], self.validator.find_files([self.input_dir], "*"))
+
+
+	def test_validate_valid(self):
+		filename = self.write_game("valid.json", json.dumps(self.game_content))
+
+		summaries = self.validator.validate([filename], self.output)
+
+		self.assertEqual([(0, 0)], summaries)
+		self.assertEqual([], self.read_report(filename))
+		self.assertEqual(EXIT_VALID, self.validator.get_exit_code(summaries))
+
+
+	def test_validate_invalid(self):
+		self.game_content["inventories"].append(dict(self.game_content["inventories"][0]))
+		invalid_filename = self.write_game("invalid.json", json.dumps(self.game_content))
+		unparseable_filename = self.write_game("unparseable.json", "{")
+
+		summaries = self.validator.validate([invalid_filename, unparseable_filename], self.output)
+
+		self.assertEqual(EXIT_INVALID, self.validator.get_exit_code(summaries))
+		invalid_report = self.read_report(invalid_filename)
+		self.assertTrue({"severity": "ERROR", "key": "INVENTORY_SHARED_ID", "args": [0],
+			"message": "Multiple inventories found with id 0."} in invalid_report)
+		unparseable_report = self.read_report(unparseable_filename)
+		self.assertEqual("FILE_UNPARSEABLE", unparseable_report[0]["key"])
+		self.assertEqual(2, len(self.output.getvalue().splitlines()))
+
+
+	def test_get_exit_code_warnings(self):
+		self.assertEqual(EXIT_VALID, self.validator.get_exit_code([(0, 2)]))
+		self.assertEqual(EXIT_INVALID, self.validator.get_exit_code([(0, 2)], fail_on_warnings=True))
+
+
+	def test_get_report_path_report_dir(self):
+		validator = BatchValidator(report_dir="reports")
+
+		self.assertEqual(os.path.join("reports", "worlds__a.json" + REPORT_SUFFIX),
+			validator.get_report_path(os.path.join("worlds", "a.json")))
+
+
+if __name__ == "__main__":
+	unittest.main()
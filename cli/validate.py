@@ -0,0 +1,108 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import fnmatch
+import functools
+import json
+import os
+import sys
+
+from adventure import data_parser
+from adventure.validation import Message, Severity
+from adventure.validation_stamp import ValidationStamp
+
+REPORT_SUFFIX = ".validation.jsonl"
+SKIPPED_SUFFIXES = (REPORT_SUFFIX, ValidationStamp.FILENAME_SUFFIX)
+SUMMARY_FORMAT = "{0}: {1} error(s), {2} warning(s)"
+EXIT_VALID = 0
+EXIT_INVALID = 1
+
+
+def validate_file(filename, text_input, compiled_input):
+	try:
+		validation = data_parser.DataParser().validate(filename, text_input, compiled_input)
+	except Exception as e:
+		validation = [Message(Message.FILE_UNPARSEABLE, ("{0}: {1}".format(type(e).__name__, e),))]
+	return filename, [message.to_json() for message in validation]
+
+
+class BatchValidator:
+
+	def __init__(self, text_input=False, compiled_input=False, jobs=None, report_dir=None):
+		self.text_input = text_input
+		self.compiled_input = compiled_input
+		self.jobs = jobs
+		self.report_dir = report_dir
+
+
+	def find_files(self, paths, pattern):
+		filenames = []
+		for path in paths:
+			if os.path.isdir(path):
+				for directory, subdirectories, directory_filenames in os.walk(path):
+					subdirectories.sort()
+					for filename in sorted(fnmatch.filter(directory_filenames, pattern)):
+						if not filename.endswith(SKIPPED_SUFFIXES):
+							filenames.append(os.path.join(directory, filename))
+			else:
+				filenames.append(path)
+		return filenames
+
+
+	def validate(self, filenames, output=sys.stdout):
+		validate_one = functools.partial(validate_file, text_input=self.text_input, compiled_input=self.compiled_input)
+		summaries = []
+
+		with ProcessPoolExecutor(self.jobs) as executor:
+			for filename, messages in executor.map(validate_one, filenames):
+				self.write_report(filename, messages)
+				summary = self.summarize(messages)
+				output.write(SUMMARY_FORMAT.format(filename, *summary) + "\n")
+				summaries.append(summary)
+
+		return summaries
+
+
+	def get_report_path(self, filename):
+		if not self.report_dir:
+			return filename + REPORT_SUFFIX
+		report_name = os.path.relpath(filename).replace(os.sep, "__")
+		return os.path.join(self.report_dir, report_name + REPORT_SUFFIX)
+
+
+	def write_report(self, filename, messages):
+		with open(self.get_report_path(filename), "w") as report_file:
+			for message in messages:
+				report_file.write(json.dumps(message, default=str) + "\n")
+
+
+	def summarize(self, messages):
+		errors = sum(1 for message in messages if message["severity"] == Severity.ERROR.value)
+		return errors, len(messages) - errors
+
+
+	def get_exit_code(self, summaries, fail_on_warnings=False):
+		for errors, warnings in summaries:
+			if errors or (fail_on_warnings and warnings):
+				return EXIT_INVALID
+		return EXIT_VALID
+
+
+if __name__ == '__main__':
+	argparser = argparse.ArgumentParser(description="validate many game files in parallel")
+	argparser.add_argument("paths", type=str, nargs="+", help="game files, or directories to search for game files")
+	argparser.add_argument("--text-input", action="store_true", help="use plain json text input files")
+	argparser.add_argument("--compiled-input", action="store_true", help="use compiled world artifact input files")
+	argparser.add_argument("--pattern", type=str, default="*", help="filename pattern to match when searching directories")
+	argparser.add_argument("--jobs", type=int, help="number of worker processes, defaulting to one per core")
+	argparser.add_argument("--report-dir", type=str, help="directory for reports, instead of beside each game file")
+	argparser.add_argument("--fail-on-warnings", action="store_true", help="exit with failure when any warnings are found")
+
+	args = argparser.parse_args()
+
+	if args.report_dir:
+		os.makedirs(args.report_dir, exist_ok=True)
+
+	validator = BatchValidator(args.text_input, args.compiled_input, args.jobs, args.report_dir)
+	filenames = validator.find_files(args.paths, args.pattern)
+	summaries = validator.validate(filenames)
+	sys.exit(validator.get_exit_code(summaries, args.fail_on_warnings))